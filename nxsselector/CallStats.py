@@ -0,0 +1,215 @@
+#!/usr/bin/env python
+#   This file is part of nexdatas - Tango Server for NeXus data writer
+#
+#    Copyright (C) 2014-2017 DESY, Jan Kotanski <jkotan@mail.desy.de>
+#
+#    nexdatas is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    nexdatas is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    You should have received a copy of the GNU General Public License
+#    along with nexdatas.  If not, see <http://www.gnu.org/licenses/>.
+# timing statistics of selector server calls
+
+""" timing statistics of selector server calls """
+
+import sys
+import json
+import time
+import threading
+import collections
+
+import logging
+#: (:obj:`logging.Logger`) logger object
+logger = logging.getLogger(__name__)
+
+if sys.version_info > (3,):
+    unicode = str
+
+
+class CallRecord(object):
+    """ timing statistics of one call name
+    """
+
+    __slots__ = ["count", "errors", "total", "min", "max", "payload",
+                 "samples"]
+
+    def __init__(self, samples=1000):
+        """ constructor
+
+        :param samples: number of the last durations kept for percentiles
+        :type samples: :obj:`int`
+        """
+        #: (:obj:`int`) number of calls
+        self.count = 0
+        #: (:obj:`int`) number of failed calls
+        self.errors = 0
+        #: (:obj:`float`) total duration in seconds
+        self.total = 0.0
+        #: (:obj:`float`) minimal duration in seconds
+        self.min = None
+        #: (:obj:`float`) maximal duration in seconds
+        self.max = None
+        #: (:obj:`int`) total payload size in characters
+        self.payload = 0
+        #: (:class:`collections.deque` <:obj:`float`>) last durations
+        self.samples = collections.deque(maxlen=samples)
+
+    def add(self, duration, payload=0, error=False):
+        """ adds a call
+
+        :param duration: call duration in seconds
+        :type duration: :obj:`float`
+        :param payload: payload size in characters
+        :type payload: :obj:`int`
+        :param error: if call failed
+        :type error: :obj:`bool`
+        """
+        self.count += 1
+        if error:
+            self.errors += 1
+        self.total += duration
+        self.payload += payload
+        if self.min is None or duration < self.min:
+            self.min = duration
+        if self.max is None or duration > self.max:
+            self.max = duration
+        self.samples.append(duration)
+
+    def summary(self):
+        """ provides the call statistics
+
+        :returns: (name, value) dictionary with count, errors, total,
+                  mean, min, max, p50, p90, p99 durations and payload
+        :rtype: :obj:`dict` <:obj:`str`, `any`>
+        """
+        samples = sorted(self.samples)
+        summary = {
+            "count": self.count,
+            "errors": self.errors,
+            "total": self.total,
+            "mean": self.total / self.count if self.count else 0.0,
+            "min": self.min,
+            "max": self.max,
+            "payload": self.payload,
+        }
+        for percent in (50, 90, 99):
+            summary["p%s" % percent] = samples[
+                min(len(samples) - 1, len(samples) * percent // 100)] \
+                if samples else None
+        return summary
+
+
+class CallStats(object):
+    """ timing statistics of selector server calls grouped by call names
+    """
+
+    def __init__(self, samples=1000):
+        """ constructor
+
+        :param samples: number of the last durations kept for percentiles
+        :type samples: :obj:`int`
+        """
+        #: (:obj:`bool`) if calls are recorded
+        self.enabled = True
+        #: (:obj:`int`) number of the last durations kept for percentiles
+        self.samples = samples
+        #: (:class:`threading.Lock`) statistics lock
+        self.__lock = threading.Lock()
+        #: (:obj:`dict` <:obj:`str`, :class:`CallRecord`>) call records
+        self.__records = {}
+
+    @classmethod
+    def size(cls, value):
+        """ estimates payload size of a transferred value
+
+        :param value: transferred value
+        :type value: `any`
+        :returns: payload size in characters
+        :rtype: :obj:`int`
+        """
+        if isinstance(value, (str, bytes, unicode)):
+            return len(value)
+        elif isinstance(value, (list, tuple)):
+            return sum(cls.size(item) for item in value)
+        elif "value" in getattr(value, "__dict__", {}) or \
+                hasattr(type(value), "value"):
+            return cls.size(value.value)
+        return 0
+
+    def add(self, name, duration, payload=0, error=False):
+        """ records a call
+
+        :param name: call name
+        :type name: :obj:`str`
+        :param duration: call duration in seconds
+        :type duration: :obj:`float`
+        :param payload: payload size in characters
+        :type payload: :obj:`int`
+        :param error: if call failed
+        :type error: :obj:`bool`
+        """
+        with self.__lock:
+            if name not in self.__records:
+                self.__records[name] = CallRecord(self.samples)
+            self.__records[name].add(duration, payload, error)
+
+    def call(self, name, method, *args):
+        """ calls the method and records its duration and payload
+
+        :param name: call name
+        :type name: :obj:`str`
+        :param method: called method
+        :type method: :meth:`callable`
+        :param args: method arguments
+        :type args: :obj:`list` <`any`>
+        :returns: method result
+        :rtype: `any`
+        """
+        if not self.enabled:
+            return method(*args)
+        start = time.time()
+        try:
+            result = method(*args)
+        except Exception:
+            self.add(name, time.time() - start, self.size(args), True)
+            raise
+        self.add(name, time.time() - start,
+                 self.size(args) + self.size(result))
+        return result
+
+    def clear(self):
+        """ drops all records
+        """
+        with self.__lock:
+            self.__records = {}
+
+    def summary(self):
+        """ provides statistics of all call names
+
+        :returns: (call name, call statistics) dictionary
+        :rtype: :obj:`dict` <:obj:`str`, :obj:`dict` <:obj:`str`, `any`>>
+        """
+        with self.__lock:
+            return dict((name, rec.summary())
+                        for name, rec in self.__records.items())
+
+    def dump(self, filename):
+        """ writes statistics of all call names into a JSON file
+
+        :param filename: file name
+        :type filename: :obj:`str`
+        """
+        with open(filename, "w") as fl:
+            json.dump(self.summary(), fl, indent=1, sort_keys=True)
+        logger.debug("call statistics written into %s" % filename)
+
+
+#: (:class:`CallStats`) process-wide statistics of selector server calls
+stats = CallStats()
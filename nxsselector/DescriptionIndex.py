@@ -0,0 +1,287 @@
+#!/usr/bin/env python
+#   This file is part of nexdatas - Tango Server for NeXus data writer
+#
+#    Copyright (C) 2014-2017 DESY, Jan Kotanski <jkotan@mail.desy.de>
+#
+#    nexdatas is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    nexdatas is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    You should have received a copy of the GNU General Public License
+#    along with nexdatas.  If not, see <http://www.gnu.org/licenses/>.
+# index of component description
+
+""" inverted index of component description """
+
+import json
+
+import logging
+#: (:obj:`logging.Logger`) logger object
+logger = logging.getLogger(__name__)
+
+
+class DataSourceRecord(object):
+    """ parsed datasource description
+    """
+
+    __slots__ = ["dsname", "dstype", "record"]
+
+    def __init__(self, dsname, dstype, record=None):
+        """ constructor
+
+        :param dsname: datasource name
+        :type dsname: :obj:`str`
+        :param dstype: datasource type
+        :type dstype: :obj:`str`
+        :param record: datasource record
+        :type record: :obj:`str`
+        """
+        #: (:obj:`str`) datasource name
+        self.dsname = dsname
+        #: (:obj:`str`) datasource type
+        self.dstype = dstype
+        #: (:obj:`str`) datasource record
+        self.record = record
+
+    @classmethod
+    def fromJSON(cls, jdsg):
+        """ creates datasource record from its JSON description
+
+        :param jdsg: JSON datasource description
+        :type jdsg: :obj:`str`
+        :returns: datasource record or None for invalid description
+        :rtype: :class:`DataSourceRecord`
+        """
+        dsg = json.loads(jdsg)
+        if isinstance(dsg, dict):
+            return cls(dsg.get('dsname'), dsg.get('dstype'),
+                       dsg.get('record'))
+
+    @classmethod
+    def byType(cls, records):
+        """ groups datasource records by their types
+
+        :param records: datasource records
+        :type records: :obj:`list` <:class:`DataSourceRecord`>
+        :returns: (datasource type, datasource names) dictionary
+        :rtype: :obj:`dict` <:obj:`str`, :obj:`list` <:obj:`str`>>
+        """
+        types = {}
+        for rec in records:
+            if rec.dstype not in types:
+                types[rec.dstype] = []
+            types[rec.dstype].append(rec.dsname)
+        return types
+
+
+class DescriptionIndex(object):
+    """ inverted index of component description
+    """
+
+    def __init__(self, description=None):
+        """ constructor
+
+        :param description: element description
+        :type description: [:obj:`dict` <:obj:`str`, :obj:`dict` \
+                <:obj:`str`, :obj:`list` <(:obj:`str`, :obj:`str`, \
+                :obj:`str`, :obj:`str`, :obj:`list` <:obj:`int`>)> > > ]
+        """
+        #: (:obj:`dict` <:obj:`str`, :obj:`list` <:obj:`str`>>) \
+        #:    component step datasources
+        self.stepsources = {}
+        #: (:obj:`dict` <:obj:`str`, :obj:`list` <:obj:`str`>>) \
+        #:    component description (non-step) datasources
+        self.descsources = {}
+        #: (:obj:`dict` <:obj:`str`, :obj:`list` <:obj:`str`>>) \
+        #:    components selecting step datasources in description order
+        self.owners = {}
+        #: (:obj:`dict` <:obj:`str`, :obj:`list` <:obj:`str`>>) \
+        #:    step datasources selected by components
+        self.ownsources = {}
+        #: (:obj:`list` <(:obj:`str`, :obj:`list` <:obj:`str`>)>) \
+        #:    (component, step datasources without the component itself)
+        #:    in description order
+        self.occurrences = []
+        #: (:obj:`list` <(:obj:`str`, :obj:`list` \
+        #:    <(:obj:`str`, :obj:`str`)>)>) (component, (datasource, \
+        #:    client record name)) in description order
+        self.clients = []
+        #: (:obj:`list` <:obj:`str`>) components with step datasources
+        self.stepcomponents = []
+        #: (:obj:`dict` <:obj:`str`, :obj:`str`>) \
+        #:    space separated step datasources of components
+        self.__scantexts = {}
+        #: (:obj:`dict` <:obj:`str`, :obj:`str`>) \
+        #:    space separated description datasources of components
+        self.__desctexts = {}
+        if description:
+            self.build(description)
+
+    def build(self, description):
+        """ builds the index
+
+        :param description: element description
+        :type description: [:obj:`dict` <:obj:`str`, :obj:`dict` \
+                <:obj:`str`, :obj:`list` <(:obj:`str`, :obj:`str`, \
+                :obj:`str`, :obj:`str`, :obj:`list` <:obj:`int`>)> > > ]
+        """
+        steps = {}
+        descs = {}
+        self.owners = {}
+        self.occurrences = []
+        self.clients = []
+        for cpg in description or []:
+            for cp, dss in cpg.items():
+                if not isinstance(dss, dict):
+                    continue
+                if cp not in steps:
+                    steps[cp] = set()
+                    descs[cp] = set()
+                odss = []
+                clients = []
+                for ds, values in dss.items():
+                    step = False
+                    for vl in values:
+                        if len(vl) > 0 and vl[0] == 'STEP':
+                            step = True
+                        else:
+                            descs[cp].add(ds)
+                        if len(vl) > 1 and vl[1] == 'CLIENT':
+                            clients.append((ds, vl[2]))
+                    if step:
+                        steps[cp].add(ds)
+                        if ds != cp:
+                            odss.append(ds)
+                            if ds not in self.owners:
+                                self.owners[ds] = []
+                            self.owners[ds].append(cp)
+                self.occurrences.append((cp, odss))
+                if clients:
+                    self.clients.append((cp, clients))
+        self.stepsources = dict(
+            (cp, sorted(dss)) for cp, dss in steps.items())
+        self.descsources = dict(
+            (cp, sorted(dss)) for cp, dss in descs.items())
+        self.ownsources = dict(
+            (cp, sorted(dss - set([cp]))) for cp, dss in steps.items())
+        self.stepcomponents = [cp for cp, dss in steps.items() if dss]
+        self.__scantexts = dict(
+            (cp, " ".join([str(c) for c in dss]))
+            for cp, dss in self.stepsources.items() if dss)
+        self.__desctexts = dict(
+            (cp, " ".join([str(c) for c in dss]))
+            for cp, dss in self.descsources.items() if dss)
+        logger.debug("description index: %s components" % len(steps))
+
+    def scanSources(self, name):
+        """ provides component scan datasources
+
+        :param name: component name
+        :type name: :obj:`str`
+        :returns: string list of scan datasources separated by spaces
+        :rtype: :obj:`str`
+        """
+        return self.__scantexts.get(name)
+
+    def descSources(self, name):
+        """ provides component description datasources
+
+        :param name: component name
+        :type name: :obj:`str`
+        :returns: string list of description datasources separated by spaces
+        :rtype: :obj:`str`
+        """
+        return self.__desctexts.get(name)
+
+    def disableDataSources(self, selected):
+        """ provides step datasources selected by the given components
+
+        :param selected: selected components
+        :type selected: :obj:`set` <:obj:`str`>
+        :returns: (datasource, selecting component) dictionary
+        :rtype: :obj:`dict` <:obj:`str`, :obj:`str`>
+        """
+        dds = {}
+        for cp, dss in self.occurrences:
+            if cp in selected:
+                for ds in dss:
+                    dds[ds] = cp
+        return dds
+
+    def clientRecords(self, selected):
+        """ provides client record names of the given components
+
+        :param selected: selected components
+        :type selected: :obj:`set` <:obj:`str`>
+        :returns: (datasource, client record name) dictionary
+        :rtype: :obj:`dict` <:obj:`str`, :obj:`str`>
+        """
+        dds = {}
+        for cp, records in self.clients:
+            if cp in selected:
+                dds.update(records)
+        return dds
+
+
+class DisabledDataSources(object):
+    """ incrementally maintained (datasource, selecting component) map
+    """
+
+    def __init__(self, index):
+        """ constructor
+
+        :param index: description index
+        :type index: :class:`DescriptionIndex`
+        """
+        #: (:class:`DescriptionIndex`) description index
+        self.__index = index
+        #: (:obj:`set` <:obj:`str`>) selected components
+        self.__selected = set()
+        #: (:obj:`dict` <:obj:`str`, :obj:`str`>) \
+        #:    (datasource, selecting component) dictionary
+        self.__dds = {}
+
+    def reset(self, selected):
+        """ recomputes the whole map
+
+        :param selected: selected components
+        :type selected: :obj:`set` <:obj:`str`>
+        """
+        self.__selected = set(selected)
+        self.__dds = self.__index.disableDataSources(self.__selected)
+
+    def update(self, name, status):
+        """ updates datasources of the checked or unchecked component
+
+        :param name: component name
+        :type name: :obj:`str`
+        :param status: if component is selected
+        :type status: :obj:`bool`
+        """
+        if status == (name in self.__selected):
+            return
+        if status:
+            self.__selected.add(name)
+        else:
+            self.__selected.discard(name)
+        for ds in self.__index.ownsources.get(name, []):
+            for cp in reversed(self.__index.owners[ds]):
+                if cp in self.__selected:
+                    self.__dds[ds] = cp
+                    break
+            else:
+                self.__dds.pop(ds, None)
+
+    def datasources(self):
+        """ provides a copy of the map
+
+        :returns: (datasource, selecting component) dictionary
+        :rtype: :obj:`dict` <:obj:`str`, :obj:`str`>
+        """
+        return dict(self.__dds)
@@ -25,7 +25,6 @@ try:
 except Exception:
     from taurus.qt import Qt
 
-from .Element import CPElement
 from .ElementModel import ElementModel
 from .Views import CheckerView
 from .DynamicTools import DynamicTools
@@ -121,8 +120,8 @@ class Descriptions(Qt.QObject):
         self.agroup = []
         for cp in self.state.acpgroup.keys():
             self.agroup.append(
-                CPElement(cp, self.state,
-                          group=self.state.acpgroup))
+                self.state.elements.component(
+                    cp, self.state.acpgroup, "acpgroup"))
 
         self.mgroup = []
         mcpgroup = {}
@@ -130,13 +129,13 @@ class Descriptions(Qt.QObject):
             mcpgroup[cp] = True
         for cp in mcpgroup.keys():
             self.mgroup.append(
-                CPElement(cp, self.state, group=mcpgroup))
+                self.state.elements.component(cp, mcpgroup, "mcpgroup"))
 
         self.igroup = []
         for ds in self.state.idsgroup.keys():
             self.igroup.append(
-                CPElement(ds, self.state,
-                          group=self.state.idsgroup))
+                self.state.elements.component(
+                    ds, self.state.idsgroup, "idsgroup"))
 
     def __clearFrames(self):
         """ clears component frames
@@ -27,7 +27,7 @@ try:
 except Exception:
     from taurus.qt import Qt
 
-from .Element import DSElement, CPElement, CP, DS
+from .Element import CP, DS
 from .ElementModel import ElementModel
 from .Frames import Frames
 from .DynamicTools import DynamicTools
@@ -144,11 +144,11 @@ class Detectors(Qt.QObject):
                     for felem in filtered:
                         if felem in self.state.avcplist:
                             group.append(
-                                CPElement(felem, self.state))
+                                self.state.elements.component(felem))
                             ucp.add(felem)
                         else:
                             group.append(
-                                DSElement(felem, self.state))
+                                self.state.elements.datasource(felem))
                             uds.add(felem)
                 if group:
                     if int(k) not in self.groups:
@@ -160,10 +160,12 @@ class Detectors(Qt.QObject):
                 if DS not in self.groups:
                     self.groups[DS] = []
                 if ds in self.state.avcplist:
-                    self.groups[DS].append(CPElement(ds, self.state))
+                    self.groups[DS].append(
+                        self.state.elements.component(ds))
                     ucp.add(ds)
                 else:
-                    self.groups[DS].append(DSElement(ds, self.state))
+                    self.groups[DS].append(
+                        self.state.elements.datasource(ds))
                     uds.add(ds)
         for cp in self.state.cpgroup.keys():
             if cp not in ucp and cp not in uds \
@@ -171,7 +173,8 @@ class Detectors(Qt.QObject):
                     and cp not in self.state.acplist:
                 if CP not in self.groups:
                     self.groups[CP] = []
-                self.groups[CP].append(CPElement(cp, self.state))
+                self.groups[CP].append(
+                    self.state.elements.component(cp))
 
     def __availableGroups(self):
         """ provides a set of Frames with available groups
@@ -31,6 +31,8 @@ class Element(object):
     """ element class
     """
 
+    __slots__ = ["name", "eltype", "state"]
+
     def __init__(self, name, eltype, state):
         """ constructor
 
@@ -147,6 +149,8 @@ class GElement(Element):
     """ group element class
     """
 
+    __slots__ = ["group"]
+
     def __init__(self, name, eltype, state, dct):
         """ constructor
 
@@ -188,6 +192,8 @@ class DSElement(Element):
     """ datasource element class
     """
 
+    __slots__ = []
+
     def __init__(self, name, state):
         """ constructor
 
@@ -271,6 +277,8 @@ class CPElement(Element):
     """ datasource element class
     """
 
+    __slots__ = ["group"]
+
     def __init__(self, name, state, group=None):
         """ constructor
 
@@ -282,6 +290,8 @@ class CPElement(Element):
         :type group: :obj:`dict` <:obj:`str`, :obj:`bool` or `None`>
         """
         super(CPElement, self).__init__(name, CP, state)
+        #: (:obj:`dict` <:obj:`str`, :obj:`bool` or `None`> ) \
+        #:     element selection group
         self.group = group
 
     def _getEnable(self):
@@ -322,7 +332,7 @@ class CPElement(Element):
         """
         self.state.ddsdirty = True
         if not status:
-            dds = self.state.ddsdict
+            dds = dict(self.state.ddsdict)
         self.state.ddsdirty = True
         if not self.group:
             ds = self.state.dsgroup
@@ -440,3 +450,103 @@ class CPElement(Element):
                         if dd in dc.keys():
                             dc[dd] = True
                         ds[dd] = True
+
+
+class ElementRegistry(object):
+    """ registry of elements of one server state which are reused
+        by subsequent resets of the views
+    """
+
+    def __init__(self, state):
+        """ constructor
+
+        :param state: server state
+        :type state: :class:`nxsselector.ServerState.ServerState`
+        """
+        #: (:class:`nxsselector.ServerState.ServerState`) server state
+        self.state = state
+        #: (:obj:`int`) number of reused elements
+        self.hits = 0
+        #: (:obj:`int`) number of created elements
+        self.misses = 0
+        #: (:obj:`dict` <(:obj:`type`, :obj:`str`, :obj:`int`, :obj:`str`), \
+        #:    :class:`Element`>) (class, name, type, group label) -> element
+        self.__elements = {}
+
+    def __len__(self):
+        return len(self.__elements)
+
+    def __element(self, key, create, group=None):
+        """ provides registered element or creates it
+
+        :param key: (class, name, type, group label) element key
+        :type key: (:obj:`type`, :obj:`str`, :obj:`int`, :obj:`str`)
+        :param create: function creating the element
+        :type create: :meth:`callable`
+        :param group: element selection group
+        :type group: :obj:`dict` <:obj:`str`, :obj:`bool` or `None`>
+        :returns: element
+        :rtype: :class:`Element`
+        """
+        element = self.__elements.get(key)
+        if element is None:
+            self.misses += 1
+            element = self.__elements[key] = create()
+        else:
+            self.hits += 1
+            if key[3] is not None:
+                element.group = group
+        return element
+
+    def datasource(self, name):
+        """ provides datasource element
+
+        :param name: element name
+        :type name: :obj:`str`
+        :returns: datasource element
+        :rtype: :class:`DSElement`
+        """
+        return self.__element(
+            (DSElement, name, DS, None),
+            lambda: DSElement(name, self.state))
+
+    def component(self, name, group=None, label=None):
+        """ provides component element
+
+        :param name: element name
+        :type name: :obj:`str`
+        :param group: element selection group
+        :type group: :obj:`dict` <:obj:`str`, :obj:`bool` or `None`>
+        :param label: group label distinguishing elements
+                      of different selection groups
+        :type label: :obj:`str`
+        :returns: component element
+        :rtype: :class:`CPElement`
+        """
+        return self.__element(
+            (CPElement, name, CP, label),
+            lambda: CPElement(name, self.state, group=group), group)
+
+    def member(self, name, eltype, group, label):
+        """ provides group element
+
+        :param name: element name
+        :type name: :obj:`str`
+        :param eltype: element type, i.e. DS=0 or CP=1
+        :type eltype: :obj:`int`
+        :param group: element selection group
+        :type group: :obj:`dict` <:obj:`str`, :obj:`bool` or `None`>
+        :param label: group label distinguishing elements
+                      of different selection groups
+        :type label: :obj:`str`
+        :returns: group element
+        :rtype: :class:`GElement`
+        """
+        return self.__element(
+            (GElement, name, eltype, label),
+            lambda: GElement(name, eltype, self.state, group), group)
+
+    def clear(self):
+        """ removes all elements
+        """
+        self.__elements = {}
@@ -37,6 +37,9 @@ NAME = range(1)
 #: (:obj:`list` <:obj:`str` > ) synchronization text labels
 PROPTEXT = {"synchronization": ["Trigger", "Gate", "Start"]}
 
+#: (:obj:`int`) model role of element properties as a dictionary
+PROPERTIESROLE = Qt.Qt.UserRole + 1
+
 
 class ElementModel(Qt.QAbstractTableModel):
     """ element model
@@ -68,9 +71,51 @@ class ElementModel(Qt.QAbstractTableModel):
         #: (:obj:`list` <:obj:`str`>) headers
         self.headers = ["Element", "Label", "Display",
                         "Scans", "Contains", "Properties"]
+        #: (:obj:`dict` <(:obj:`int`, :obj:`bool`), \
+        #:    (`any`, :obj:`dict` <`any`, `any`>)>) (row, display column) \
+        #:    -> (version, ((column, role), cell value) dictionary)
+        self.__cache = {}
 
         if group:
             self.group = sorted(group, key=lambda x: x.name, reverse=False)
+        self.datachanged.connect(self.__invalidateRows)
+
+    @Qt.pyqtSlot(Qt.QModelIndex, Qt.QModelIndex)
+    def __invalidateRows(self, first, last):
+        """ drops cached cell values of the changed rows
+
+        :param first: first changed element index
+        :type first: :class:`taurus.qt.Qt.QModelIndex`
+        :param last: last changed element index
+        :type last: :class:`taurus.qt.Qt.QModelIndex`
+        """
+        for row in range(min(first.row(), last.row()),
+                         max(first.row(), last.row()) + 1):
+            self.__cache.pop((row, False), None)
+            self.__cache.pop((row, True), None)
+
+    def __rowCache(self, row, column):
+        """ provides cached cell values of the row valid for the current
+            server state version and model settings. Cells of the display
+            column depend also on the display version.
+
+        :param row: element row
+        :type row: :obj:`int`
+        :param column: element column
+        :type column: :obj:`int`
+        :returns: ((column, role), cell value) dictionary
+        :rtype: :obj:`dict` <`any`, `any`>
+        """
+        state = self.group[row].state
+        display = column == 2
+        version = (getattr(state, "stateversion", None),
+                   getattr(state, "displayversion", None) if display else None,
+                   self.enable, self.disEnable, self.autoEnable)
+        entry = self.__cache.get((row, display))
+        if entry is None or entry[0] != version:
+            entry = (version, {})
+            self.__cache[(row, display)] = entry
+        return entry[1]
 
     def rowCount(self, _=Qt.QModelIndex()):
         """ provides number of model rows
@@ -144,19 +189,18 @@ class ElementModel(Qt.QAbstractTableModel):
         else:
             return Qt.Qt.Unchecked
 
-    def __setProperties(self, device, variables):
+    def __setProperties(self, device, prs):
         """ sets device properties
 
         :param device: device element
         :type device: :class:`nxsselector.Element.Element`
-        :param variables: (name, value) json dictionary with properties
-        :type variables: :obj:`str`
+        :param prs: (name, value) dictionary with properties
+        :type prs: :obj:`dict` <:obj:`str`, `any`>
         """
         props = device.state.properties
         dname = device.name
         cpvrs = device.state.cpvrdict
         cvars = device.state.configvars
-        prs = json.loads(variables)
         for nm, val in prs.items():
             if not nm.startswith("__"):
                 if dname in cpvrs.keys() and nm in cpvrs[dname]:
@@ -178,8 +222,8 @@ class ElementModel(Qt.QAbstractTableModel):
 
         :param device: device element
         :type device: :class:`nxsselector.Element.Element`
-        :returns: (name, value) json dictionary with properties
-        :rtype: :obj:`str`
+        :returns: (name, value) dictionary with properties
+        :rtype: :obj:`dict` <:obj:`str`, `any`>
         """
         cpvrs = device.state.cpvrdict
         cvars = device.state.configvars
@@ -210,7 +254,7 @@ class ElementModel(Qt.QAbstractTableModel):
                 else:
                     contains[pr] = None
         contains["__triggergatelist__"] = tglist
-        return json.dumps(contains)
+        return contains
 
     def __scanSources(self, device):
         """ provides device scan datasources
@@ -220,19 +264,7 @@ class ElementModel(Qt.QAbstractTableModel):
         :returns: string list of scan datasources separated by spaces
         :rtype: :obj:`str`
         """
-        desc = device.state.description
-        contains = set()
-        for cpg in desc:
-            for cp, dss in cpg.items():
-                if cp == device.name:
-                    if isinstance(dss, dict):
-                        for ds, values in dss.items():
-                            for vl in values:
-                                if len(vl) > 0 and vl[0] == 'STEP':
-                                    contains.add(ds)
-                                    break
-        if contains:
-            return " ".join([str(c) for c in sorted(contains)])
+        return device.state.descindex.scanSources(device.name)
 
     def __descSources(self, device):
         """ provides device description datasources
@@ -242,19 +274,7 @@ class ElementModel(Qt.QAbstractTableModel):
         :returns: string list of datasources datasources separated by spaces
         :rtype: :obj:`str`
         """
-        desc = device.state.description
-        contains = set()
-        for cpg in desc:
-            for cp, dss in cpg.items():
-                if cp == device.name:
-                    if isinstance(dss, dict):
-                        for ds, values in dss.items():
-                            for vl in values:
-                                if len(vl) == 0 or vl[0] != 'STEP':
-                                    contains.add(ds)
-                                    break
-        if contains:
-            return " ".join([str(c) for c in sorted(contains)])
+        return device.state.descindex.descSources(device.name)
 
     @classmethod
     def __createList(cls, text, words=7):
@@ -308,7 +328,6 @@ class ElementModel(Qt.QAbstractTableModel):
                 text = "%s\n * timer *" % text
 
         if prs:
-            prs = json.loads(prs)
             tt = " ".join("%s=\"%s\"" % (
                 k, (v if k not in PROPTEXT.keys() else PROPTEXT[k][int(v)]))
                 for (k, v) in prs.items() if v)
@@ -331,6 +350,24 @@ class ElementModel(Qt.QAbstractTableModel):
         if not index.isValid() or \
                 not 0 <= index.row() < len(self.group):
             return
+        cache = self.__rowCache(index.row(), index.column())
+        key = (index.column(), role)
+        if key not in cache:
+            cache[key] = self.__data(index, role)
+        if role == PROPERTIESROLE and cache[key] is not None:
+            return dict(cache[key])
+        return cache[key]
+
+    def __data(self, index, role):
+        """ computes model data
+
+        :param index: element index
+        :type index: :class:`taurus.qt.Qt.QModelIndex`
+        :param role: data model role
+        :type role: :class:`taurus.qt.Qt.Qt.ItemDataRole`
+        :returns: model data
+        :rtype: `str:class:`taurus.qt.Qt.`
+        """
         device = self.group[index.row()]
         column = index.column()
         if column == 0:
@@ -361,7 +398,9 @@ class ElementModel(Qt.QAbstractTableModel):
         elif column == 5:
             if role == Qt.Qt.CheckStateRole:
                 return
-            return (str(self.__properties(device)))
+            if role == PROPERTIESROLE:
+                return self.__properties(device)
+            return json.dumps(self.__properties(device))
         return ()
 
     def headerData(self, section, _, role=Qt.Qt.DisplayRole):
@@ -390,7 +429,20 @@ class ElementModel(Qt.QAbstractTableModel):
         """
         if not index.isValid():
             return Qt.Qt.ItemIsEnabled
+        cache = self.__rowCache(index.row(), index.column())
+        key = (index.column(), None)
+        if key not in cache:
+            cache[key] = self.__flags(index)
+        return cache[key]
+
+    def __flags(self, index):
+        """ computes model data flag
 
+        :param index: element index
+        :type index: :class:`taurus.qt.Qt.QModelIndex`
+        :returns: model data flag
+        :rtype: `str:class:`taurus.qt.Qt.Qt.ItemFlag`
+        """
         enable = True
         comp = None
         device = self.group[index.row()]
@@ -513,21 +565,58 @@ class ElementModel(Qt.QAbstractTableModel):
                 if role == Qt.Qt.CheckStateRole:
                     index3 = self.index(index.row(), 2)
                     device.display = value
+                    device.state.displayversion += 1
                     self.datachanged.emit(index, index3)
                     self.componentChecked.emit()
                     self.dirty.emit()
                     return True
             elif column == 5:
-                if role == Qt.Qt.EditRole:
-                    if hasattr(value, "toString"):
-                        value = value.toString()
-                    self.__setProperties(device, str(value))
+                if role in [Qt.Qt.EditRole, PROPERTIESROLE]:
+                    if role == Qt.Qt.EditRole:
+                        if hasattr(value, "toString"):
+                            value = value.toString()
+                        value = json.loads(str(value))
+                    self.__setProperties(device, value)
                     index5 = self.index(index.row(), 5)
                     self.datachanged.emit(index, index5)
                     self.dirty.emit()
                     return True
         return False
 
+    def setChecked(self, status, names=None, predicate=None, notify=True):
+        """ sets check status of the selected elements as user clicks do
+            and emits one notification for all changed rows
+
+        :param status: check status
+        :type status: :obj:`bool`
+        :param names: names of selected elements or None for all elements
+        :type names: :obj:`list` <:obj:`str`>
+        :param predicate: function selecting elements or None
+        :type predicate: :meth:`callable`
+        :param notify: emit componentChecked and dirty signals
+        :type notify: :obj:`bool`
+        :returns: number of changed elements
+        :rtype: :obj:`int`
+        """
+        if names is not None:
+            names = set(names)
+        rows = []
+        for row, device in enumerate(self.group):
+            if names is not None and device.name not in names:
+                continue
+            if predicate is not None and not predicate(device):
+                continue
+            if bool(device.checked) != bool(status):
+                device.checked = status
+                rows.append(row)
+        if rows:
+            self.datachanged.emit(self.index(rows[0], 0),
+                                  self.index(rows[-1], 2))
+            if notify:
+                self.componentChecked.emit()
+                self.dirty.emit()
+        return len(rows)
+
 
 class ElementDelegate(Qt.QStyledItemDelegate):
     """ element delegate
@@ -31,7 +31,7 @@ from taurus.qt.qtgui.util.ui import UILoadable
 # import taurus
 
 from .Views import OneTableView
-from .Element import GElement, CP, DS
+from .Element import CP, DS
 from .ElementModel import ElementModel
 from .AddDataSourceDlg import AddDataSourceDlg
 
@@ -119,6 +119,16 @@ class GroupsDlg(Qt.QDialog):
         self.ui.createPushButton.clicked.connect(
             self.__createDataSources)
 
+        self.ui.selectPushButton = self.ui.closeButtonBox.addButton(
+            "", Qt.QDialogButtonBox.ActionRole)
+        self.ui.selectPushButton.setText("Select All")
+        self.ui.selectPushButton.clicked.connect(self.__selectAll)
+
+        self.ui.clearPushButton = self.ui.closeButtonBox.addButton(
+            "", Qt.QDialogButtonBox.ActionRole)
+        self.ui.clearPushButton.setText("Clear All")
+        self.ui.clearPushButton.clicked.connect(self.__clearAll)
+
     @Qt.pyqtSlot()
     def __dirty(self):
         """ sets dirty to True
@@ -127,6 +137,28 @@ class GroupsDlg(Qt.QDialog):
         self.setWindowTitle("Component Groups *")
         logger.debug("changed")
 
+    def __setAll(self, status):
+        """ sets check status of all group elements
+
+        :param status: check status
+        :type status: :obj:`bool`
+        """
+        for view in [self.ui.dcpTableView, self.ui.ddsTableView]:
+            if view.model().setChecked(status):
+                view.viewport().update()
+
+    @Qt.pyqtSlot()
+    def __selectAll(self):
+        """ adds all elements to the group
+        """
+        self.__setAll(True)
+
+    @Qt.pyqtSlot()
+    def __clearAll(self):
+        """ removes all elements from the group
+        """
+        self.__setAll(False)
+
     @Qt.pyqtSlot()
     def __createDataSources(self):
         """ selects configuration of new datasources
@@ -135,13 +167,13 @@ class GroupsDlg(Qt.QDialog):
         dform.createGUI()
         if dform.exec_():
             self.newdatasources[dform.name] = dform.source
+            names = [] if dform.name in self.datasources else [dform.name]
             self.datasources[dform.name] = True
-            datasources = {dform.name: True}
             self.__populateTable(self.ui.ddsTableView, self.ddsgroup, DS,
-                                 datasources, "DataSources:")
+                                 self.datasources, "DataSources:", names)
             self.dirty = True
 
-    def __populateTable(self, view, group, eltype, dct, header):
+    def __populateTable(self, view, group, eltype, dct, header, names=None):
         """ populates the group table
 
         :param view: element table view
@@ -154,10 +186,13 @@ class GroupsDlg(Qt.QDialog):
         :type dct: :obj:`dict` <:obj:`str`, :obj:`bool` or `None`>
         :param header: table header
         :type header: :obj:`str`
+        :param names: names of new elements or None for all elements
+        :type names: :obj:`list` <:obj:`str`>
         """
 
-        for el in dct.keys():
-            group.append(GElement(el, eltype, self.state, dct))
+        for el in (dct.keys() if names is None else names):
+            group.append(
+                self.state.elements.member(el, eltype, dct, header))
         md = ElementModel(group)
         md.headers = [header]
         md.autoEnable = False
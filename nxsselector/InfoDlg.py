@@ -26,6 +26,8 @@ except Exception:
 
 from taurus.qt.qtgui.util.ui import UILoadable
 
+from .CallStats import stats
+
 import logging
 #: (:obj:`logging.Logger`) logger object
 logger = logging.getLogger(__name__)
@@ -55,3 +57,37 @@ class InfoDlg(Qt.QDialog):
             self.ui.doorLabel.setText(self.state.door)
             self.ui.selectorLabel.setText(str(
                 self.state.server if self.state.server else 'module'))
+        self.__populateCalls()
+
+    def __populateCalls(self):
+        """ populates the table with timing statistics of server calls
+        """
+        summary = stats.summary()
+        names = sorted(summary.keys(),
+                       key=lambda nm: summary[nm]["total"], reverse=True)
+        headers = ["Call", "Count", "Errors", "Total [s]", "Mean [ms]",
+                   "Min [ms]", "Max [ms]", "P50 [ms]", "P90 [ms]",
+                   "P99 [ms]", "Payload"]
+        self.ui.callsTableWidget.clear()
+        self.ui.callsTableWidget.setSortingEnabled(False)
+        self.ui.callsTableWidget.setRowCount(len(names))
+        self.ui.callsTableWidget.setColumnCount(len(headers))
+        self.ui.callsTableWidget.setHorizontalHeaderLabels(headers)
+        for row, name in enumerate(names):
+            record = summary[name]
+            values = [
+                name, str(record["count"]), str(record["errors"]),
+                "%.3f" % record["total"]]
+            values.extend(
+                "%.1f" % (1000. * record[key])
+                if record[key] is not None else ''
+                for key in ["mean", "min", "max", "p50", "p90", "p99"])
+            values.append(str(record["payload"]))
+            for column, value in enumerate(values):
+                self.ui.callsTableWidget.setItem(
+                    row, column, Qt.QTableWidgetItem(value))
+        self.ui.callsTableWidget.resizeColumnsToContents()
+        self.ui.callsTableWidget.horizontalHeader(
+        ).setStretchLastSection(True)
+        self.ui.callsTableWidget.setEditTriggers(
+            Qt.QAbstractItemView.NoEditTriggers)
@@ -174,6 +174,35 @@ class LDataDlg(Qt.QDialog):
                         self.widgets[nm], index, 1, 1, 1)
                     index += 1
 
+    def setProperties(self, props):
+        """ sets the form values from element properties
+
+        :param props: (name, value) dictionary with element properties
+        :type props: :obj:`dict` <:obj:`str`, `any`>
+        """
+        if "__triggergatelist__" in props:
+            self.synchronizers = list(props["__triggergatelist__"])
+        self.dtype = props.get("data_type")
+        self.shape = props.get("shape")
+        self.link = props.get("link")
+        self.path = props.get("nexus_path")
+        self.canfail = props.get("canfail")
+        self.addVariables(props)
+
+    def updateProperties(self, props):
+        """ updates element properties with the form values
+
+        :param props: (name, value) dictionary with element properties
+        :type props: :obj:`dict` <:obj:`str`, `any`>
+        """
+        if "data_type" in props:
+            props["data_type"] = self.dtype or None
+            props["link"] = self.link
+            props["canfail"] = self.canfail
+            props["shape"] = self.shape
+            props["nexus_path"] = self.path or None
+        props.update(self.variables)
+
     def addVariables(self, variables):
         """ adds  variables
 
@@ -22,12 +22,9 @@
 import os
 import json
 
-try:
-    import tango
-except Exception:
-    import PyTango as tango
-
 from .MessageBox import MessageBox
+from .ProxyPool import pool
+from .ServerDiscovery import discovery
 from .DynamicTools import DynamicTools
 try:
     from taurus.external.qt import Qt
@@ -70,6 +67,8 @@ class Preferences(Qt.QObject):
     layoutChanged = Qt.pyqtSignal(str, str)
     #: (:class:`taurus.qt.Qt.pyqtSignal`) dirty signal
     dirty = Qt.pyqtSignal()
+    #: (:class:`taurus.qt.Qt.pyqtSignal`) server discovered signal
+    serverDiscovered = Qt.pyqtSignal(object)
 
     def __init__(self, ui, state=None):
         """ constructor
@@ -175,6 +174,8 @@ class Preferences(Qt.QObject):
         #: (:obj:`bool`) if siganal connected
         self.connected = False
         self.connectSignals()
+        self.serverDiscovered.connect(
+            self.__setDiscoveredServer, Qt.Qt.QueuedConnection)
 
     def __setmgroups(self, groups):
         """ setter for mgroups
@@ -347,12 +348,12 @@ class Preferences(Qt.QObject):
                         self.state.setServer()
                         self.state.fetchSettings()
                         self.addHint(server, self.serverhelp)
+                    elif not server:
+                        discovery.findAsync(self.serverDiscovered.emit)
+                        self.connectSignals()
+                        return
                     else:
-                        if not server:
-                            self.state.findServer()
-                            self.state.setServer()
-                            self.state.fetchSettings()
-                        dp = tango.DeviceProxy(server)
+                        dp = pool.get(server)
                         if dp.info().dev_class == 'NXSRecSelector':
                             self.state.server = str(server)
                             self.state.setServer()
@@ -367,6 +368,28 @@ class Preferences(Qt.QObject):
                     self.state.server if self.state.server else 'module'))
         self.connectSignals()
 
+    @Qt.pyqtSlot(object)
+    def __setDiscoveredServer(self, result):
+        """ sets the selector server found in background
+
+        :param result: (found, device name) tuple
+                       or an exception of the discovery
+        :type result: (:obj:`bool`, :obj:`str`) or :class:`Exception`
+        """
+        if isinstance(result, Exception):
+            logger.warning("Cannot discover the selector server: %s"
+                           % str(result))
+            found = False
+        else:
+            found, server = result
+            if not found:
+                logger.warning("Cannot choose one of the selector servers")
+        if found:
+            self.state.server = str(server) if server else ''
+        self.reset()
+        if found:
+            self.serverChanged.emit()
+
     @Qt.pyqtSlot()
     def on_devSettingsLineEdit_editingFinished(self):
         """ changes  selector server
@@ -0,0 +1,149 @@
+#!/usr/bin/env python
+#   This file is part of nexdatas - Tango Server for NeXus data writer
+#
+#    Copyright (C) 2014-2017 DESY, Jan Kotanski <jkotan@mail.desy.de>
+#
+#    nexdatas is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    nexdatas is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    You should have received a copy of the GNU General Public License
+#    along with nexdatas.  If not, see <http://www.gnu.org/licenses/>.
+# pool of device proxies
+
+""" pool of device proxies """
+
+import os
+import time
+import threading
+
+try:
+    import tango
+except Exception:
+    import PyTango as tango
+
+import logging
+#: (:obj:`logging.Logger`) logger object
+logger = logging.getLogger(__name__)
+
+
+class ProxyPool(object):
+    """ process-wide pool of device proxies keyed by fully qualified
+        device names, the proxies are shared between threads and owners
+        which change the proxy source or timeout use their own instances
+    """
+
+    def __init__(self, idle=300.0):
+        """ constructor
+
+        :param idle: time in seconds after which unused proxies are evicted
+        :type idle: :obj:`float`
+        """
+        #: (:obj:`float`) time in seconds after which unused proxies \
+        #:    are evicted
+        self.idle = idle
+        #: (:obj:`int`) number of reused proxies
+        self.hits = 0
+        #: (:obj:`int`) number of created proxies
+        self.misses = 0
+        #: (:obj:`int`) number of evicted proxies
+        self.evictions = 0
+        #: (:class:`threading.Lock`) pool lock
+        self.__lock = threading.Lock()
+        #: (:obj:`dict` <(:obj:`str`, `any`), \
+        #:    [:class:`tango.DeviceProxy`, :obj:`float`]>) \
+        #:    (name, owner) -> [proxy, last access time]
+        self.__proxies = {}
+
+    @classmethod
+    def fqdn(cls, name):
+        """ provides fully qualified device name
+
+        :param name: device name
+        :type name: :obj:`str`
+        :returns: device name with the tango host
+        :rtype: :obj:`str`
+        """
+        name = str(name)
+        if name.startswith("tango://"):
+            name = name[len("tango://"):]
+        if ':' not in name.split("/")[0]:
+            host = os.environ.get("TANGO_HOST")
+            if host:
+                name = "%s/%s" % (host.split(",")[0], name)
+        return name.lower()
+
+    def get(self, name, owner=None):
+        """ provides device proxy creating it if needed
+
+        :param name: device name
+        :type name: :obj:`str`
+        :param owner: owner of a separate proxy or None for
+                      the shared proxy
+        :type owner: `any`
+        :returns: device proxy
+        :rtype: :class:`tango.DeviceProxy`
+        """
+        key = (self.fqdn(name), owner)
+        now = time.time()
+        with self.__lock:
+            self.__evict(now)
+            if key in self.__proxies:
+                self.hits += 1
+                self.__proxies[key][1] = now
+                return self.__proxies[key][0]
+        proxy = tango.DeviceProxy(name)
+        with self.__lock:
+            self.misses += 1
+            return self.__proxies.setdefault(key, [proxy, now])[0]
+
+    def discard(self, name, owner=None):
+        """ removes device proxy from the pool, e.g. after a failure
+
+        :param name: device name
+        :type name: :obj:`str`
+        :param owner: owner of a separate proxy or None for
+                      the shared proxy
+        :type owner: `any`
+        """
+        with self.__lock:
+            self.__proxies.pop((self.fqdn(name), owner), None)
+
+    def __evict(self, now):
+        """ removes proxies which are not used for a long time
+
+        :param now: current time
+        :type now: :obj:`float`
+        """
+        for key, (_, last) in list(self.__proxies.items()):
+            if now - last > self.idle:
+                self.__proxies.pop(key)
+                self.evictions += 1
+
+    def clear(self):
+        """ removes all proxies
+        """
+        with self.__lock:
+            self.__proxies = {}
+
+    def counters(self):
+        """ provides pool counters
+
+        :returns: (name, value) dictionary with hits, misses,
+                  evictions and the pool size
+        :rtype: :obj:`dict` <:obj:`str`, :obj:`int`>
+        """
+        with self.__lock:
+            return {"hits": self.hits, "misses": self.misses,
+                    "evictions": self.evictions,
+                    "size": len(self.__proxies)}
+
+
+#: (:class:`ProxyPool`) process-wide pool of device proxies
+pool = ProxyPool()
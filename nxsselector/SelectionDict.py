@@ -0,0 +1,166 @@
+#!/usr/bin/env python
+#   This file is part of nexdatas - Tango Server for NeXus data writer
+#
+#    Copyright (C) 2014-2017 DESY, Jan Kotanski <jkotan@mail.desy.de>
+#
+#    nexdatas is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    nexdatas is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    You should have received a copy of the GNU General Public License
+#    along with nexdatas.  If not, see <http://www.gnu.org/licenses/>.
+# observable selection dictionary
+
+""" observable selection dictionary """
+
+
+class SelectionDict(dict):
+    """ selection dictionary with a version counter, cached selected names
+        and change listeners
+    """
+
+    def __init__(self, *args, **kwargs):
+        """ constructor
+
+        :param args: dict arguments
+        :type args: :obj:`list` < `any` >
+        :param kwargs: dict keyword arguments
+        :type kwargs: :obj:`dict` < :obj:`str`, `any`>
+        """
+        dict.__init__(self, *args, **kwargs)
+        #: (:obj:`int`) version increased on each modification
+        self.version = 0
+        #: (:obj:`list` < :meth:`callable` >) listeners called with \
+        #:    (name, old value, new value) or (None, None, None) \
+        #:    after bulk modifications
+        self.listeners = []
+        #: (:obj:`frozenset` <:obj:`str`>) cached selected names
+        self.__selected = None
+        #: (:obj:`list` <:obj:`str`>) cached selected names in key order
+        self.__selectedlist = None
+
+    def __changed(self, name=None, old=None, new=None):
+        """ invalidates cache and notifies listeners
+
+        :param name: modified key or None for bulk modification
+        :type name: :obj:`str`
+        :param old: old value
+        :type old: :obj:`bool` or `None`
+        :param new: new value
+        :type new: :obj:`bool` or `None`
+        """
+        self.version += 1
+        if name is None or bool(old) != bool(new):
+            self.__selected = None
+            self.__selectedlist = None
+        for listener in self.listeners:
+            listener(name, old, new)
+
+    def __setitem__(self, name, value):
+        """ sets an item
+
+        :param name: item key
+        :type name: :obj:`str`
+        :param value: item value
+        :type value: :obj:`bool` or `None`
+        """
+        exists = dict.__contains__(self, name)
+        old = dict.get(self, name)
+        dict.__setitem__(self, name, value)
+        if not exists or old != value or type(old) is not type(value):
+            self.__changed(name, old, value)
+
+    def __delitem__(self, name):
+        """ removes an item
+
+        :param name: item key
+        :type name: :obj:`str`
+        """
+        old = dict.__getitem__(self, name)
+        dict.__delitem__(self, name)
+        self.__changed(name, old, None)
+
+    def clear(self):
+        """ removes all items
+        """
+        if self:
+            dict.clear(self)
+            self.__changed()
+
+    def update(self, *args, **kwargs):
+        """ updates items
+
+        :param args: dict arguments
+        :type args: :obj:`list` < `any` >
+        :param kwargs: dict keyword arguments
+        :type kwargs: :obj:`dict` < :obj:`str`, `any`>
+        """
+        dict.update(self, *args, **kwargs)
+        self.__changed()
+
+    def setdefault(self, name, value=None):
+        """ sets an item if it does not exist
+
+        :param name: item key
+        :type name: :obj:`str`
+        :param value: item value
+        :type value: :obj:`bool` or `None`
+        :returns: item value
+        :rtype: :obj:`bool` or `None`
+        """
+        if name not in self:
+            self[name] = value
+        return dict.__getitem__(self, name)
+
+    def pop(self, name, *args):
+        """ removes an item and returns its value
+
+        :param name: item key
+        :type name: :obj:`str`
+        :param args: default value
+        :type args: :obj:`list` < `any` >
+        :returns: item value
+        :rtype: :obj:`bool` or `None`
+        """
+        if name not in self:
+            return dict.pop(self, name, *args)
+        value = dict.pop(self, name)
+        self.__changed(name, value, None)
+        return value
+
+    def popitem(self):
+        """ removes an item and returns it
+
+        :returns: (key, value) pair
+        :rtype: (:obj:`str`, :obj:`bool` or `None`)
+        """
+        name, value = dict.popitem(self)
+        self.__changed(name, value, None)
+        return name, value
+
+    def selected(self):
+        """ provides selected names
+
+        :returns: names with true values
+        :rtype: :obj:`frozenset` <:obj:`str`>
+        """
+        if self.__selected is None:
+            self.__selected = frozenset(self.selectedList())
+        return self.__selected
+
+    def selectedList(self):
+        """ provides selected names in key order
+
+        :returns: names with true values
+        :rtype: :obj:`list` <:obj:`str`>
+        """
+        if self.__selectedlist is None:
+            self.__selectedlist = [
+                name for name, value in self.items() if value]
+        return list(self.__selectedlist)
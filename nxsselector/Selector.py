@@ -42,6 +42,7 @@ from .Descriptions import Descriptions
 from .Data import Data
 from .Storage import Storage
 from .CommandThread import CommandThread
+from .CallStats import stats
 from .MessageBox import MessageBox
 
 from . import __version__
@@ -166,6 +167,14 @@ class Selector(Qt.QDialog, TaurusBaseWidget):
         #: (:obj:`list` <:class:`nxsselector.CommandThread.CommandThread`>) \
         #:     command thread
         self.__commandthread = None
+        #: (:class:`nxsselector.CommandThread.CommandThread`) \
+        #:     thread fetching lazy server state attributes
+        self.__prefetchthread = None
+        #: (:class:`nxsselector.CommandThread.CommandThread`) \
+        #:     thread revalidating settings loaded from a snapshot
+        self.__revalidatethread = None
+        #: (:obj:`bool`) settings already loaded before the next reset
+        self.__loaded = False
 
         self.__resetServer(server)
         #: (:obj:`int`) user data tab number
@@ -220,6 +229,7 @@ class Selector(Qt.QDialog, TaurusBaseWidget):
                 self, "NXSelector: Error in Setting Selector Server", text,
                 "%s" % str(self.__commandthread.error))
             self.__commandthread.error = None
+            self.__loaded = False
 
         settings = Qt.QSettings(self.__organization, self.__application, self)
         if not self.__umode or self.__umode == 'None':
@@ -378,6 +388,9 @@ class Selector(Qt.QDialog, TaurusBaseWidget):
                 self, "NXSelector: Error in Switching MntGrp",
                 text, str(value))
         self.createGUI()
+        if self.__loaded and self.state.snapshotloaded:
+            self.__loaded = False
+            self.__revalidate()
         self.__tabChanged(0)
 
         sg = settings.value("Selector/Geometry")
@@ -729,6 +742,10 @@ class Selector(Qt.QDialog, TaurusBaseWidget):
         logger.debug("close event")
         if self.__settingsloaded:
             self.__saveSettings()
+        if self.__prefetchthread:
+            self.__prefetchthread.wait()
+        if self.__revalidatethread:
+            self.__revalidatethread.wait()
         Qt.QDialog.closeEvent(self, event)
         logger.debug("close event ended")
 
@@ -744,6 +761,10 @@ class Selector(Qt.QDialog, TaurusBaseWidget):
         :type server: :obj:`str`
         """
         if self.state:
+            if self.__prefetchthread:
+                self.__prefetchthread.wait()
+            if self.__revalidatethread:
+                self.__revalidatethread.wait()
             with Qt.QMutexLocker(self.state.mutex):
                 self.state.synchthread.running = False
             if hasattr(self, "storage"):
@@ -778,11 +799,14 @@ class Selector(Qt.QDialog, TaurusBaseWidget):
                 self.resetServer, Qt.Qt.DirectConnection)
             self.state.synchthread.restart()
         if self.__switch:
-            cmds = ["fetchSettings"]
+            cmds = []
         else:
-            cmds = ["updateControllers",
-                    "fetchSettings"]
+            cmds = ["updateControllers"]
+        # the snapshot is loaded after updateControllers
+        # which changes the profile preselection
+        cmds.extend(["loadSettings", "prefetch"])
         self.runProgress(cmds, "settings")
+        self.__loaded = True
 
     def __resetStateThread(self):
         """ resets server state variables
@@ -931,8 +955,17 @@ class Selector(Qt.QDialog, TaurusBaseWidget):
         """ fetches configuration and resets all tab views
         """
         logger.debug("reset selector")
+        loaded = self.__loaded
+        self.__loaded = False
+        if self.__revalidatethread:
+            self.__revalidatethread.wait()
         try:
-            self.state.fetchSettings()
+            if loaded and not self.state.snapshotloaded:
+                logger.debug("settings already fetched")
+            elif loaded or self.state.loadSnapshot():
+                self.__revalidate()
+            else:
+                self.state.fetchSettings()
         except Exception:
             import traceback
             value = traceback.format_exc()
@@ -973,10 +1006,62 @@ class Selector(Qt.QDialog, TaurusBaseWidget):
         if self.__doortoupdateFlag:
             self.updateDoorName(self.__door)
         self.waitForThread()
+        self.__prefetch()
         gc.collect()
         logger.debug("closing Progress ENDED")
         return status
 
+    def __revalidate(self):
+        """ fetches in background server data to compare with
+            settings loaded from the snapshot
+        """
+        if self.__revalidatethread:
+            self.__revalidatethread.setParent(None)
+        self.__revalidatethread = CommandThread(
+            self.state, ["revalidateSnapshot"], self)
+        self.__revalidatethread.finished.connect(
+            self.__revalidated, Qt.Qt.QueuedConnection)
+        self.__revalidatethread.start()
+
+    @Qt.pyqtSlot()
+    def __revalidated(self):
+        """ refreshes views if server data differ from the snapshot
+        """
+        self.__applyRevalidation(self.__revalidatethread)
+
+    def __applyRevalidation(self, thread):
+        """ refreshes views if server data differ from the snapshot
+            postponing it while the progress thread is running
+
+        :param thread: revalidation thread
+        :type thread: :class:`nxsselector.CommandThread.CommandThread`
+        """
+        if thread is None or thread is not self.__revalidatethread:
+            return
+        if self.__progress:
+            Qt.QTimer.singleShot(
+                100, lambda: self.__applyRevalidation(thread))
+            return
+        thread.wait()
+        if thread.error:
+            logger.warning("Cannot revalidate settings: %s" % thread.error)
+            thread.error = None
+            return
+        if self.state.applySnapshot():
+            logger.debug("refreshing views after revalidation")
+            for tab in self.tabs:
+                tab.reset()
+            self.storage.updateMntGrpComboBox()
+
+    def __prefetch(self):
+        """ fetches lazy server state attributes in background
+        """
+        if self.__prefetchthread:
+            self.__prefetchthread.wait()
+            self.__prefetchthread.setParent(None)
+        self.__prefetchthread = CommandThread(self.state, ["prefetch"], self)
+        self.__prefetchthread.start()
+
     def closeResetShowErrors(self):
         self.storage.showErrors()
         self.closeReset()
@@ -1000,6 +1085,7 @@ class Selector(Qt.QDialog, TaurusBaseWidget):
         """
         if self.__progress:
             return
+        self.__loaded = False
         if self.__commandthread:
             self.__commandthread.setParent(None)
             self.__commandthread = None
@@ -1175,26 +1261,45 @@ class Selector(Qt.QDialog, TaurusBaseWidget):
     def __unlock(self):
         """ unlock inaccessable descriptive components
         """
-        for ds in self.state.idsgroup.keys():
-            if self.state.idsgroup[ds] is None:
-                self.state.idsgroup[ds] = False
-        for cp in self.state.acpgroup.keys():
-            if self.state.acpgroup[cp] is None:
-                self.state.acpgroup[cp] = False
-        self.state.ddsdirty = True
-        self.resetViews()
+        self.__setSelection(
+            [self.state.idsgroup, self.state.acpgroup], False,
+            lambda status: status is None)
+
+    def __setSelection(self, groups, status, predicate):
+        """ sets selection values of the selection dictionaries with one
+            bulk update per dictionary and refreshes the tabs once
+
+        :param groups: selection dictionaries
+        :type groups: :obj:`list` \
+            <:class:`nxsselector.SelectionDict.SelectionDict`>
+        :param status: selection value
+        :type status: :obj:`bool`
+        :param predicate: function selecting elements by their values
+        :type predicate: :meth:`callable`
+        """
+        changed = False
+        for group in groups:
+            values = dict((name, status) for name, value in group.items()
+                          if predicate(value))
+            if values:
+                group.update(values)
+                changed = True
+        if changed:
+            self.state.ddsdirty = True
+            # element views show the new values without recreating groups
+            self.detectors.updateViews()
+            self.descriptions.updateViews()
+            for tab in self.tabs:
+                if tab not in [self.detectors, self.descriptions]:
+                    tab.reset()
         self.setDirty()
 
     def __clearAllClicked(self):
         """ unselected all selected elements for detectors
         """
-        for ds in self.state.dsgroup.keys():
-            self.state.dsgroup[ds] = False
-        for ds in self.state.cpgroup.keys():
-            self.state.cpgroup[ds] = False
-        self.state.ddsdirty = True
-        self.resetViews()
-        self.setDirty()
+        self.__setSelection(
+            [self.state.dsgroup, self.state.cpgroup], False,
+            lambda status: status is not False)
 
     @Qt.pyqtSlot()
     def cnfLoad(self):
@@ -1488,6 +1593,9 @@ def main():
         parser.add_argument(
             "--log", dest="log",
             help="logging level, i.e. debug, info, warning, error, critical")
+        parser.add_argument(
+            "--call-stats", dest="callstats",
+            help="JSON file for call statistics written on exit")
 
         app = Application(
             sys.argv,
@@ -1531,7 +1639,10 @@ def main():
     form.show()
 
     if standalone:
-        sys.exit(app.exec_())
+        status = app.exec_()
+        if options.callstats:
+            stats.dump(options.callstats)
+        sys.exit(status)
     else:
         return form
 
@@ -0,0 +1,232 @@
+#!/usr/bin/env python
+#   This file is part of nexdatas - Tango Server for NeXus data writer
+#
+#    Copyright (C) 2014-2017 DESY, Jan Kotanski <jkotan@mail.desy.de>
+#
+#    nexdatas is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    nexdatas is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    You should have received a copy of the GNU General Public License
+#    along with nexdatas.  If not, see <http://www.gnu.org/licenses/>.
+# discovery of selector servers
+
+""" discovery of selector servers """
+
+import os
+import time
+import threading
+
+try:
+    import tango
+except Exception:
+    import PyTango as tango
+
+import logging
+#: (:obj:`logging.Logger`) logger object
+logger = logging.getLogger(__name__)
+
+
+class ServerDiscovery(object):
+    """ discovery of tango servers from the process table and
+        the tango database with short-lived caches
+    """
+
+    def __init__(self, ttl=30.0, procdir="/proc"):
+        """ constructor
+
+        :param ttl: time to live of cached results in seconds
+        :type ttl: :obj:`float`
+        :param procdir: process table directory
+        :type procdir: :obj:`str`
+        """
+        #: (:obj:`float`) time to live of cached results in seconds
+        self.ttl = ttl
+        #: (:obj:`str`) process table directory
+        self.procdir = procdir
+        #: (:class:`threading.Lock`) cache lock
+        self.__lock = threading.Lock()
+        #: (:obj:`dict` <(:obj:`str`, :obj:`str`), \
+        #:    (:obj:`float`, `any`)>) (kind, name) -> (time, result)
+        self.__cache = {}
+
+    def __cached(self, key, fetch):
+        """ provides cached result or fetches it, failures are cached
+            and raised again until they expire
+
+        :param key: cache key
+        :type key: (:obj:`str`, :obj:`str`)
+        :param fetch: function fetching the result
+        :type fetch: :meth:`callable`
+        :returns: result
+        :rtype: `any`
+        """
+        with self.__lock:
+            if key in self.__cache:
+                last, result = self.__cache[key]
+                if time.time() - last < self.ttl:
+                    if isinstance(result, Exception):
+                        raise result
+                    return result
+        try:
+            result = fetch()
+        except Exception as e:
+            with self.__lock:
+                self.__cache[key] = (time.time(), e)
+            raise
+        with self.__lock:
+            self.__cache[key] = (time.time(), result)
+        return result
+
+    def clear(self):
+        """ drops cached results
+        """
+        with self.__lock:
+            self.__cache = {}
+
+    def __processInstances(self, classname):
+        """ reads instances of the local server processes
+
+        :param classname: server class name
+        :type classname: :obj:`str`
+        :returns: server instance names in process id order
+        :rtype: :obj:`list` <:obj:`str`>
+        """
+        instances = []
+        try:
+            pids = sorted(int(pid) for pid in os.listdir(self.procdir)
+                          if pid.isdigit())
+        except OSError as e:
+            logger.debug(str(e))
+            return instances
+        for pid in pids:
+            try:
+                with open(os.path.join(
+                        self.procdir, str(pid), "cmdline"), "rb") as fl:
+                    command = fl.read().decode(
+                        "utf8", "replace").split("\0")
+            except (IOError, OSError):
+                continue
+            for i, arg in enumerate(command[:-1]):
+                if classname in os.path.basename(arg):
+                    if command[i + 1]:
+                        instances.append(command[i + 1])
+                    break
+        return instances
+
+    def instances(self, classname="NXSRecSelector"):
+        """ provides instances of the local server processes
+
+        :param classname: server class name
+        :type classname: :obj:`str`
+        :returns: server instance names
+        :rtype: :obj:`list` <:obj:`str`>
+        """
+        return self.__cached(
+            ("instances", classname),
+            lambda: self.__processInstances(classname))
+
+    def exported(self, db, classname="NXSRecSelector"):
+        """ provides exported devices of the class
+
+        :param db: tango database
+        :type db: :class:`tango.Database`
+        :param classname: device class name
+        :type classname: :obj:`str`
+        :returns: device names
+        :rtype: :obj:`list` <:obj:`str`>
+        """
+        return self.__cached(
+            ("exported", classname),
+            lambda: list(db.get_device_exported_for_class(
+                classname).value_string))
+
+    def device(self, db, classname, instance):
+        """ provides the device of the server instance
+
+        :param db: tango database
+        :type db: :class:`tango.Database`
+        :param classname: server class name
+        :type classname: :obj:`str`
+        :param instance: server instance name
+        :type instance: :obj:`str`
+        :returns: device name
+        :rtype: :obj:`str`
+        """
+        return self.__cached(
+            ("device", "%s/%s" % (classname, instance)),
+            lambda: db.get_device_class_list(
+                "%s/%s" % (classname, instance)).value_string[2])
+
+    def local(self, db, classname="NXSRecSelector"):
+        """ provides the device of the first local server process
+
+        :param db: tango database
+        :type db: :class:`tango.Database`
+        :param classname: server class name
+        :type classname: :obj:`str`
+        :returns: device name or None
+        :rtype: :obj:`str`
+        """
+        try:
+            instances = self.instances(classname)
+            if instances:
+                return self.device(db, classname, instances[0])
+        except Exception as e:
+            logger.debug(str(e))
+
+    def find(self, db=None, classname="NXSRecSelector"):
+        """ finds the selector server device
+
+        :param db: tango database
+        :type db: :class:`tango.Database`
+        :param classname: device class name
+        :type classname: :obj:`str`
+        :returns: (found, device name) tuple, where device name is None
+                  if there is no server and found is False if several
+                  servers are exported but none of them runs locally
+        :rtype: (:obj:`bool`, :obj:`str`)
+        """
+        db = db or tango.Database()
+        servers = self.exported(db, classname)
+        if len(servers) > 1:
+            gserver = self.local(db, classname)
+            if gserver in servers:
+                return True, str(gserver)
+            return False, None
+        elif servers:
+            return True, str(servers[0])
+        return True, None
+
+    def findAsync(self, callback, classname="NXSRecSelector"):
+        """ finds the selector server device in a background thread
+
+        :param callback: function called with the result of :meth:`find`
+                         or with an exception from the background thread
+        :type callback: :meth:`callable`
+        :param classname: device class name
+        :type classname: :obj:`str`
+        :returns: discovery thread
+        :rtype: :class:`threading.Thread`
+        """
+        def run():
+            try:
+                result = self.find(classname=classname)
+            except Exception as e:
+                result = e
+            callback(result)
+
+        thread = threading.Thread(target=run)
+        thread.daemon = True
+        thread.start()
+        return thread
+
+
+#: (:class:`ServerDiscovery`) process-wide server discovery
+discovery = ServerDiscovery()
@@ -21,7 +21,9 @@
 
 import json
 import time
-import subprocess
+import hashlib
+import threading
+import collections
 
 
 try:
@@ -34,16 +36,126 @@ try:
 except Exception:
     from taurus.qt import Qt
 
+from .DescriptionIndex import (
+    DescriptionIndex, DisabledDataSources, DataSourceRecord)
+from .SelectionDict import SelectionDict
+from .Element import ElementRegistry
+from .SnapshotCache import SnapshotCache
+from .ProxyPool import pool
+from .ServerDiscovery import discovery
+from .CallStats import stats
 
 import logging
 #: (:obj:`logging.Logger`) logger object
 logger = logging.getLogger(__name__)
 
+try:
+    from types import MappingProxyType
+except ImportError:
+    class MappingProxyType(collections.Mapping):
+        """ read-only view of a dictionary
+        """
+
+        def __init__(self, dct):
+            """ constructor
+
+            :param dct: viewed dictionary
+            :type dct: :obj:`dict` <`any`, `any`>
+            """
+            #: (:obj:`dict` <`any`, `any`>) viewed dictionary
+            self.__dct = dct
+
+        def __getitem__(self, key):
+            return self.__dct[key]
+
+        def __iter__(self):
+            return iter(self.__dct)
+
+        def __len__(self):
+            return len(self.__dct)
+
+        def copy(self):
+            return self.__dct.copy()
+
+
+class JSONCache(object):
+    """ bounded cache of parsed JSON documents keyed by their strings
+    """
+
+    def __init__(self, maxsize=32):
+        """ constructor
+
+        :param maxsize: maximal number of cached documents
+        :type maxsize: :obj:`int`
+        """
+        #: (:obj:`int`) maximal number of cached documents
+        self.maxsize = maxsize
+        #: (:obj:`int`) number of cache hits
+        self.hits = 0
+        #: (:obj:`int`) number of cache misses
+        self.misses = 0
+        #: (:class:`collections.OrderedDict` <:obj:`str`, `any`>) \
+        #:     parsed documents in the least recently used order
+        self.__docs = collections.OrderedDict()
+        #: (:class:`threading.Lock`) cache lock
+        self.__lock = threading.Lock()
+
+    def loads(self, jstr):
+        """ provides the parsed JSON document which should not be modified
+
+        :param jstr: JSON string
+        :type jstr: :obj:`str`
+        :returns: parsed document
+        :rtype: `any`
+        """
+        with self.__lock:
+            if jstr in self.__docs:
+                self.hits += 1
+                doc = self.__docs.pop(jstr)
+                self.__docs[jstr] = doc
+                return doc
+        doc = json.loads(jstr)
+        with self.__lock:
+            self.misses += 1
+            self.__docs[jstr] = doc
+            while len(self.__docs) > self.maxsize:
+                self.__docs.popitem(last=False)
+        return doc
+
+    def equals(self, jstr, value):
+        """ checks if the JSON string is cached and its document
+            is equal to the given value without parsing the string
+
+        :param jstr: JSON string
+        :type jstr: :obj:`str`
+        :param value: compared value
+        :type value: `any`
+        :returns: if the cached document is equal to the value
+        :rtype: :obj:`bool`
+        """
+        try:
+            with self.__lock:
+                if jstr not in self.__docs:
+                    return False
+                doc = self.__docs[jstr]
+        except TypeError:
+            return False
+        return doc == value
+
+    def clear(self):
+        """ removes all cached documents
+        """
+        with self.__lock:
+            self.__docs.clear()
+
 
 class Checker(object):
     """ compare configuation methods
     """
 
+    #: (:class:`JSONCache`) parsed sub-documents shared by all checkers
+    cache = JSONCache()
+
     def __init__(self):
         """ constructor
         """
@@ -54,7 +166,8 @@ class Checker(object):
         self.jdicts = ['DataSourceSelection']
 
     def compDict(self, dct, dct2, sort=False):
-        """ compare two configuration dictionaries
+        """ compare two configuration dictionaries stopping at the first
+            difference, parsed JSON values are taken from the shared cache
 
         :param dct: first configuration dictionary
         :type dct: `dict`<:obj:`any`, :obj:`any`>
@@ -65,32 +178,308 @@ class Checker(object):
         :returns: if configuration are equal
         :rtype: :obj:`bool`
         """
-
-        if not isinstance(dct, dict):
-            return False
-        if not isinstance(dct2, dict):
+        if not isinstance(dct, dict) or not isinstance(dct2, dict):
             return False
-        if len(dct.keys()) != len(dct2.keys()):
+        if len(dct) != len(dct2):
             return False
         for k, v in dct.items():
-            if k not in dct2.keys():
+            if k not in dct2:
                 return False
-            if isinstance(v, dict):
-                return self.compDict(v, dct2[k])
+            v2 = dct2[k]
+            if v is v2:
+                continue
+            elif isinstance(v, dict):
+                if not self.compDict(v, v2):
+                    return False
             elif sort and k in self.jsortedlists:
-                l1 = sorted(json.loads(v))
-                l2 = sorted(json.loads(dct2[k]))
-                if l1 != l2:
+                if v != v2 and sorted(self.cache.loads(v)) != \
+                   sorted(self.cache.loads(v2)):
                     return False
             elif sort and k in self.jdicts:
-                d1 = json.loads(v)
-                d2 = json.loads(dct2[k])
-                return self.compDict(d1, d2)
-            else:
-                if v != dct2[k]:
+                if v != v2 and not self.compDict(
+                        self.cache.loads(v), self.cache.loads(v2)):
                     return False
+            elif v != v2:
+                return False
         return True
 
+    def normalize(self, dct, sort=False):
+        """ provides a normalized configuration dictionary
+
+        :param dct: configuration dictionary
+        :type dct: `dict`<:obj:`any`, :obj:`any`>
+        :param sort: if use special keys
+        :type sort: :obj:`bool`
+        :returns: configuration with decoded special keys
+        :rtype: `dict`<:obj:`any`, :obj:`any`>
+        """
+        if not isinstance(dct, dict):
+            return dct
+        res = {}
+        for k, v in dct.items():
+            if isinstance(v, dict):
+                res[k] = self.normalize(v)
+            elif sort and k in self.jsortedlists:
+                res[k] = sorted(self.cache.loads(v))
+            elif sort and k in self.jdicts:
+                res[k] = self.normalize(self.cache.loads(v))
+            else:
+                res[k] = v
+        return res
+
+    def sections(self, jconf, last=None, sort=False):
+        """ provides top-level sections of the JSON configuration with
+            digests of the normalized special sections, digests of sections
+            with raw values unchanged since the last configuration are reused
+
+        :param jconf: JSON configuration dictionary
+        :type jconf: :obj:`str`
+        :param last: (section, (raw value, digest)) dictionary
+                     of the last configuration
+        :type last: :obj:`dict` <:obj:`str`, (`any`, :obj:`str`)>
+        :param sort: if use special keys
+        :type sort: :obj:`bool`
+        :returns: (section, (raw value, digest or None)) dictionary
+        :rtype: :obj:`dict` <:obj:`str`, (`any`, :obj:`str`)>
+        """
+        last = last or {}
+        try:
+            dct = json.loads(jconf)
+        except ValueError:
+            dct = jconf
+        if not isinstance(dct, dict):
+            return {None: (dct, None)}
+        res = {}
+        for k, v in dct.items():
+            old = last.get(k)
+            if old is not None and old[0] == v:
+                res[k] = old
+            elif sort and (k in self.jsortedlists or k in self.jdicts):
+                ndct = self.normalize({k: v}, sort)
+                res[k] = (v, hashlib.sha1(json.dumps(
+                    ndct[k], sort_keys=True).encode("utf-8")).hexdigest())
+            else:
+                res[k] = (v, None)
+        return res
+
+    def compSections(self, sections, sections2):
+        """ compares configuration sections
+
+        :param sections: (section, (raw value, digest)) dictionary
+        :type sections: :obj:`dict` <:obj:`str`, (`any`, :obj:`str`)>
+        :param sections2: (section, (raw value, digest)) dictionary
+        :type sections2: :obj:`dict` <:obj:`str`, (`any`, :obj:`str`)>
+        :returns: if configuration are equal
+        :rtype: :obj:`bool`
+        """
+        if len(sections) != len(sections2):
+            return False
+        for k, (v, digest) in sections.items():
+            if k not in sections2:
+                return False
+            v2, digest2 = sections2[k]
+            if v is v2 or v == v2:
+                continue
+            if digest is None or digest != digest2:
+                return False
+        return True
+
+
+class ProxyHealth(object):
+    """ connection health of a device proxy which replaces ping()
+        before every call by a ping of a stale or failed connection
+    """
+
+    def __init__(self, ttl=10.0):
+        """ constructor
+
+        :param ttl: time after the last successful call in seconds
+                    when the connection is treated as stale
+        :type ttl: :obj:`float`
+        """
+        #: (:obj:`float`) time to live of a successful call in seconds
+        self.ttl = ttl
+        #: (:obj:`int`) number of performed pings
+        self.pings = 0
+        #: (:obj:`int`) number of avoided pings
+        self.avoided = 0
+        #: (:obj:`float`) time of the last successful call
+        self.__last = None
+
+    def reset(self):
+        """ marks the connection as stale
+        """
+        self.__last = None
+
+    def touch(self):
+        """ marks the connection as healthy
+        """
+        self.__last = time.time()
+
+    def stale(self):
+        """ checks if the last successful call is too old
+
+        :returns: if the connection is stale
+        :rtype: :obj:`bool`
+        """
+        return self.__last is None or time.time() - self.__last > self.ttl
+
+    def check(self, proxy):
+        """ pings the proxy if the connection is stale
+
+        :param proxy: device proxy
+        :type proxy: :class:`tango.DeviceProxy`
+        """
+        if self.stale():
+            self.pings += 1
+            proxy.ping()
+            self.touch()
+        else:
+            self.avoided += 1
+
+    def call(self, proxy, method, *args):
+        """ calls the proxy method without retrying it, a failed call
+            marks the connection as stale and a call failing without
+            a communication problem pings the proxy before the error
+            is raised again
+
+        :param proxy: device proxy
+        :type proxy: :class:`tango.DeviceProxy`
+        :param method: proxy method
+        :type method: :obj:`instancemethod`
+        :param args: method arguments
+        :type args: :obj:`list` <`any`>
+        :returns: method result
+        :rtype: `any`
+        """
+        self.check(proxy)
+        try:
+            result = method(*args)
+        except tango.CommunicationFailed:
+            self.reset()
+            raise
+        except tango.DevFailed as e:
+            self.reset()
+            try:
+                self.check(proxy)
+            except Exception as pe:
+                logger.debug(str(pe))
+            raise e
+        self.touch()
+        return result
+
+    def counters(self):
+        """ provides ping counters
+
+        :returns: (name, value) dictionary with performed
+                  and avoided pings
+        :rtype: :obj:`dict` <:obj:`str`, :obj:`int`>
+        """
+        return {"pings": self.pings, "avoided": self.avoided}
+
+
+class StateWaiter(object):
+    """ waits until a device leaves the given state using state change
+        events or state queries with exponential backoff
+    """
+
+    def __init__(self, timeout=1.0, mindelay=0.01, maxdelay=0.5):
+        """ constructor
+
+        :param timeout: maximal waiting time in seconds
+        :type timeout: :obj:`float`
+        :param mindelay: first delay between state queries in seconds
+        :type mindelay: :obj:`float`
+        :param maxdelay: maximal delay between state queries in seconds
+        :type maxdelay: :obj:`float`
+        """
+        #: (:obj:`float`) maximal waiting time in seconds
+        self.timeout = timeout
+        #: (:obj:`float`) first delay between state queries in seconds
+        self.mindelay = mindelay
+        #: (:obj:`float`) maximal delay between state queries in seconds
+        self.maxdelay = maxdelay
+        #: (:obj:`collections.deque` <(:obj:`float`, :obj:`int`)>) \
+        #:    (duration, state queries) of the last waits
+        self.waits = collections.deque(maxlen=100)
+
+    @classmethod
+    def __subscribe(cls, proxy, state, event):
+        """ subscribes state change events
+
+        :param proxy: device proxy
+        :type proxy: :class:`tango.DeviceProxy`
+        :param state: awaited state to leave
+        :type state: :class:`tango.DevState`
+        :param event: event set when the device leaves the state
+        :type event: :class:`threading.Event`
+        :returns: event id or None if events are not supported
+        :rtype: :obj:`int`
+        """
+        if not hasattr(proxy, "subscribe_event"):
+            return None
+
+        def changed(evt):
+            if not evt.err and evt.attr_value is not None \
+               and evt.attr_value.value != state:
+                event.set()
+
+        try:
+            return proxy.subscribe_event(
+                "State", tango.EventType.CHANGE_EVENT, changed)
+        except Exception as e:
+            logger.debug("State: polling: %s" % str(e))
+
+    def wait(self, proxy, state=None, timeout=None):
+        """ waits until the device leaves the given state or the timeout,
+            state change events are subscribed only if the first state
+            query returns the given state
+
+        :param proxy: device proxy
+        :type proxy: :class:`tango.DeviceProxy`
+        :param state: state to leave, default RUNNING
+        :type state: :class:`tango.DevState`
+        :param timeout: maximal waiting time in seconds
+        :type timeout: :obj:`float`
+        :returns: waiting time in seconds
+        :rtype: :obj:`float`
+        """
+        if state is None:
+            state = tango.DevState.RUNNING
+        start = time.time()
+        deadline = start + (self.timeout if timeout is None else timeout)
+        event = threading.Event()
+        eid = None
+        delay = self.mindelay
+        queries = 0
+        try:
+            while not event.is_set():
+                try:
+                    queries += 1
+                    if proxy.state() != state:
+                        break
+                except tango.DevFailed:
+                    if time.time() + delay >= deadline:
+                        raise
+                if queries == 1:
+                    eid = self.__subscribe(proxy, state, event)
+                remaining = deadline - time.time()
+                if remaining <= 0:
+                    break
+                event.wait(min(delay, remaining))
+                delay = min(2 * delay, self.maxdelay)
+        finally:
+            if eid is not None:
+                try:
+                    proxy.unsubscribe_event(eid)
+                except Exception as e:
+                    logger.debug(str(e))
+            duration = time.time() - start
+            self.waits.append((duration, queries))
+            logger.debug("waited %.3f s with %s state queries"
+                         % (duration, queries))
+        return duration
+
 
 class SynchThread(Qt.QThread):
     """ thread with server command
@@ -102,6 +491,9 @@ class SynchThread(Qt.QThread):
     #: (:class:`taurus.qt.Qt.pyqtSignal') mg configuration changed
     mgconfchanged = Qt.pyqtSignal()
 
+    #: (:obj:`list` <:obj:`str`>) attributes with change event subscriptions
+    eventattributes = ["scanID", "profileConfiguration"]
+
     def __init__(self, serverstate, server, mutex):
         """constructor
         :param serverstate: ServerState
@@ -110,6 +502,9 @@ class SynchThread(Qt.QThread):
         :type server: :obj:`str`
         """
         Qt.QThread.__init__(self, serverstate)
+        #: (:class:`threading.Event`) wakes up the thread
+        self.__wake = threading.Event()
+
         #: (:obj:`bool`) server is running
         self.running = True
 
@@ -122,69 +517,227 @@ class SynchThread(Qt.QThread):
         #: (:obj:`str`) server name
         self.__serverstate = serverstate
 
+        #: (:obj:`float`) minimal polling interval in seconds
+        self.mininterval = 1.
+        #: (:obj:`float`) maximal polling interval in seconds
+        self.maxinterval = 20.
+        #: (:obj:`float`) polling interval after (re)start in seconds
+        self.interval = 5.
+
         #: (:obj:`int`) last scan id
         self.__lastscanid = 0
         #: (:obj:`str`) last mntgrp configuration
         self.__lastmg = ""
         #: (:obj:`str`) last profile configuration
         self.__lastprof = ""
+        #: (:obj:`dict` <:obj:`str`, (`any`, :obj:`str`)>) \
+        #:    sections of the last mntgrp configuration
+        self.__lastmgsections = None
+        #: (:obj:`dict` <:obj:`str`, (`any`, :obj:`str`)>) \
+        #:    sections of the last profile configuration
+        self.__lastprofsections = None
+
+        #: (:obj:`dict` <:obj:`str`, :obj:`int`>) event subscription ids
+        self.__eventids = {}
+        #: (:obj:`dict` <:obj:`str`, `any`>) attribute values from events
+        self.__eventvalues = {}
 
         self.__dp = None
         if self.server and self.server != 'module':
-            self.__dp = tango.DeviceProxy(self.server)
+            self.__dp = pool.get(self.server, "SynchThread")
             self.__dp.set_source(tango.DevSource.DEV)
             self.__lastscanid = self.__dp.scanID
             self.__lastmg = self.__dp.mntGrpConfiguration()
             self.__lastprof = self.__dp.profileConfiguration
 
+    def __getRunning(self):
+        """ getter for running flag
+
+        :returns: if thread should be running
+        :rtype: :obj:`bool`
+        """
+        return self.__running
+
+    def __setRunning(self, status):
+        """ setter for running flag, which wakes up the stopped thread
+
+        :param status: running status
+        :type status: :obj:`bool`
+        """
+        self.__running = status
+        if not status:
+            self.__wake.set()
+
+    #: (:obj:`bool`) server is running
+    running = property(__getRunning, __setRunning,
+                       doc='server is running')
+
     def restart(self):
         with Qt.QMutexLocker(self.mutex):
             self.server = str(self.__serverstate.server) \
                 if self.__serverstate.server else None
         if self.server and self.server != 'module':
-            self.__dp = tango.DeviceProxy(self.server)
+            self.__dp = pool.get(self.server, "SynchThread")
             self.__dp.set_source(tango.DevSource.DEV)
             self.__lastscanid = self.__dp.scanID
             self.__lastmg = self.__dp.mntGrpConfiguration()
             self.__lastprof = self.__dp.profileConfiguration
+        self.__lastmgsections = None
+        self.__lastprofsections = None
         self.running = True
+        self.__wake.clear()
         self.start()
 
+    def __eventReceived(self, event):
+        """ change event callback which wakes up the thread
+
+        :param event: tango event data
+        :type event: :class:`tango.EventData`
+        """
+        if event.err or event.attr_value is None:
+            return
+        name = event.attr_name.split("/")[-1]
+        for attr in self.eventattributes:
+            if attr.lower() == name.lower():
+                self.__eventvalues[attr] = event.attr_value.value
+                self.__wake.set()
+
+    def __subscribe(self):
+        """ subscribes change events of the server attributes if supported
+        """
+        self.__eventids = {}
+        self.__eventvalues = {}
+        if not hasattr(self.__dp, "subscribe_event"):
+            return
+        for attr in self.eventattributes:
+            try:
+                self.__eventids[attr] = self.__dp.subscribe_event(
+                    attr, tango.EventType.CHANGE_EVENT,
+                    self.__eventReceived)
+            except Exception as e:
+                logger.debug("%s: polling: %s" % (attr, str(e)))
+
+    def __unsubscribe(self):
+        """ unsubscribes change events of the server attributes
+        """
+        for eid in self.__eventids.values():
+            try:
+                self.__dp.unsubscribe_event(eid)
+            except Exception as e:
+                logger.debug(str(e))
+        self.__eventids = {}
+
+    def __read(self, attr):
+        """ provides the attribute value from events or reads it
+
+        :param attr: attribute name
+        :type attr: :obj:`str`
+        :returns: attribute value
+        :rtype: `any`
+        """
+        if attr in self.__eventids:
+            return self.__eventvalues.pop(attr, None)
+        return getattr(self.__dp, attr)
+
+    def __mgChanged(self, checker, mg, prof):
+        """ compares sections of the new and the last configurations
+            and stores the new ones, only sections with changed raw values
+            are normalized
+
+        :param checker: configuration checker
+        :type checker: :class:`Checker`
+        :param mg: mntgrp configuration
+        :type mg: :obj:`str`
+        :param prof: profile configuration
+        :type prof: :obj:`str`
+        :returns: if configuration has semantically changed
+        :rtype: :obj:`bool`
+        """
+        status = False
+        if self.__lastmg != mg:
+            if self.__lastmgsections is None:
+                self.__lastmgsections = checker.sections(self.__lastmg)
+            sections = checker.sections(mg, self.__lastmgsections)
+            status = not checker.compSections(
+                self.__lastmgsections, sections)
+            self.__lastmg = mg
+            self.__lastmgsections = sections
+        if self.__lastprof != prof:
+            if self.__lastprofsections is None:
+                self.__lastprofsections = checker.sections(
+                    self.__lastprof, sort=True)
+            sections = checker.sections(
+                prof, self.__lastprofsections, True)
+            status = not checker.compSections(
+                self.__lastprofsections, sections) or status
+            self.__lastprof = prof
+            self.__lastprofsections = sections
+        return status
+
     def run(self):
         """ runs synch thread
         """
         insynch = True
         checker = Checker()
+        interval = self.interval
+        if self.__dp:
+            self.__subscribe()
         while insynch:
-            self.sleep(5)
+            woken = self.__wake.wait(interval)
+            self.__wake.clear()
+            changed = False
             try:
                 if not Qt or not self.__dp:
                     break
-                scanid = self.__dp.scanID
-                mg = self.__dp.mntGrpConfiguration()
-                prof = self.__dp.profileConfiguration
+                with Qt.QMutexLocker(self.mutex):
+                    if not self.running:
+                        insynch = False
+                        break
+                scanid = self.__read("scanID")
+                if scanid is None:
+                    scanid = self.__lastscanid
+                prof = self.__read("profileConfiguration")
+                # mntGrpConfiguration is a command without change events,
+                # so it is polled only on timeouts or with a changed profile
+                if not woken or prof is not None or \
+                   "profileConfiguration" not in self.__eventids:
+                    mg = self.__dp.mntGrpConfiguration()
+                else:
+                    mg = self.__lastmg
+                if prof is None:
+                    prof = self.__lastprof
                 with Qt.QMutexLocker(self.mutex):
                     if not self.running:
                         insynch = False
                 if self.__lastscanid != scanid and insynch:
                     self.scanidchanged.emit()
                     self.__lastscanid = scanid
+                    changed = True
                 if (self.__lastmg != mg or self.__lastprof != prof) \
                    and insynch:
-                    m0 = json.loads(self.__lastmg)
-                    m1 = json.loads(mg)
-                    if not checker.compDict(m0, m1):
+                    changed = True
+                    if self.__mgChanged(checker, mg, prof):
                         self.mgconfchanged.emit()
-                    else:
-                        p0 = json.loads(self.__lastprof)
-                        p1 = json.loads(prof)
-                        if not checker.compDict(p0, p1, True):
-                            self.mgconfchanged.emit()
-
-                    self.__lastmg = mg
-                    self.__lastprof = prof
             except Exception:
                 """ what is wrong """
+            interval = self.nextInterval(interval, changed)
+        if self.__dp:
+            self.__unsubscribe()
+
+    def nextInterval(self, interval, changed):
+        """ provides the next polling interval which tightens after
+            a change and backs off when nothing changes
+
+        :param interval: current polling interval in seconds
+        :type interval: :obj:`float`
+        :param changed: if the server data have changed
+        :type changed: :obj:`bool`
+        :returns: next polling interval in seconds
+        :rtype: :obj:`float`
+        """
+        if changed:
+            return self.mininterval
+        return min(max(interval, self.mininterval) * 2, self.maxinterval)
 
 
 class ServerState(Qt.QObject):
@@ -193,6 +746,20 @@ class ServerState(Qt.QObject):
     #: (:class:`taurus.qt.Qt.pyqtSignal`) server changed signal
     serverChanged = Qt.pyqtSignal()
 
+    #: (:class:`StateWaiter`) waiter for leaving the RUNNING state
+    waiter = StateWaiter()
+
+    #: (:obj:`dict` <:obj:`str`, (:obj:`str`, :obj:`str`, :obj:`bool`)>) \
+    #:    attributes loaded on first access: (command, argin, \
+    #:    encoded or None for dictionaries)
+    lazyfields = {
+        "fullnames": ("fullDeviceNames", None, None),
+        "admindata": ("administratorDataNames", None, False),
+        "motors": ("poolElementNames", 'MotorList', False),
+        "acqchannels": ("poolElementNames", 'AcqChannelList', False),
+        "ioregisters": ("poolElementNames", 'IORegisterList', False),
+    }
+
     def __init__(self, server=None):
         """ constructor
 
@@ -219,6 +786,38 @@ class ServerState(Qt.QObject):
         #:     profile server configuration
         self.__conf = {}
 
+        #: (:class:`JSONCache`) parsed profile configuration records
+        self.__jcache = JSONCache(64)
+        #: (:obj:`list` <:obj:`str`>) profile records with flat dictionaries
+        self.__flatrecords = [
+            "ComponentSelection", "DataSourceSelection",
+            "ComponentPreselection", "DataSourcePreselection"]
+
+        #: (:obj:`str`) profile configuration last fetched or stored
+        self.__profile = None
+        #: (:obj:`bool`) profile configuration has been changed
+        self.__confdirty = False
+
+        #: (:obj:`bool`) send independent fetch commands concurrently
+        self.bulkfetch = True
+
+        #: (:obj:`float`) maximal time of checking door states in seconds
+        self.doortimeout = 3.0
+
+        #: (:class:`nxsselector.SnapshotCache.SnapshotCache`) \
+        #:    on-disk snapshots of fetched settings or None
+        self.snapshots = SnapshotCache()
+        #: (:obj:`bool`) if the current settings were loaded from a snapshot
+        self.snapshotloaded = False
+        #: (:obj:`dict` <:obj:`str`, `any`>) applied server data
+        self.__snapshot = None
+        #: (:obj:`str`, :obj:`dict` <:obj:`str`, `any`>) \
+        #:    revalidated profile configuration and server data
+        self.__revalidated = None
+
+        #: (:class:`ProxyHealth`) connection health of the selector server
+        self.health = ProxyHealth()
+
         self.findServer(server)
 
         #: (:obj:`list`<:obj:`str`>) tango database
@@ -255,8 +854,35 @@ class ServerState(Qt.QObject):
         #: (:obj:`str`) default dynamic nexus path
         self.dynamicPath = None
 
-        #: (:obj:`dict` <:obj:`str` , :obj:`bool` or `None`>) \
+        #: (:obj:`int`) version increased on each selection modification
+        self.selectionversion = 0
+        #: (:obj:`int`) version increased on each display modification
+        self.displayversion = 0
+        #: (:obj:`int`) version increased when disable datasources \
+        #:    or properties have to be recomputed
+        self.__stateversion = 0
+        #: (:obj:`bool`) if disable datasources have to be recomputed
+        self.__ddsdirty = True
+        #: (:class:`nxsselector.DescriptionIndex.DescriptionIndex`) \
+        #:    inverted index of element description
+        self.descindex = DescriptionIndex()
+        #: (:class:`nxsselector.DescriptionIndex.DisabledDataSources`) \
+        #:    incrementally maintained disable datasources
+        self.__ddsowners = DisabledDataSources(self.descindex)
+        #: (:obj:`bool`) if disable datasources have to be recomputed
+        self.__ddsstale = True
+        #: (:obj:`frozenset` <:obj:`str`>) mandatory and preselected \
+        #:    components used for disable datasources
+        self.__ddsextra = frozenset()
+        #: (:class:`nxsselector.SelectionDict.SelectionDict`) \
         #:    datasource selection
+        self.__dsgroup = None
+        #: (:class:`nxsselector.SelectionDict.SelectionDict`) \
+        #:    detector component selection
+        self.__cpgroup = None
+        #: (:class:`nxsselector.SelectionDict.SelectionDict`) \
+        #:    description component selection
+        self.__acpgroup = None
         self.dsgroup = {}
         #: (:obj:`dict` <:obj:`str` , :obj:`str`>) device labels
         self.labels = {}
@@ -265,11 +891,7 @@ class ServerState(Qt.QObject):
         self.properties = {}
         #: (:obj:`list`<:obj:`str`>) list of non-plotted devices
         self.nodisplay = []
-        #: (:obj:`dict` <:obj:`str` , :obj:`bool` or `None`>) \
-        #:    detector component selection
         self.cpgroup = {}
-        #: (:obj:`dict` <:obj:`str` , :obj:`bool` or `None`>) \
-        #:    description component selection
         self.acpgroup = {}
         #: (:obj:`list`<:obj:`str`>) selected description components
         self.acplist = []
@@ -281,11 +903,19 @@ class ServerState(Qt.QObject):
         #:        :obj:`list` <(:obj:`str`, :obj:`str`, :obj:`str`, \
         #:        :obj:`str`, :obj:`list` <:obj:`int`>)> > > ] ) \
         #: element description
-        self.description = []
+        self.__description = []
         #: (:obj:`list`<:obj:`str`>) available components
         self.avcplist = []
         #: (:obj:`list`<:obj:`str`>) available datasources
         self.avdslist = []
+        #: (:obj:`list` <:class:`nxsselector.DescriptionIndex.\
+        #:    DataSourceRecord`>) parsed datasource descriptions
+        self.dsrecords = []
+        #: (:obj:`dict` <:obj:`str`, :obj:`list` <:obj:`str`>>) \
+        #:    datasource names of datasource types
+        self.dstypes = {}
+        #: (:obj:`list`<:obj:`str`>) JSON datasource descriptions
+        self.__dsdescription = []
         #: (:obj:`list`<:obj:`str`>) available measurement groups
         self.avmglist = []
         #: (:obj:`dict` <:obj:`str`, :obj:`list` <:obj:`str` >>) \
@@ -297,8 +927,15 @@ class ServerState(Qt.QObject):
         #: (:obj:`dict` <:obj:`str` , :obj:`bool` or `None`>) \
         #:    init (descriptive) datasource selection
         self.idsgroup = {}
-        #: (:obj:`list`<:obj:`str`>) administrator data key names
-        self.admindata = []
+        #: (:class:`nxsselector.Element.ElementRegistry`) elements \
+        #:    reused by the views
+        self.elements = ElementRegistry(self)
+        #: (:obj:`dict` <:obj:`str`, `any`>) values of lazy attributes
+        self.__lazy = {}
+        #: (:class:`threading.Lock`) lazy attributes lock
+        self.__lazylock = threading.Lock()
+        #: (:obj:`int`) generation of lazy attributes
+        self.__lazygeneration = 0
 
         #: (:obj:`list`<:obj:`str`>) ordered pool channels
         self.orderedchannels = []
@@ -308,8 +945,6 @@ class ServerState(Qt.QObject):
         #: (:obj:`dict` <:obj:`str` , `any`>) (name, value) \
         #:     user data dictionary
         self.datarecord = {}
-        #: (:obj:`dict` <:obj:`str` , :obj:`str`>) full device names
-        self.fullnames = {}
 
         #: (:obj:`dict` <:obj:`str` , :obj:`bool`>) label links
         self.labellinks = {}
@@ -329,12 +964,14 @@ class ServerState(Qt.QObject):
         self.notimerresctriction = False
 
         self.ddsdirty = True
-        self.__ddsbackup = {}
+        #: (:class:`types.MappingProxyType`) read-only view of \
+        #:    the last computed disable datasources
+        self.__ddsbackup = MappingProxyType({})
 
         try:
             self.setServer()
             if self.server:
-                self.__dp.ping()
+                self.health.check(self.__dp)
         except Exception:
             self.server = None
             raise
@@ -349,34 +986,6 @@ class ServerState(Qt.QObject):
         self.extrachannelprops = ["synchronizer", "synchronization"]
         self.synchthread = SynchThread(self, self.server, self.mutex)
 
-    def __grepServer(self):
-        """ provides the local selector server device name
-
-        :returns: selector server device name
-        :rtype: :obj:`str`
-        """
-        server = None
-        try:
-            pipe = subprocess.Popen("ps -ef | grep 'NXSRecSelecto'",
-                                    stdout=subprocess.PIPE,
-                                    shell=True, bufsize=10000).stdout
-            res = pipe.read().split("\n")
-            cres = [r for r in res if 'NXSRecSelector' in r]
-            mi = 0
-            if len(cres) > 0:
-                command = cres[0].split()
-                for i in range(len(command)):
-                    if 'NXSRecSelector' in command[i]:
-                        mi = i
-                        break
-                if len(command) > mi + 1:
-                    instance = command[mi + 1]
-                    server = self.__db.get_device_class_list(
-                        "NXSRecSelector/%s" % instance).value_string[2]
-        except Exception:
-            pass
-        return server
-
     def findServer(self, server=None):
         """  sets the existing NXSRecSelector server
 
@@ -384,17 +993,9 @@ class ServerState(Qt.QObject):
         :type server: :obj:`str`
         """
         if server is None:
-            servers = self.__db.get_device_exported_for_class(
-                "NXSRecSelector").value_string
-            if len(servers):
-                if len(servers) > 1:
-                    gserver = self.__grepServer()
-                    if gserver in servers:
-                        self.server = str(gserver)
-                else:
-                    self.server = str(servers[0])
-            else:
-                self.server = None
+            found, fserver = discovery.find(self.__db)
+            if found:
+                self.server = fserver
         elif not server:
             self.server = None
         else:
@@ -413,8 +1014,10 @@ class ServerState(Qt.QObject):
         if not self.__dp:
             self.setServer()
         if not self.server:
-            self.__dp.exportEnvProfile()
-        self.__conf = json.loads(self.__dp.profileConfiguration)
+            self.__command(self.__dp, "exportEnvProfile")
+        self.__profile = self.__readProfile()
+        self.__conf = dict(self.__jcache.loads(self.__profile))
+        self.__confdirty = False
 
     def createDataSources(self, datasources):
         """ creates new datasources
@@ -442,13 +1045,15 @@ class ServerState(Qt.QObject):
             maxcount = 10
             while error and maxcount:
                 try:
-                    dc = self.__dp.read_attribute("descriptionErrors").value
+                    dc = self.__call(
+                        "read:descriptionErrors", self.__dp.read_attribute,
+                        "descriptionErrors").value
                     error = False
                 except Exception as e:
                     logger.warning(str(e))
                 maxcount -= 1
         else:
-            dc = getattr(self.__dp, "descriptionErrors")
+            dc = self.__read("descriptionErrors")
         logger.debug(dc)
         self.errors = []
         if dc:
@@ -460,6 +1065,7 @@ class ServerState(Qt.QObject):
     def setProperties(self):
         """ sets label properties from properties
         """
+        self.__stateversion += 1
         if "label" in self.properties:
             self.labels = self.properties["label"]
         else:
@@ -508,48 +1114,187 @@ class ServerState(Qt.QObject):
         """ fetches configuration setting from server
         """
         self.__fetchConfiguration()
+        self.__importSettings()
+        data = self.__fetchServerData()
+        self.__applyServerData(data)
+        self.__revalidated = None
+        self.snapshotloaded = False
+        self.__saveSnapshot(data)
+
+    def loadSettings(self):
+        """ loads settings from the snapshot of the current server
+            configuration or fetches them from the server
+
+        :returns: if the snapshot was loaded
+        :rtype: :obj:`bool`
+        """
+        try:
+            if self.loadSnapshot():
+                return True
+        except Exception as e:
+            logger.warning("Cannot load snapshot: %s" % str(e))
+        self.fetchSettings()
+        return False
+
+    def loadSnapshot(self):
+        """ loads settings from the snapshot of the current server
+            configuration if it exists
+
+        :returns: if the snapshot was loaded
+        :rtype: :obj:`bool`
+        """
+        if not self.snapshots:
+            return False
+        self.__fetchConfiguration()
+        if not self.server:
+            return False
+        data = self.snapshots.load(self.server, self.__snapshotKey())
+        if not isinstance(data, dict):
+            return False
+        # scan variables, e.g. ScanID, are never taken from the snapshot
+        data = dict(data)
+        data["scanEnvVariables"] = self.__command(
+            self.__dp, "scanEnvVariables")
+        self.__importSettings()
+        self.__applyServerData(data)
+        self.__revalidated = None
+        self.snapshotloaded = True
+        logger.debug("settings loaded from snapshot")
+        return True
+
+    def revalidateSnapshot(self):
+        """ fetches the profile configuration and server data to compare
+            with the loaded snapshot without changing the current settings
+        """
+        profile = self.__readProfile()
+        self.__revalidated = (profile, self.__fetchServerData(True))
+
+    def applySnapshot(self):
+        """ applies revalidated profile configuration and server data
+            if they differ from the loaded ones. The scan ID is always
+            updated.
+
+        :returns: if settings were changed
+        :rtype: :obj:`bool`
+        """
+        if self.__revalidated is None:
+            return False
+        profile, data = self.__revalidated
+        self.__revalidated = None
+        self.__setEnvData(data["scanEnvVariables"], {"ScanID": "scanID"})
+        changed = self.__profile is None or profile != self.__profile
+        if changed:
+            self.__profile = profile
+            self.__conf = dict(self.__jcache.loads(profile))
+            self.__confdirty = False
+            self.__importSettings()
+        elif self.__snapshot is not None and \
+                self.__stableData(data) == self.__stableData(self.__snapshot):
+            return False
+        self.__applyServerData(data, changed)
+        self.__saveSnapshot(data)
+        return True
+
+    @classmethod
+    def __stableData(cls, data):
+        """ provides server data without volatile scan variables,
+            e.g. ScanID changed by every scan
+
+        :param data: (attribute, value) dictionary of server data
+        :type data: :obj:`dict` <:obj:`str`, `any`>
+        :returns: (attribute, value) dictionary of compared server data
+        :rtype: :obj:`dict` <:obj:`str`, `any`>
+        """
+        stable = dict(data)
+        try:
+            env = json.loads(stable.pop("scanEnvVariables", None) or "{}")
+        except Exception:
+            env = {}
+        if not isinstance(env, dict):
+            env = {}
+        stable["scanEnvVariables"] = dict(
+            (var, env.get(var)) for var in ["ScanDir", "ScanFile"])
+        return stable
+
+    def __snapshotKey(self):
+        """ provides snapshot key of the current server configuration
 
-        self.cpgroup = self.__importDict("ComponentSelection")
-        self.dsgroup = self.__importDict("DataSourceSelection")
-        self.acpgroup = self.__importDict("ComponentPreselection")
+        :returns: snapshot key
+        :rtype: :obj:`str`
+        """
+        return self.snapshots.key(
+            self.server, getattr(self.__dp, "version", ""), self.__profile)
+
+    def __saveSnapshot(self, data):
+        """ stores server data into the snapshot cache
+
+        :param data: server data
+        :type data: :obj:`dict` <:obj:`str`, `any`>
+        """
+        if self.snapshots and self.server and self.__profile is not None:
+            self.snapshots.save(self.server, self.__snapshotKey(), data)
+
+    def __importSettings(self):
+        """ imports settings from the profile configuration
+        """
+        self.__resetLazy()
+
+        self.cpgroup = self.__importDict("ComponentSelection", True)
+        self.dsgroup = self.__importDict("DataSourceSelection", True)
+        self.acpgroup = self.__importDict("ComponentPreselection", True)
         self.properties = self.__importDict("ChannelProperties")
         self.setProperties()
         self.datarecord = self.__importDict("UserData")
         self.configvars = self.__importDict("ConfigVariables")
 
         self.nodisplay = self.__importList("UnplottedComponents", True)
+        self.displayversion += 1
         self.orderedchannels = self.__importList("OrderedChannels", True)
         self.idsgroup = self.__importDict("DataSourcePreselection")
 
-        self.avcplist = self.__getList("availableComponents")
-        self.avdslist = self.__getList("availableDataSources")
-        self.dsdescription = self.__getList(
-            "dataSourceDescription", argin=self.avdslist)
-        self.avmglist = self.__getList("availableMntGrps")
-        self.mcplist = self.__getList("mandatoryComponents")
+    def __fetchServerData(self, readonly=False):
+        """ fetches server lists, device names and scan variables
 
-        self.acplist = self.__getList("preselectedComponents")
-        self.atlist = self.__getList("availableTimers")
+        :param readonly: if the server should not be written, e.g. to reset
+                         an invalid door during revalidation
+        :type readonly: :obj:`bool`
+        :returns: (attribute, value) dictionary of server data
+        :rtype: :obj:`dict` <:obj:`str`, `any`>
+        """
+        if self.bulkfetch:
+            data = self.__fetchServerLists()
+        else:
+            data = self.__getServerLists()
         try:
-            self.description = self.__getList("componentDescription", True)
-        except Exception as e:
-            logger.error(str(e))
+            data["door"] = str(self.__loadData("door"))
+        except Exception:
+            if readonly:
+                data["door"] = str(self.door or "")
+            else:
+                self.storeData("door", "")
+                data["door"] = str(self.__loadData("door"))
+        data["configDevice"] = str(self.__loadData("configDevice"))
+        data["scanEnvVariables"] = self.__command(
+            self.__dp, "scanEnvVariables")
+        return data
+
+    def __applyServerData(self, data, profile=True):
+        """ sets server lists, device names and scan variables
+
+        :param data: (attribute, value) dictionary of server data
+        :type data: :obj:`dict` <:obj:`str`, `any`>
+        :param profile: if file data should be imported from the profile
+        :type profile: :obj:`bool`
+        """
+        for attr, value in data.items():
+            if attr not in ["door", "configDevice", "scanEnvVariables"]:
+                setattr(self, attr, value)
         self.ddsdirty = True
-        self.mutedChannels = self.__getList("mutedChannels")
-
-        self.vrcpdict = self.__getDict("variableComponents")
-        self.fullnames = self.__getDict("fullDeviceNames")
-        self.admindata = self.__getList("administratorDataNames")
-
-        self.motors = self.__getList(
-            "poolElementNames", argin='MotorList')
-        self.acqchannels = self.__getList(
-            "poolElementNames", argin='AcqChannelList')
-        self.ioregisters = self.__getList(
-            "poolElementNames", argin='IORegisterList')
-
-        self.__fetchFileData()
-        self.fetchEnvData()
+        self.door = str(data["door"])
+        self.configDevice = str(data["configDevice"])
+        if profile:
+            self.__importFileData()
+        self.__setEnvData(data["scanEnvVariables"])
         if self.notimerresctriction:
             # old version to check
             self.atlist = list(set(self.atlist) | set(self.timers))
@@ -564,19 +1309,81 @@ class ServerState(Qt.QObject):
                 if cp not in self.cpvrdict.keys():
                     self.cpvrdict[cp] = set()
                 self.cpvrdict[cp].add(vr)
+        self.__snapshot = data
+
+    def __getServerLists(self):
+        """ fetches lists and dictionaries of the selection server commands
+            one after another
 
-    def __fetchFileData(self):
-        """ fetches file data configuration from the server
+        :returns: (attribute, value) dictionary
+        :rtype: :obj:`dict` <:obj:`str`, `any`>
         """
-        self.timers = self.__importList("Timer", True)
-        self.mntgrp = str(self.__importData("MntGrp"))
+        data = {}
+        data["avcplist"] = self.__getList("availableComponents")
+        data["avdslist"] = self.__getList("availableDataSources")
+        data["dsdescription"] = self.__getList(
+            "dataSourceDescription", argin=data["avdslist"])
+        data["avmglist"] = self.__getList("availableMntGrps")
+        data["mcplist"] = self.__getList("mandatoryComponents")
+
+        data["acplist"] = self.__getList("preselectedComponents")
+        data["atlist"] = self.__getList("availableTimers")
         try:
-            self.door = str(self.__loadData("door"))
-        except Exception:
-            self.storeData("door", "")
-            self.door = str(self.__loadData("door"))
+            data["description"] = self.__getList(
+                "componentDescription", True)
+        except Exception as e:
+            logger.error(str(e))
+        data["mutedChannels"] = self.__getList("mutedChannels")
+
+        data["vrcpdict"] = self.__getDict("variableComponents")
+        return data
+
+    def __fetchServerLists(self):
+        """ fetches lists and dictionaries of the selection server commands
+            sending independent commands concurrently
 
-        self.configDevice = str(self.__loadData("configDevice"))
+        :returns: (attribute, value) dictionary
+        :rtype: :obj:`dict` <:obj:`str`, `any`>
+        """
+        # (attribute, command, argin, encoded or None for dictionaries)
+        commands = [
+            ("avcplist", "availableComponents", None, False),
+            ("avdslist", "availableDataSources", None, False),
+            ("avmglist", "availableMntGrps", None, False),
+            ("mcplist", "mandatoryComponents", None, False),
+            ("acplist", "preselectedComponents", None, False),
+            ("atlist", "availableTimers", None, False),
+            ("description", "componentDescription", None, True),
+            ("mutedChannels", "mutedChannels", None, False),
+            ("vrcpdict", "variableComponents", None, None),
+        ]
+        results = self.__bulkCommands(
+            [(name, argin) for _, name, argin, _ in commands])
+        data = {}
+        for (attr, name, _, encoded), dc in zip(commands, results):
+            try:
+                if isinstance(dc, Exception):
+                    raise dc
+                if encoded is None:
+                    value = self.__toDict(name, dc)
+                else:
+                    value = self.__toList(name, dc, encoded)
+            except Exception as e:
+                if attr != "description":
+                    raise
+                logger.error(str(e))
+                continue
+            data[attr] = value
+
+        data["dsdescription"] = self.__getList(
+            "dataSourceDescription", argin=data["avdslist"])
+        return data
+
+    def __importFileData(self):
+        """ imports file data configuration from the profile configuration
+        """
+        self.timers = self.__importList("Timer", True)
+        self.mntgrp = str(self.__importData("MntGrp"))
         self.writerDevice = str(self.__importData("WriterDevice"))
 
         self.appendEntry = self.__importData("AppendEntry")
@@ -586,14 +1393,23 @@ class ServerState(Qt.QObject):
     def fetchEnvData(self, params=None):
         """ fetches scan variables from the server
         """
-        params = params or {"ScanDir": "scanDir",
-                            "ScanFile": "scanFile",
-                            "ScanID": "scanID"}
-
         if not self.__dp:
             self.setServer()
 
         jvalue = self.__command(self.__dp, "scanEnvVariables")
+        self.__setEnvData(jvalue, params)
+
+    def __setEnvData(self, jvalue, params=None):
+        """ sets scan variables
+
+        :param jvalue: JSON scan variables
+        :type jvalue: :obj:`str`
+        :param params: (variable, attribute) dictionary
+        :type params: :obj:`dict` <:obj:`str`, :obj:`str`>
+        """
+        params = params or {"ScanDir": "scanDir",
+                            "ScanFile": "scanFile",
+                            "ScanID": "scanID"}
         value = json.loads(jvalue)
 
         for var, attr in params.items():
@@ -669,22 +1485,30 @@ class ServerState(Qt.QObject):
         self.__exportDict("UserData", self.datarecord)
         self.__exportDict("ConfigVariables", self.configvars)
         if not self.server:
-            self.__dp.exportEnvProfile()
+            self.__command(self.__dp, "exportEnvProfile")
         self.__storeConfiguration()
 
     def __storeConfiguration(self):
-        """ stores profile configuration on the server"""
+        """ stores profile configuration on the server
+            if it differs from the current server profile
+        """
         if not self.__dp:
             self.setServer()
-        self.__dp.profileConfiguration = str(json.dumps(self.__conf))
+        if self.__confdirty or self.__profile is None:
+            self.__profile = str(json.dumps(self.__conf))
+            self.__confdirty = False
+        # the server profile can be changed by other clients or macros
+        if self.__profile != self.__readProfile():
+            self.__writeProfile(self.__profile)
         if not self.server:
-            self.__dp.exportEnvProfile()
+            self.__command(self.__dp, "exportEnvProfile")
 
     def fetchMntGrp(self):
         """ fetches mntgrp and profile from the server
         """
         if not self.__dp:
             self.setServer()
+        self.__profile = None
         self.__command(self.__dp, "fetchProfile")
 
     def switchMntGrp(self):
@@ -692,6 +1516,7 @@ class ServerState(Qt.QObject):
         """
         if not self.__dp:
             self.setServer()
+        self.__profile = None
         self.__command(self.__dp, "switchProfile")
 
     def updateMntGrp(self):
@@ -704,6 +1529,7 @@ class ServerState(Qt.QObject):
         if not self.scanDir:
             raise Exception("ScanDir not defined")
         self.storeSettings()
+        self.__profile = None
         mgconf = self.__command(self.__dp, "updateMntGrp")
         conf = {}
         conf['MntGrpConfigs'] = {}
@@ -720,10 +1546,10 @@ class ServerState(Qt.QObject):
         if not self.__dp:
             self.setServer()
         mgconf = json.loads(self.__command(self.__dp, "mntGrpConfiguration"))
-        locmgconf = self.__importDict("MntGrpConfiguration")
+        locmgconf = self.__importDict("MntGrpConfiguration", True)
         checker = Checker()
         if checker.compDict(mgconf, locmgconf):
-            pconf = json.loads(self.__dp.profileConfiguration)
+            pconf = self.__jcache.loads(self.__readProfile())
             locpconf = self.__conf
             return checker.compDict(pconf, locpconf, True)
         return False
@@ -733,6 +1559,7 @@ class ServerState(Qt.QObject):
         """
         if not self.__dp:
             self.setServer()
+        self.__profile = None
         return self.__command(self.__dp, "importMntGrp")
 
     def createConfiguration(self):
@@ -753,6 +1580,7 @@ class ServerState(Qt.QObject):
         """
         if not self.__dp:
             self.setServer()
+        self.__profile = None
         self.__command(self.__dp, "deleteProfile", str(name))
         self.avmglist = self.__getList("availableMntGrps")
         if self.avmglist:
@@ -783,7 +1611,7 @@ class ServerState(Qt.QObject):
         conf['MntGrpConfigs'] = {}
         conf['ActiveMntGrp'] = self.mntgrp
         conf['MntGrpConfigs'][self.mntgrp] = \
-            self.__importDict("MntGrpConfiguration")
+            self.__importDict("MntGrpConfiguration", True)
         return json.dumps(conf)
 
     def getConfiguration(self):
@@ -793,7 +1621,7 @@ class ServerState(Qt.QObject):
         :rtype: :obj:`str`
         """
         self.storeSettings()
-        return self.__dp.profileConfiguration
+        return self.__readProfile()
 
     def setConfiguration(self, conf):
         """ sets profile configuration
@@ -801,13 +1629,15 @@ class ServerState(Qt.QObject):
         :param conf: profile configuration
         :type conf: :obj:`str`
         """
-        self.__dp.profileConfiguration = conf
+        self.__profile = None
+        self.__writeProfile(conf)
         self.__command(self.__dp, "updateMntGrp")
         self.fetchSettings()
 
     def resetDescriptions(self):
         """ resets description components to default values
         """
+        self.__profile = None
         if hasattr(self.__dp, "command_inout_asynch"):
             # aid = self.__dp.command_inout_asynch("PreselectComponents")
             # self.__wait(self.__dp)
@@ -825,6 +1655,7 @@ class ServerState(Qt.QObject):
         """ update description component selection accoriding
              to its device state
         """
+        self.__profile = None
         if hasattr(self.__dp, "command_inout_asynch"):
             # aid = self.__dp.command_inout_asynch("PreselectComponents")
             # self.__wait(self.__dp)
@@ -841,8 +1672,10 @@ class ServerState(Qt.QObject):
     def setServer(self):
         """ sets the selector server
         """
+        self.health.reset()
+        self.elements.clear()
         if self.server:
-            self.__dp = self.__openProxy(self.server)
+            self.__dp = self.__openProxy(self.server, "ServerState")
             self.__dp.set_source(tango.DevSource.DEV)
             self.__dp.set_timeout_millis(self.__timeout)
             logger.debug("set server: %s:%s/%s" % (self.__dp.get_db_host(),
@@ -852,7 +1685,7 @@ class ServerState(Qt.QObject):
             from nxsrecconfig import Settings
             self.__dp = Settings.Settings()
         if not hasattr(self.__dp, "version") or \
-           int(str(self.__dp.version).split(".")[0]) < 2:
+           int(str(self.__read("version")).split(".")[0]) < 2:
             raise Exception("NXSRecSelector (%s) version below 2.0.0" %
                             (self.server or "module"))
 
@@ -867,7 +1700,7 @@ class ServerState(Qt.QObject):
         if not self.__dp:
             self.setServer()
         if hasattr(self.__dp, "macroServer"):
-            ms = str(self.__dp.macroServer)
+            ms = str(self.__read("macroServer"))
             if ms:
                 if ':' not in ms and hasattr(self.__dp, "get_db_host"):
                     ms = "%s:%s/%s" % (self.__dp.get_db_host(),
@@ -902,7 +1735,7 @@ class ServerState(Qt.QObject):
             self.setServer()
         status = False
         if hasattr(self.__dp, "macroServer"):
-            ms = str(self.__dp.macroServer)
+            ms = str(self.__read("macroServer"))
             if ms:
                 if ':' not in ms and hasattr(self.__dp, "get_db_host"):
                     ms = "%s:%s/%s" % (self.__dp.get_db_host(),
@@ -911,24 +1744,77 @@ class ServerState(Qt.QObject):
 
                 msp = self.__openProxy(ms)
                 doors = msp.doorList
-                for door in doors:
-                    dp = tango.DeviceProxy(door)
-                    if dp.state() == tango.DevState.RUNNING:
+                status = self.__anyRunning(doors, self.doortimeout)
+        return status
 
-                        status = True
-                        break
+    @classmethod
+    def __anyRunning(cls, devices, timeout):
+        """ checks concurrently if any device is in the RUNNING state
+
+        :param devices: device names
+        :type devices: :obj:`list` <:obj:`str`>
+        :param timeout: maximal checking time in seconds
+        :type timeout: :obj:`float`
+        :returns: if any device is running
+        :rtype: :obj:`bool`
+        """
+        deadline = time.time() + timeout
+        pending = []
+        for device in devices:
+            dp = pool.get(device)
+            if not hasattr(dp, "read_attribute_asynch"):
+                if dp.state() == tango.DevState.RUNNING:
+                    return True
+                continue
+            try:
+                pending.append(
+                    (device, dp, dp.read_attribute_asynch("State")))
+            except tango.DevFailed as e:
+                logger.warning("%s: %s" % (device, str(e)))
+        status = False
+        while pending and not status:
+            waiting = []
+            while pending:
+                device, dp, aid = pending.pop(0)
+                try:
+                    value = dp.read_attribute_reply(aid).value
+                except tango.AsynReplyNotArrived:
+                    waiting.append((device, dp, aid))
+                    continue
+                except tango.DevFailed as e:
+                    logger.warning("%s: %s" % (device, str(e)))
+                    continue
+                if value == tango.DevState.RUNNING:
+                    status = True
+                    break
+            pending = waiting + pending
+            if pending and not status:
+                if time.time() >= deadline:
+                    logger.warning(
+                        "State of %s not read within %s s"
+                        % (", ".join([pd[0] for pd in pending]), timeout))
+                    break
+                time.sleep(0.005)
+        for _, dp, aid in pending:
+            try:
+                dp.cancel_asynch_request(aid)
+            except Exception as e:
+                logger.debug(str(e))
         return status
 
     @classmethod
-    def __openProxy(cls, server):
+    def __openProxy(cls, server, owner=None):
         """ creates device proxy
 
         :param server: server name
         :type server: :obj:`str`
+        :param owner: owner of a proxy with its own source and timeout
+                      or None for the shared proxy
+        :type owner: :obj:`str`
         :returns: server device proxy
         :rtype: :class:`tango.DeviceProxy`
         """
-        proxy = tango.DeviceProxy(server)
+        proxy = pool.get(server, owner)
         cls.__wait(proxy)
         return proxy
 
@@ -945,50 +1831,87 @@ class ServerState(Qt.QObject):
         :rtype: `any`
 
         """
+        name = "command:%s" % command
         if not hasattr(server, "command_inout"):
-            return getattr(server, command)(*var)
-        elif var is None:
-            return server.command_inout(command)
+            return stats.call(name, getattr(server, command), *var)
         else:
-            return server.command_inout(command, *var)
+            return stats.call(name, server.command_inout, command, *var)
+
+    def __call(self, name, method, *args):
+        """ calls the server proxy method recording its timing statistics
+
+        :param name: call name
+        :type name: :obj:`str`
+        :param method: proxy method
+        :type method: :obj:`instancemethod`
+        :param args: method arguments
+        :type args: :obj:`list` <`any`>
+        :returns: method result
+        :rtype: `any`
+        """
+        return stats.call(name, self.health.call, self.__dp, method, *args)
+
+    def __read(self, name):
+        """ reads the server attribute recording its timing statistics
+
+        :param name: attribute name
+        :type name: :obj:`str`
+        :returns: attribute value
+        :rtype: `any`
+        """
+        return stats.call("read:%s" % name, getattr, self.__dp, name)
+
+    def __readProfile(self):
+        """ reads profile configuration from the server
+
+        :returns: JSON profile configuration
+        :rtype: :obj:`str`
+        """
+        return self.__read("profileConfiguration")
+
+    def __writeProfile(self, profile):
+        """ writes profile configuration into the server
+
+        :param profile: JSON profile configuration
+        :type profile: :obj:`str`
+        """
+        stats.call("write:profileConfiguration", setattr,
+                   self.__dp, "profileConfiguration", profile)
 
     @classmethod
-    def __wait(cls, proxy, counter=100):
+    def __wait(cls, proxy, timeout=None):
         """ waits for server until server is not in running state
 
         :param proxy: server proxy
         :type proxy: :class:`tango.DeviceProxy`
-        :param counter: maximum waiting timer in 0.01 sec
-                        (without command execution)
-        :type counter: :obj:`int`
-        """
-        found = False
-        cnt = 0
-        while not found and cnt < counter:
-            if cnt > 1:
-                time.sleep(0.01)
-            try:
-                if proxy.state() != tango.DevState.RUNNING:
-                    found = True
-            except tango.DevFailed:
-                time.sleep(0.01)
-                found = False
-                if cnt == counter - 1:
-                    raise
-            cnt += 1
+        :param timeout: maximum waiting time in seconds
+        :type timeout: :obj:`float`
+        :returns: waiting time in seconds
+        :rtype: :obj:`float`
+        """
+        return cls.waiter.wait(proxy, timeout=timeout)
 
-    def __importDict(self, name):
+    def __importDict(self, name, readonly=False):
         """ imports a dictionary variable from the profile configuration
 
         :param name: record name
         :type name: :obj:`str`
+        :param readonly: if the cached dictionary can be returned
+        :type readonly: :obj:`bool`
         :returns: returns dictionary
         :rtype: :obj:`dict` <`any`, `any`>
         """
         dsg = self.__conf[name] if name in self.__conf else None
         res = {}
         if dsg:
-            dc = json.loads(dsg)
+            if readonly:
+                dc = self.__jcache.loads(dsg)
+            elif name in self.__flatrecords:
+                dc = self.__jcache.loads(dsg)
+                if isinstance(dc, dict):
+                    dc = dict(dc)
+            else:
+                dc = json.loads(dsg)
             if isinstance(dc, dict):
                 res = dc
         logger.debug(" %s = %s" % (name, res))
@@ -1009,9 +1932,9 @@ class ServerState(Qt.QObject):
         res = []
         if dc:
             if encoded:
-                dc = json.loads(dc)
+                dc = self.__jcache.loads(dc)
             if isinstance(dc, (list, tuple)):
-                res = dc
+                res = list(dc)
         logger.debug(" %s = %s" % (name, res))
         return res
 
@@ -1039,10 +1962,10 @@ class ServerState(Qt.QObject):
         if not self.__dp:
             self.setServer()
         if self.server:
-            self.__dp.ping()
-            dsg = self.__dp.read_attribute(name).value
+            dsg = self.__call(
+                "read:%s" % name, self.__dp.read_attribute, name).value
         else:
-            dsg = getattr(self.__dp, name)
+            dsg = stats.call("read:%s" % name, getattr, self.__dp, name)
         res = {}
         if dsg:
             dc = json.loads(dsg)
@@ -1059,7 +1982,7 @@ class ServerState(Qt.QObject):
         :param value: returns dictionary
         :type value: :obj:`dict` <`any`, `any`>
         """
-        self.__conf[name] = json.dumps(value)
+        self.__exportJSON(name, value)
         logger.debug(" %s = %s" % (name, value))
 
     def __exportList(self, name, value):
@@ -1070,9 +1993,26 @@ class ServerState(Qt.QObject):
         :param value: returns dictionary
         :type value: :obj:`list` <`any`>
         """
-        self.__conf[name] = json.dumps(value)
+        self.__exportJSON(name, value)
         logger.debug(" %s = %s" % (name, value))
 
+    def __exportJSON(self, name, value):
+        """ writes a JSON encoded variable into the profile configuration
+            reusing its serialized form if the value has not changed
+
+        :param name: attribute name
+        :type name: :obj:`str`
+        :param value: variable value
+        :type value: `any`
+        """
+        old = self.__conf.get(name)
+        if old is not None and self.__jcache.equals(old, value):
+            return
+        jvalue = json.dumps(value)
+        if jvalue != old:
+            self.__conf[name] = jvalue
+            self.__confdirty = True
+
     def storeData(self, name, value):
         """ stores data into the configuration server attribute
 
@@ -1083,19 +2023,17 @@ class ServerState(Qt.QObject):
         """
         if not self.__dp:
             self.setServer()
-        if self.server:
-            self.__dp.ping()
-
         if self.server:
             try:
-                self.__dp.write_attribute(name, value)
+                self.__call("write:%s" % name,
+                            self.__dp.write_attribute, name, value)
             except tango.CommunicationFailed as e:
                 if e[-1].reason == "API_DeviceTimedOut":
                     self.__wait(self.__dp)
                 else:
                     raise
         else:
-            setattr(self.__dp, name, value)
+            stats.call("write:%s" % name, setattr, self.__dp, name, value)
         logger.debug(" %s = %s" % (name, value))
 
     def __exportData(self, name, value):
@@ -1106,7 +2044,9 @@ class ServerState(Qt.QObject):
         :param value: returns dictionary
         :type value: `any`
         """
-        self.__conf[name] = value
+        if name not in self.__conf or self.__conf[name] != value:
+            self.__conf[name] = value
+            self.__confdirty = True
         logger.debug(" %s = %s" % (name, value))
 
     def __loadList(self, name, encoded=False):
@@ -1122,10 +2062,10 @@ class ServerState(Qt.QObject):
         if not self.__dp:
             self.setServer()
         if self.server:
-            self.__dp.ping()
-            dc = self.__dp.read_attribute(name).value
+            dc = self.__call(
+                "read:%s" % name, self.__dp.read_attribute, name).value
         else:
-            dc = getattr(self.__dp, name)
+            dc = stats.call("read:%s" % name, getattr, self.__dp, name)
         logger.debug(dc)
         res = []
         if dc:
@@ -1147,10 +2087,10 @@ class ServerState(Qt.QObject):
         if not self.__dp:
             self.setServer()
         if self.server:
-            self.__dp.ping()
-            dc = self.__dp.read_attribute(name).value
+            dc = self.__call(
+                "read:%s" % name, self.__dp.read_attribute, name).value
         else:
-            dc = getattr(self.__dp, name)
+            dc = stats.call("read:%s" % name, getattr, self.__dp, name)
 
         logger.debug(dc)
         return dc
@@ -1170,18 +2110,37 @@ class ServerState(Qt.QObject):
         if not self.__dp:
             self.setServer()
         if self.server:
-            self.__dp.ping()
             if argin is None:
-                dc = self.__dp.command_inout(name)
+                dc = self.__call(
+                    "command:%s" % name, self.__dp.command_inout, name)
             else:
-                dc = self.__dp.command_inout(name, argin)
+                dc = self.__call(
+                    "command:%s" % name, self.__dp.command_inout, name,
+                    argin)
 
         else:
             if argin is None:
-                dc = getattr(self.__dp, name)()
+                dc = stats.call(
+                    "command:%s" % name, getattr(self.__dp, name))
             else:
-                dc = getattr(self.__dp, name)(argin)
+                dc = stats.call(
+                    "command:%s" % name, getattr(self.__dp, name), argin)
+
+        return self.__toList(name, dc, encoded)
 
+    @classmethod
+    def __toList(cls, name, dc, encoded=False):
+        """ converts a result of the selection server command into a list
+
+        :param name: record name
+        :type name: :obj:`str`
+        :param dc: command result
+        :type dc: `any`
+        :param encoded: if list should be encoded from JSON
+        :type encoded: :obj:`bool`
+        :returns: returns the command result list
+        :rtype: :obj:`list` <`any`>
+        """
         logger.debug(dc)
         res = []
         if dc:
@@ -1203,11 +2162,23 @@ class ServerState(Qt.QObject):
         if not self.__dp:
             self.setServer()
         if self.server:
-            self.__dp.ping()
-            dc = self.__dp.command_inout(name)
+            dc = self.__call(
+                "command:%s" % name, self.__dp.command_inout, name)
         else:
-            dc = getattr(self.__dp, name)()
+            dc = stats.call("command:%s" % name, getattr(self.__dp, name))
+        return self.__toDict(name, dc)
 
+    @classmethod
+    def __toDict(cls, name, dc):
+        """ converts a result of the selection server command into a dictionary
+
+        :param name: record name
+        :type name: :obj:`str`
+        :param dc: JSON command result
+        :type dc: :obj:`str`
+        :returns: returns the command result dictionary
+        :rtype: :obj:`dict` <`any`, `any`>
+        """
         logger.debug(dc)
         res = {}
         if dc:
@@ -1217,37 +2188,225 @@ class ServerState(Qt.QObject):
         logger.debug(" %s = %s" % (name, res))
         return res
 
+    def __bulkCommands(self, commands):
+        """ executes independent commands of the selection server
+            concurrently and gathers their results
+
+        :param commands: a list of (command name, input argument) tuples
+        :type commands: :obj:`list` <(:obj:`str`, `any`)>
+        :returns: a list of command results or raised exceptions
+        :rtype: :obj:`list` <`any`>
+        """
+        if not self.__dp:
+            self.setServer()
+        results = []
+        if self.server and hasattr(self.__dp, "command_inout_asynch"):
+            self.health.check(self.__dp)
+            aids = []
+            start = time.time()
+            for name, argin in commands:
+                try:
+                    if argin is None:
+                        aids.append(self.__dp.command_inout_asynch(name))
+                    else:
+                        aids.append(
+                            self.__dp.command_inout_asynch(name, argin))
+                except Exception as e:
+                    aids.append(e)
+            for (name, argin), aid in zip(commands, aids):
+                if isinstance(aid, Exception):
+                    results.append(aid)
+                    continue
+                try:
+                    result = self.__dp.command_inout_reply(
+                        aid, self.__timeout)
+                    stats.add("command:%s" % name, time.time() - start,
+                              stats.size([name, argin, result]))
+                    results.append(result)
+                    self.health.touch()
+                except Exception as e:
+                    stats.add("command:%s" % name, time.time() - start,
+                              stats.size([name, argin]), True)
+                    self.health.reset()
+                    results.append(e)
+        else:
+            for name, argin in commands:
+                var = [] if argin is None else [argin]
+                try:
+                    results.append(self.__command(self.__dp, name, *var))
+                except Exception as e:
+                    results.append(e)
+        return results
+
+    def __resetLazy(self):
+        """ drops values of lazy attributes
+        """
+        with self.__lazylock:
+            self.__lazy = {}
+            self.__lazygeneration += 1
+
+    def __loadLazy(self, names):
+        """ fetches missing lazy attributes from the selection server,
+            failed attributes get empty values which are not stored
+            so the next access fetches them again
+
+        :param names: lazy attribute names
+        :type names: :obj:`list` <:obj:`str`>
+        :returns: (attribute, value) dictionary of the given attributes
+        :rtype: :obj:`dict` <:obj:`str`, `any`>
+        """
+        with self.__lazylock:
+            generation = self.__lazygeneration
+            values = dict((name, self.__lazy[name])
+                          for name in names if name in self.__lazy)
+        missing = [name for name in names if name not in values]
+        if missing:
+            failed = set()
+            results = self.__bulkCommands(
+                [self.lazyfields[name][:2] for name in missing])
+            for name, dc in zip(missing, results):
+                command, _, encoded = self.lazyfields[name]
+                try:
+                    if isinstance(dc, Exception):
+                        raise dc
+                    if encoded is None:
+                        values[name] = self.__toDict(command, dc)
+                    else:
+                        values[name] = self.__toList(command, dc, encoded)
+                except Exception as e:
+                    logger.error("Cannot fetch %s: %s" % (name, str(e)))
+                    values[name] = {} if encoded is None else []
+                    failed.add(name)
+            with self.__lazylock:
+                if generation == self.__lazygeneration:
+                    for name in missing:
+                        if name not in failed:
+                            values[name] = self.__lazy.setdefault(
+                                name, values[name])
+        return values
+
+    def __getLazy(self, name):
+        """ provides lazy attribute fetching it on the first access
+
+        :param name: lazy attribute name
+        :type name: :obj:`str`
+        :returns: attribute value
+        :rtype: `any`
+        """
+        with self.__lazylock:
+            if name in self.__lazy:
+                return self.__lazy[name]
+        return self.__loadLazy([name])[name]
+
+    def __setLazy(self, name, value):
+        """ sets lazy attribute
+
+        :param name: lazy attribute name
+        :type name: :obj:`str`
+        :param value: attribute value
+        :type value: `any`
+        """
+        with self.__lazylock:
+            self.__lazy[name] = value
+
+    def prefetch(self):
+        """ fetches all lazy attributes which have not been loaded yet
+        """
+        self.__loadLazy(sorted(self.lazyfields.keys()))
+
+    #: (:obj:`dict` <:obj:`str` , :obj:`str`>) full device names
+    fullnames = property(
+        lambda self: self.__getLazy("fullnames"),
+        lambda self, value: self.__setLazy("fullnames", value),
+        doc='full device names')
+
+    #: (:obj:`list`<:obj:`str`>) administrator data key names
+    admindata = property(
+        lambda self: self.__getLazy("admindata"),
+        lambda self, value: self.__setLazy("admindata", value),
+        doc='administrator data key names')
+
+    #: (:obj:`list`<:obj:`str`>) pool motors
+    motors = property(
+        lambda self: self.__getLazy("motors"),
+        lambda self, value: self.__setLazy("motors", value),
+        doc='pool motors')
+
+    #: (:obj:`list`<:obj:`str`>) pool acquisition channels
+    acqchannels = property(
+        lambda self: self.__getLazy("acqchannels"),
+        lambda self, value: self.__setLazy("acqchannels", value),
+        doc='pool acquisition channels')
+
+    #: (:obj:`list`<:obj:`str`>) pool IO registers
+    ioregisters = property(
+        lambda self: self.__getLazy("ioregisters"),
+        lambda self, value: self.__setLazy("ioregisters", value),
+        doc='pool IO registers')
+
+    def __getDescription(self):
+        """ provides element description
+
+        :returns: element description
+        :rtype: [:obj:`dict` <:obj:`str`, :obj:`dict` <:obj:`str`, \
+                :obj:`list` <(:obj:`str`, :obj:`str`, :obj:`str`, \
+                :obj:`str`, :obj:`list` <:obj:`int`>)> > > ]
+        """
+        return self.__description
+
+    def __setDescription(self, description):
+        """ sets element description and rebuilds its index
+
+        :param description: element description
+        :type description: [:obj:`dict` <:obj:`str`, :obj:`dict` \
+                <:obj:`str`, :obj:`list` <(:obj:`str`, :obj:`str`, \
+                :obj:`str`, :obj:`str`, :obj:`list` <:obj:`int`>)> > > ]
+        """
+        self.__description = description
+        self.descindex = DescriptionIndex(description)
+        self.__ddsowners = DisabledDataSources(self.descindex)
+        self.__ddsstale = True
+        self.ddsdirty = True
+
+    #: ( [:obj:`dict` <:obj:`str`, :obj:`dict` <:obj:`str`, \
+    #:        :obj:`list` <(:obj:`str`, :obj:`str`, :obj:`str`, \
+    #:        :obj:`str`, :obj:`list` <:obj:`int`>)> > > ] ) \
+    #: element description
+    description = property(__getDescription, __setDescription,
+                           doc='element description')
+
+    def __selectedComponents(self):
+        """ provides names of all selected components
+
+        :returns: selected components
+        :rtype: :obj:`set` <:obj:`str`>
+        """
+        return self.cpgroup.selected() | self.dsgroup.selected() \
+            | set(self.mcplist) | set(self.acplist)
+
     def __disableDataSources(self):
-        """ provides disable datasources
+        """ provides disable datasources as a read-only view which is
+            not changed by later recomputations
 
         :returns: (disable datasources, ds component) dictionary
-        :rtype: :obj:`dict` <:obj:`str`, :obj:`str`>
+        :rtype: :class:`types.MappingProxyType` <:obj:`str`, :obj:`str`>
         """
         if not self.ddsdirty:
-            return dict(self.__ddsbackup)
-
-        res = self.description
-        dds = {}
-        for cpg in res:
-            for cp, dss in cpg.items():
-                if isinstance(dss, dict):
-                    if cp in self.cplist \
-                       or cp in self.mcplist \
-                       or cp in self.dslist \
-                       or cp in self.acplist:
-                        for ds, values in dss.items():
-                            for vl in values:
-                                if len(vl) > 0 and vl[0] == 'STEP':
-                                    if ds != cp:
-                                        dds[ds] = cp
-                                        break
+            return self.__ddsbackup
+
+        extra = frozenset(self.mcplist) | frozenset(self.acplist)
+        if self.__ddsstale or extra != self.__ddsextra:
+            self.__ddsextra = extra
+            self.__ddsowners.reset(self.__selectedComponents())
+            self.__ddsstale = False
+        dds = self.__ddsowners.datasources()
         if self.timers:
             for timer in self.timers:
                 if timer not in dds.keys():
                     dds[timer] = ''
-        self.__ddsbackup = dict(dds)
+        self.__ddsbackup = MappingProxyType(dds)
         self.ddsdirty = False
-        return dds
+        return self.__ddsbackup
 
     def clientRecords(self):
         """ provides client recorders
@@ -1255,20 +2414,7 @@ class ServerState(Qt.QObject):
         :returns: list of client recorders
         :rtype: :obj:`list` <:obj:`str`>
         """
-        res = self.description
-        dds = {}
-
-        for cpg in res:
-            for cp, dss in cpg.items():
-                if isinstance(dss, dict):
-                    if cp in self.cplist \
-                       or cp in self.mcplist \
-                       or cp in self.dslist \
-                       or cp in self.acplist:
-                        for ds, values in dss.items():
-                            for vl in values:
-                                if len(vl) > 1 and vl[1] == 'CLIENT':
-                                    dds[ds] = vl[2]
+        dds = self.descindex.clientRecords(self.__selectedComponents())
         return list(set(dds.values()) - set(self.fullnames.values()) -
                     set(self.recorder_names))
 
@@ -1278,20 +2424,7 @@ class ServerState(Qt.QObject):
         :returns: list of components with step datasources
         :rtype: :obj:`list` <:obj:`str`>
         """
-        res = self.description
-        cpset = set()
-        for cpg in res:
-            for cp, dss in cpg.items():
-                if isinstance(dss, dict):
-                    for values in dss.values():
-                        for vl in values:
-                            if len(vl) > 0 and vl[0] == 'STEP':
-                                cpset.add(cp)
-                                break
-                        else:
-                            continue
-                        break
-        return list(cpset)
+        return list(self.descindex.stepcomponents)
 
     def clientDataSources(self):
         """ provides client datasources
@@ -1299,29 +2432,199 @@ class ServerState(Qt.QObject):
         :returns: list of client datasources
         :rtype: :obj:`list` <:obj:`str`>
         """
-        res = self.dsdescription
-        dsset = set()
-        for jdsg in res:
-            dsg = json.loads(jdsg)
-            if isinstance(dsg, dict):
-                if dsg['dstype'] == 'CLIENT':
-                    dsset.add(dsg['dsname'])
-        return list(dsset)
+        return list(set(self.dstypes.get('CLIENT', [])))
+
+    def __getDsDescription(self):
+        """ provides JSON datasource descriptions
 
-    #: (:obj:`list` <:obj:`str`>) provides disable datasources
+        :returns: JSON datasource descriptions
+        :rtype: :obj:`list` <:obj:`str`>
+        """
+        return self.__dsdescription
+
+    def __setDsDescription(self, dsdescription):
+        """ sets JSON datasource descriptions and parses them into records
+
+        :param dsdescription: JSON datasource descriptions
+        :type dsdescription: :obj:`list` <:obj:`str`>
+        """
+        self.__dsdescription = dsdescription
+        records = [DataSourceRecord.fromJSON(jdsg)
+                   for jdsg in dsdescription or []]
+        self.dsrecords = [rec for rec in records if rec is not None]
+        self.dstypes = DataSourceRecord.byType(self.dsrecords)
+
+    #: (:obj:`list` <:obj:`str`>) JSON datasource descriptions
+    dsdescription = property(__getDsDescription, __setDsDescription,
+                             doc='JSON datasource descriptions')
+
+    #: (:class:`types.MappingProxyType` <:obj:`str`, :obj:`str`>) \
+    #:    provides disable datasources
     ddsdict = property(__disableDataSources,
                        doc='provides disable datasources')
 
+    def __getDdsDirty(self):
+        """ provides if disable datasources have to be recomputed
+
+        :returns: if disable datasources have to be recomputed
+        :rtype: :obj:`bool`
+        """
+        return self.__ddsdirty
+
+    def __setDdsDirty(self, dirty):
+        """ marks disable datasources to be recomputed
+
+        :param dirty: if disable datasources have to be recomputed
+        :type dirty: :obj:`bool`
+        """
+        if dirty:
+            self.__stateversion += 1
+        self.__ddsdirty = dirty
+
+    #: (:obj:`bool`) if disable datasources have to be recomputed
+    ddsdirty = property(__getDdsDirty, __setDdsDirty,
+                        doc='if disable datasources have to be recomputed')
+
+    def __getStateVersion(self):
+        """ provides version of the state displayed by element models
+
+        :returns: version increased on each modification of selection,
+                  disable datasources or properties
+        :rtype: :obj:`int`
+        """
+        return self.selectionversion + self.__stateversion
+
+    #: (:obj:`int`) version increased on each modification of selection, \
+    #:    disable datasources or properties
+    stateversion = property(__getStateVersion,
+                            doc='version of the state displayed by '
+                            'element models')
+
+    def __selectionChanged(self, name, old, new):
+        """ updates selection version after selection modification
+
+        :param name: modified key or None for bulk modification
+        :type name: :obj:`str`
+        :param old: old value
+        :type old: :obj:`bool` or `None`
+        :param new: new value
+        :type new: :obj:`bool` or `None`
+        """
+        self.selectionversion += 1
+
+    def __detectorsChanged(self, name, old, new):
+        """ updates disable datasources after detector selection
+            modification
+
+        :param name: modified key or None for bulk modification
+        :type name: :obj:`str`
+        :param old: old value
+        :type old: :obj:`bool` or `None`
+        :param new: new value
+        :type new: :obj:`bool` or `None`
+        """
+        self.__selectionChanged(name, old, new)
+        self.ddsdirty = True
+        if name is None:
+            self.__ddsstale = True
+        elif not self.__ddsstale:
+            self.__ddsowners.update(
+                name,
+                bool(self.cpgroup.get(name))
+                or bool(self.dsgroup.get(name))
+                or name in self.__ddsextra)
+
+    def __selection(self, group, detectors=True):
+        """ wraps selection dictionary into an observable one
+
+        :param group: selection dictionary
+        :type group: :obj:`dict` <:obj:`str` , :obj:`bool` or `None`>
+        :param detectors: if selection defines disable datasources
+        :type detectors: :obj:`bool`
+        :returns: observable selection dictionary
+        :rtype: :class:`nxsselector.SelectionDict.SelectionDict`
+        """
+        selection = SelectionDict(
+            group if isinstance(group, dict) else {})
+        if detectors:
+            selection.listeners.append(self.__detectorsChanged)
+            self.__ddsstale = True
+            self.ddsdirty = True
+        else:
+            selection.listeners.append(self.__selectionChanged)
+        self.selectionversion += 1
+        return selection
+
+    def __getCpGroup(self):
+        """ provides detector component selection
+
+        :returns: detector component selection
+        :rtype: :class:`nxsselector.SelectionDict.SelectionDict`
+        """
+        return self.__cpgroup
+
+    def __setCpGroup(self, group):
+        """ sets detector component selection
+
+        :param group: detector component selection
+        :type group: :obj:`dict` <:obj:`str` , :obj:`bool` or `None`>
+        """
+        self.__cpgroup = self.__selection(group)
+
+    #: (:class:`nxsselector.SelectionDict.SelectionDict`) \
+    #:    detector component selection
+    cpgroup = property(__getCpGroup, __setCpGroup,
+                       doc='detector component selection')
+
+    def __getDsGroup(self):
+        """ provides datasource selection
+
+        :returns: datasource selection
+        :rtype: :class:`nxsselector.SelectionDict.SelectionDict`
+        """
+        return self.__dsgroup
+
+    def __setDsGroup(self, group):
+        """ sets datasource selection
+
+        :param group: datasource selection
+        :type group: :obj:`dict` <:obj:`str` , :obj:`bool` or `None`>
+        """
+        self.__dsgroup = self.__selection(group)
+
+    #: (:class:`nxsselector.SelectionDict.SelectionDict`) \
+    #:    datasource selection
+    dsgroup = property(__getDsGroup, __setDsGroup,
+                       doc='datasource selection')
+
+    def __getAcpGroup(self):
+        """ provides description component selection
+
+        :returns: description component selection
+        :rtype: :class:`nxsselector.SelectionDict.SelectionDict`
+        """
+        return self.__acpgroup
+
+    def __setAcpGroup(self, group):
+        """ sets description component selection
+
+        :param group: description component selection
+        :type group: :obj:`dict` <:obj:`str` , :obj:`bool` or `None`>
+        """
+        self.__acpgroup = self.__selection(group, False)
+
+    #: (:class:`nxsselector.SelectionDict.SelectionDict`) \
+    #:    description component selection
+    acpgroup = property(__getAcpGroup, __setAcpGroup,
+                        doc='description component selection')
+
     def __components(self):
         """ provides selected components
 
         :returns: list of selected components
         :rtype: :obj:`list` <:obj:`str`>
         """
-        if isinstance(self.cpgroup, dict):
-            return [cp for cp in self.cpgroup.keys() if self.cpgroup[cp]]
-        else:
-            return []
+        return self.cpgroup.selectedList()
 
     #: (:obj:`list` <:obj:`str`>) provides selected components
     cplist = property(__components,
@@ -1333,10 +2636,7 @@ class ServerState(Qt.QObject):
         :returns: list of selected datasources
         :rtype: :obj:`list` <:obj:`str`>
         """
-        if isinstance(self.dsgroup, dict):
-            return [cp for cp in self.dsgroup.keys() if self.dsgroup[cp]]
-        else:
-            return []
+        return self.dsgroup.selectedList()
 
     #: (:obj:`list` <:obj:`str`>) provides selected datasources
     dslist = property(__datasources,
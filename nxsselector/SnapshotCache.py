@@ -0,0 +1,125 @@
+#!/usr/bin/env python
+#   This file is part of nexdatas - Tango Server for NeXus data writer
+#
+#    Copyright (C) 2014-2017 DESY, Jan Kotanski <jkotan@mail.desy.de>
+#
+#    nexdatas is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    nexdatas is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    You should have received a copy of the GNU General Public License
+#    along with nexdatas.  If not, see <http://www.gnu.org/licenses/>.
+# on-disk snapshots of selector settings
+
+""" on-disk snapshots of selector settings """
+
+import os
+import json
+import hashlib
+
+import logging
+#: (:obj:`logging.Logger`) logger object
+logger = logging.getLogger(__name__)
+
+
+class SnapshotCache(object):
+    """ on-disk cache with the last fetched settings of selector servers
+    """
+
+    def __init__(self, directory=None):
+        """ constructor
+
+        :param directory: snapshot directory
+        :type directory: :obj:`str`
+        """
+        if directory is None:
+            directory = os.path.join(
+                os.environ.get("XDG_CONFIG_HOME") or
+                os.path.join(os.path.expanduser("~"), ".config"),
+                "DESY", "nxselector", "snapshots")
+        #: (:obj:`str`) snapshot directory
+        self.directory = directory
+
+    @classmethod
+    def key(cls, server, version, profile):
+        """ creates snapshot key
+
+        :param server: selector server name
+        :type server: :obj:`str`
+        :param version: selector server version
+        :type version: :obj:`str`
+        :param profile: JSON profile configuration
+        :type profile: :obj:`str`
+        :returns: snapshot key
+        :rtype: :obj:`str`
+        """
+        return "%s:%s:%s" % (
+            server, version,
+            hashlib.sha1(str(profile).encode("utf8")).hexdigest())
+
+    def __filename(self, server):
+        """ provides snapshot file name of the selector server
+
+        :param server: selector server name
+        :type server: :obj:`str`
+        :returns: snapshot file name
+        :rtype: :obj:`str`
+        """
+        return os.path.join(
+            self.directory,
+            "%s.json" % hashlib.sha1(str(server).encode("utf8")).hexdigest())
+
+    def load(self, server, key):
+        """ loads snapshot data
+
+        :param server: selector server name
+        :type server: :obj:`str`
+        :param key: snapshot key
+        :type key: :obj:`str`
+        :returns: snapshot data or None if snapshot is missing or outdated
+        :rtype: :obj:`dict` <:obj:`str`, `any`>
+        """
+        filename = self.__filename(server)
+        if not os.path.isfile(filename):
+            return None
+        try:
+            with open(filename, "r") as fl:
+                snapshot = json.load(fl)
+        except Exception as e:
+            logger.warning("Cannot read snapshot %s: %s" % (filename, str(e)))
+            return None
+        if not isinstance(snapshot, dict) or snapshot.get("key") != key:
+            return None
+        return snapshot.get("data")
+
+    def save(self, server, key, data):
+        """ saves snapshot data replacing the previous snapshot of the server
+
+        :param server: selector server name
+        :type server: :obj:`str`
+        :param key: snapshot key
+        :type key: :obj:`str`
+        :param data: snapshot data
+        :type data: :obj:`dict` <:obj:`str`, `any`>
+        """
+        filename = self.__filename(server)
+        tmpname = "%s.%s.tmp" % (filename, os.getpid())
+        try:
+            if not os.path.isdir(self.directory):
+                os.makedirs(self.directory)
+            with open(tmpname, "w") as fl:
+                json.dump({"key": key, "data": data}, fl)
+            if os.path.exists(filename) and not hasattr(os, "replace"):
+                os.remove(filename)
+            getattr(os, "replace", os.rename)(tmpname, filename)
+        except Exception as e:
+            logger.warning(
+                "Cannot write snapshot %s: %s" % (filename, str(e)))
+            if os.path.exists(tmpname):
+                os.remove(tmpname)
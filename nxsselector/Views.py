@@ -26,9 +26,9 @@ except Exception:
     from taurus.qt import Qt
 
 import logging
-import json
 
 from .DynamicTools import DynamicTools
+from .ElementModel import PROPERTIESROLE
 from .LDataDlg import LDataDlg
 from .LDataDlg import LExDataDlg
 
@@ -251,6 +251,9 @@ class CheckerView(Qt.QWidget):
         self.setContextMenuPolicy(Qt.Qt.PreventContextMenu)
         #: (:obj:`bool`) switch checkboxes flag
         self.switchCheckboxes = False
+        #: (:obj:`dict` <:class:`taurus.qt.Qt.QWidget`, :obj:`int`>) \
+        #:     rows of element widgets without created tooltips
+        self.__tiprows = {}
 
     def close(self):
         """ widget close method which disconnect signals """
@@ -296,6 +299,7 @@ class CheckerView(Qt.QWidget):
 
         if self.glayout:
             self.widgets = []
+            self.__tiprows = {}
             if self.dmapper:
                 self.displays = []
             self.spacer = None
@@ -520,6 +524,7 @@ class CheckerView(Qt.QWidget):
             cb.setFont(font)
             if hasattr(cb, "setCheckable"):
                 cb.setCheckable(True)
+            cb.installEventFilter(self)
             if self.dmapper:
                 ds = self.widget()
                 font = ds.font()
@@ -553,6 +558,7 @@ class CheckerView(Qt.QWidget):
         name = self.model.data(ind, role=Qt.Qt.DisplayRole)
         ind1 = self.model.index(row, 1)
         label = self.model.data(ind1, role=Qt.Qt.DisplayRole)
+        self.__tiprows[cb] = row
 
         if name:
             if self.showLabels and label and \
@@ -574,6 +580,33 @@ class CheckerView(Qt.QWidget):
                 "QCheckBox:checked{ color: blue; }"
                 "QCheckBox:disabled{ color: gray; }"
             )
+
+    def eventFilter(self, widget, event):
+        """ creates the element widget tooltip on its first tooltip event
+
+        :param widget: watched widget
+        :type widget: :class:`taurus.qt.Qt.QObject`
+        :param event: widget event
+        :type event: :class:`taurus.qt.Qt.QEvent`
+        :returns: if event should be filtered out
+        :rtype: :obj:`bool`
+        """
+        if event.type() == Qt.QEvent.ToolTip and widget in self.__tiprows:
+            self.__setToolTip(self.__tiprows.pop(widget), widget)
+        return Qt.QWidget.eventFilter(self, widget, event)
+
+    def __setToolTip(self, row, cb):
+        """ set tooltip of element widget
+
+        :param row: the row number
+        :type row: :obj:`int`
+        :param cb: checkbox widget
+        :type cb: :class:`taurus.qt.Qt.QWidget`
+        """
+        ind = self.model.index(row, 0)
+        name = self.model.data(ind, role=Qt.Qt.DisplayRole)
+        ind1 = self.model.index(row, 1)
+        label = self.model.data(ind1, role=Qt.Qt.DisplayRole)
         text = self.model.data(ind, role=Qt.Qt.ToolTipRole)
         text = str(text) if text else ""
         if self.showLabels:
@@ -671,33 +704,17 @@ class CheckPropView(CheckDisView):
         ind = self.model.index(row, 0)
         name = self.model.data(ind, role=Qt.Qt.DisplayRole)
         ind5 = self.model.index(row, 5)
-        props = self.model.data(ind5, role=Qt.Qt.DisplayRole)
-        if props:
-            prs = json.loads(str(props))
+        prs = self.model.data(ind5, role=PROPERTIESROLE)
+        if prs:
             dform = self.propdlg(self)
             dform.label = name
-            if "__triggergatelist__" in prs:
-                dform.synchronizers = list(prs["__triggergatelist__"])
-            dform.dtype = prs["data_type"] if "data_type" in prs else None
-            dform.shape = prs["shape"] if "shape" in prs else None
-            dform.link = prs["link"] if "link" in prs else None
-            dform.path = prs["nexus_path"] if "nexus_path" in prs else None
-            dform.canfail = prs["canfail"] if "canfail" in prs else None
-            dform.addVariables(prs)
+            dform.setProperties(prs)
             dform.createGUI()
 
             dform.ui.labelLineEdit.setEnabled(False)
             if dform.exec_():
-                if "data_type" in prs:
-                    prs["data_type"] = dform.dtype or None
-                    prs["link"] = dform.link
-                    prs["canfail"] = dform.canfail
-                    prs["shape"] = dform.shape
-                    prs["nexus_path"] = dform.shape or None
-                for nm, val in dform.variables.items():
-                    prs[nm] = val
-                self.model.setData(ind5, (
-                    str(str(json.dumps(prs)))))
+                dform.updateProperties(prs)
+                self.model.setData(ind5, prs, PROPERTIESROLE)
 
     def connectMapper(self):
         """ reconnects mappers
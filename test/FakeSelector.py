@@ -0,0 +1,302 @@
+#!/usr/bin/env python
+#   This file is part of nexdatas - Tango Server for NeXus data writer
+#
+#    Copyright (C) 2012-2018 DESY, Jan Kotanski <jkotan@mail.desy.de>
+#
+#    nexdatas is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    nexdatas is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    You should have received a copy of the GNU General Public License
+#    along with nexdatas.  If not, see <http://www.gnu.org/licenses/>.
+# \package test nexdatas
+# \file FakeSelector.py
+# in-process fake of NXSRecSelector device proxy
+#
+import json
+import time
+import threading
+
+
+class FakeAttribute(object):
+    """ attribute reading result
+    """
+
+    def __init__(self, value):
+        """ constructor
+
+        :param value: attribute value
+        :type value: `any`
+        """
+        self.value = value
+
+
+class FakeSelector(object):
+    """ fake NXSRecSelector device proxy with per-call latency
+    """
+
+    #: (:obj:`dict` <:obj:`str`, :obj:`int`>) generated beamline sizes
+    sizes = {"small": 10, "medium": 1000, "large": 10000}
+
+    def __init__(self, name="test/nxsrecselector/01", channels=10,
+                 latency=0.01):
+        """ constructor
+
+        :param name: device name
+        :type name: :obj:`str`
+        :param channels: number of generated channels
+        :type channels: :obj:`int`
+        :param latency: latency of each call in seconds
+        :type latency: :obj:`float`
+        """
+        self.__name = name
+        self.latency = latency
+        self.version = "3.30.0"
+        self.calls = 0
+        #: (:obj:`int`) number of calls started with no other call pending,
+        #:    i.e. sequential round-trips to the device
+        self.roundtrips = 0
+        self.__pending = 0
+        self.__lock = threading.Lock()
+        self.__replies = {}
+        self.__aid = 0
+        self.scanID = 12
+        self.door = "test/door/01"
+        self.configDevice = "test/nxsconfigserver/01"
+        self.macroServer = ""
+        self.mntGrp = "nxsmntgrp"
+        self.descriptionErrors = []
+        self.mgconf = json.dumps({})
+        self.generate(channels)
+
+    def generate(self, channels):
+        """ generates beamline of the given size
+
+        :param channels: number of generated channels
+        :type channels: :obj:`int`
+        """
+        self.channels = ["exp_c%05d" % i for i in range(channels)]
+        self.components = ["cp%04d" % i for i in range(max(channels // 10, 1))]
+        self.timers = ["exp_t01", "exp_t02"]
+        self.descriptions = [{
+            cp: dict(
+                (ch, [["STEP", "CLIENT", ch, "NX_FLOAT", []]])
+                for ch in self.channels[i::len(self.components)])
+            for i, cp in enumerate(self.components)}]
+        conf = {
+            "ComponentSelection": json.dumps(
+                dict((cp, False) for cp in self.components)),
+            "DataSourceSelection": json.dumps(
+                dict((ch, False) for ch in self.channels + self.timers)),
+            "ComponentPreselection": json.dumps({}),
+            "DataSourcePreselection": json.dumps({}),
+            "ChannelProperties": json.dumps({"label": {}}),
+            "UserData": json.dumps({}),
+            "ConfigVariables": json.dumps({}),
+            "UnplottedComponents": json.dumps([]),
+            "OrderedChannels": json.dumps(self.channels),
+            "Timer": json.dumps(self.timers[:1]),
+            "MntGrp": "nxsmntgrp",
+            "WriterDevice": "test/nxsdatawriter/01",
+            "AppendEntry": False,
+            "DefaultDynamicLinks": True,
+            "DefaultDynamicPath":
+            "$var.entryname#'scan'$var.serialno:NXentry/NXinstrument"
+            "/collection",
+            "MntGrpConfiguration": json.dumps({}),
+            "PreselectingDataSources": json.dumps([]),
+        }
+        self.profileConfiguration = json.dumps(conf)
+
+    def __wait(self):
+        """ simulates network latency
+        """
+        with self.__lock:
+            self.calls += 1
+            if not self.__pending:
+                self.roundtrips += 1
+            self.__pending += 1
+        try:
+            if self.latency:
+                time.sleep(self.latency)
+        finally:
+            with self.__lock:
+                self.__pending -= 1
+
+    def name(self):
+        return self.__name
+
+    def get_db_host(self):
+        return "localhost"
+
+    def get_db_port(self):
+        return "10000"
+
+    def set_source(self, _):
+        pass
+
+    def set_timeout_millis(self, _):
+        pass
+
+    def ping(self):
+        self.__wait()
+        return int(self.latency * 1e6)
+
+    def state(self):
+        self.__wait()
+        return "ON"
+
+    def read_attribute(self, name):
+        self.__wait()
+        return FakeAttribute(getattr(self, name))
+
+    def write_attribute(self, name, value):
+        self.__wait()
+        setattr(self, name, value)
+
+    def command_inout(self, name, *args):
+        self.__wait()
+        return getattr(self, name)(*args)
+
+    def command_inout_asynch(self, name, *args):
+        with self.__lock:
+            self.__aid += 1
+            aid = self.__aid
+        result = {}
+
+        def run():
+            try:
+                result["value"] = self.command_inout(name, *args)
+            except Exception as e:
+                result["error"] = e
+
+        thread = threading.Thread(target=run)
+        thread.start()
+        self.__replies[aid] = (thread, result)
+        return aid
+
+    def __selection(self):
+        """ provides selected channels of the current profile
+
+        :returns: selected channels
+        :rtype: :obj:`list` <:obj:`str`>
+        """
+        conf = json.loads(self.profileConfiguration)
+        dss = json.loads(conf["DataSourceSelection"])
+        cps = json.loads(conf["ComponentSelection"])
+        selected = set(ds for ds, status in dss.items() if status)
+        for cpg in self.descriptions:
+            for cp, cdss in cpg.items():
+                if cps.get(cp):
+                    selected.update(cdss.keys())
+        return [ch for ch in self.channels if ch in selected]
+
+    def command_inout_reply(self, aid, timeout=None):
+        thread, result = self.__replies.pop(aid)
+        thread.join()
+        if "error" in result:
+            raise result["error"]
+        return result["value"]
+
+    def availableComponents(self):
+        return list(self.components)
+
+    def availableDataSources(self):
+        return list(self.channels + self.timers)
+
+    def dataSourceDescription(self, names):
+        return [json.dumps({"dsname": ds, "dstype": "CLIENT",
+                            "record": ds}) for ds in names]
+
+    def availableMntGrps(self):
+        return ["nxsmntgrp"]
+
+    def mandatoryComponents(self):
+        return []
+
+    def preselectedComponents(self):
+        return []
+
+    def availableTimers(self):
+        return list(self.timers)
+
+    def componentDescription(self):
+        return json.dumps(self.descriptions)
+
+    def mutedChannels(self):
+        return []
+
+    def variableComponents(self):
+        return json.dumps({})
+
+    def fullDeviceNames(self):
+        return json.dumps(
+            dict((ch, "test/ct/%s" % ch) for ch in self.channels))
+
+    def administratorDataNames(self):
+        return []
+
+    def poolElementNames(self, listname):
+        if listname == "AcqChannelList":
+            return list(self.channels)
+        return []
+
+    def scanEnvVariables(self):
+        return json.dumps({"ScanDir": "/tmp", "ScanFile": ["scan.nxs"],
+                           "ScanID": self.scanID})
+
+    def setScanEnvVariables(self, jvalue):
+        self.scanID = json.loads(jvalue).get("ScanID", self.scanID)
+        return self.scanID
+
+    def mntGrpConfiguration(self):
+        return self.mgconf
+
+    def updateMntGrp(self):
+        channels = self.__selection()
+        timer = json.loads(json.loads(self.profileConfiguration)["Timer"])
+        self.mgconf = json.dumps({
+            "label": self.mntGrp,
+            "timer": "test/ct/%s" % timer[0] if timer else "",
+            "controllers": {
+                "test/ctctrl/01": {
+                    "channels": dict(
+                        ("test/ct/%s" % ch,
+                         {"name": ch, "index": i, "enabled": True,
+                          "plot_type": 1, "plot_axes": ["<mov>"]})
+                        for i, ch in enumerate(channels))}}})
+        return self.mgconf
+
+    def importMntGrp(self):
+        pass
+
+    def fetchProfile(self):
+        pass
+
+    def switchProfile(self):
+        pass
+
+    def deleteProfile(self, name):
+        pass
+
+    def exportEnvProfile(self):
+        pass
+
+    def preselectComponents(self):
+        pass
+
+    def PreselectComponents(self):
+        pass
+
+    def resetPreselectedComponents(self):
+        pass
+
+    def createWriterConfiguration(self, names):
+        return "<definition>%s</definition>" % "".join(
+            "<group name='%s'/>" % ch for ch in self.__selection())
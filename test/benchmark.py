@@ -0,0 +1,314 @@
+#!/usr/bin/env python
+#   This file is part of nexdatas - Tango Server for NeXus data writer
+#
+#    Copyright (C) 2012-2018 DESY, Jan Kotanski <jkotan@mail.desy.de>
+#
+#    nexdatas is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    nexdatas is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    You should have received a copy of the GNU General Public License
+#    along with nexdatas.  If not, see <http://www.gnu.org/licenses/>.
+# \package test nexdatas
+# \file benchmark.py
+# benchmarks of the selector on a simulated NXSRecSelector
+#
+""" benchmarks of the selector on a simulated NXSRecSelector
+
+    usage: python benchmark.py [-c 10,1000,10000] [-l 0.001] [-r 3]
+                               [-o benchmark.json]
+"""
+
+import argparse
+import json
+import platform
+import sys
+import time
+
+try:
+    from unittest import mock
+except ImportError:
+    import mock
+
+try:
+    import tracemalloc
+except ImportError:
+    tracemalloc = None
+
+from nxsselector import ServerState
+from nxsselector.Element import DSElement, CPElement
+from nxsselector.ProxyPool import pool
+
+from FakeSelector import FakeSelector
+
+
+class Benchmark(object):
+    """ benchmarks of the selector on a simulated NXSRecSelector
+    """
+
+    def __init__(self, channels=10, latency=0.0, repeat=3):
+        """ constructor
+
+        :param channels: number of generated channels
+        :type channels: :obj:`int`
+        :param latency: latency of each device call in seconds
+        :type latency: :obj:`float`
+        :param repeat: number of repetitions
+        :type repeat: :obj:`int`
+        """
+        #: (:class:`FakeSelector.FakeSelector`) simulated selector device
+        self.device = FakeSelector(channels=channels, latency=latency)
+        #: (:obj:`int`) number of repetitions
+        self.repeat = repeat
+        #: (:obj:`list` <:class:`mock._patch`>) tango patches
+        self.__patches = [
+            mock.patch.object(ServerState.tango, "Database"),
+            mock.patch.object(ServerState.tango, "DeviceProxy",
+                              return_value=self.device),
+        ]
+
+    def __enter__(self):
+        for patch in self.__patches:
+            patch.start()
+        pool.clear()
+        return self
+
+    def __exit__(self, *args):
+        for patch in self.__patches:
+            patch.stop()
+        pool.clear()
+
+    def measure(self, name, action, prepare=None):
+        """ measures execution times of the action
+
+        :param name: benchmark name
+        :type name: :obj:`str`
+        :param action: measured action
+        :type action: :meth:`callable`
+        :param prepare: action called before each measurement
+        :type prepare: :meth:`callable`
+        :returns: benchmark result
+        :rtype: :obj:`dict` <:obj:`str`, `any`>
+        """
+        times = []
+        calls = []
+        for _ in range(self.repeat):
+            if prepare is not None:
+                prepare()
+            ncalls = self.device.calls
+            start = time.time()
+            action()
+            times.append(time.time() - start)
+            calls.append(self.device.calls - ncalls)
+        return {
+            "benchmark": name,
+            "channels": len(self.device.channels),
+            "latency": self.device.latency,
+            "repeat": self.repeat,
+            "min": min(times),
+            "mean": sum(times) / len(times),
+            "max": max(times),
+            "calls": max(calls),
+        }
+
+    def allocations(self, name, action):
+        """ measures memory allocated by the action and kept in its result
+
+        :param name: benchmark name
+        :type name: :obj:`str`
+        :param action: measured action
+        :type action: :meth:`callable`
+        :returns: benchmark result
+        :rtype: :obj:`dict` <:obj:`str`, `any`>
+        """
+        memory = []
+        peaks = []
+        for _ in range(self.repeat):
+            tracemalloc.start()
+            try:
+                result = action()
+                current, peak = tracemalloc.get_traced_memory()
+            finally:
+                tracemalloc.stop()
+            memory.append(current)
+            peaks.append(peak)
+            del result
+        return {
+            "benchmark": name,
+            "channels": len(self.device.channels),
+            "repeat": self.repeat,
+            "first": memory[0],
+            "memory": memory[-1],
+            "peak": max(peaks),
+        }
+
+    def state(self):
+        """ creates server state of the simulated device
+
+        :returns: server state
+        :rtype: :class:`nxsselector.ServerState.ServerState`
+        """
+        state = ServerState.ServerState(self.device.name())
+        state.snapshots = None
+        return state
+
+    def select(self, state):
+        """ selects every second channel and component
+
+        :param state: server state
+        :type state: :class:`nxsselector.ServerState.ServerState`
+        """
+        for ch in self.device.channels[::2]:
+            state.dsgroup[ch] = True
+        for cp in self.device.components[::2]:
+            state.cpgroup[cp] = True
+
+    def fetchSettings(self):
+        """ measures ServerState.fetchSettings
+
+        :returns: benchmark result
+        :rtype: :obj:`dict` <:obj:`str`, `any`>
+        """
+        states = []
+        return self.measure(
+            "fetchSettings",
+            lambda: states[-1].fetchSettings(),
+            lambda: states.append(self.state()))
+
+    def storeSettings(self):
+        """ measures ServerState.storeSettings
+
+        :returns: benchmark result
+        :rtype: :obj:`dict` <:obj:`str`, `any`>
+        """
+        state = self.state()
+        state.fetchSettings()
+        self.select(state)
+        return self.measure("storeSettings", state.storeSettings)
+
+    def elements(self):
+        """ measures memory of elements created by a reset of the views
+            with new element instances and with the element registry
+
+        :returns: benchmark results
+        :rtype: :obj:`list` <:obj:`dict` <:obj:`str`, `any`>>
+        """
+        if tracemalloc is None:
+            sys.stderr.write("Element benchmarks skipped: "
+                             "tracemalloc is not available\n")
+            return []
+        state = self.state()
+        state.fetchSettings()
+
+        def create():
+            return [DSElement(ds, state) for ds in state.dsgroup.keys()] \
+                + [CPElement(cp, state) for cp in state.cpgroup.keys()]
+
+        def reuse():
+            return [state.elements.datasource(ds)
+                    for ds in state.dsgroup.keys()] \
+                + [state.elements.component(cp)
+                   for cp in state.cpgroup.keys()]
+
+        return [self.allocations("Elements.create", create),
+                self.allocations("Elements.registry", reuse)]
+
+    def gui(self):
+        """ measures Detectors.reset and Selector.apply
+
+        :returns: benchmark results
+        :rtype: :obj:`list` <:obj:`dict` <:obj:`str`, `any`>>
+        """
+        try:
+            from taurus.external.qt import Qt
+        except Exception:
+            from taurus.qt import Qt
+        from nxsselector.Selector import Selector
+        from nxsselector.CommandThread import CommandThread
+
+        app = Qt.QApplication.instance() or Qt.QApplication([])
+        selector = Selector(self.device.name(), standalone=True)
+        self.select(selector.state)
+
+        def apply():
+            selector.apply()
+            for thread in selector.findChildren(CommandThread):
+                thread.wait()
+            app.processEvents()
+
+        results = [
+            self.measure("Detectors.reset", selector.detectors.reset),
+            self.measure("Selector.apply", apply),
+        ]
+        selector.close()
+        return results
+
+    def run(self, gui=True):
+        """ runs all benchmarks
+
+        :param gui: run benchmarks of the Qt widgets
+        :type gui: :obj:`bool`
+        :returns: benchmark results
+        :rtype: :obj:`list` <:obj:`dict` <:obj:`str`, `any`>>
+        """
+        results = [self.fetchSettings(), self.storeSettings()]
+        results.extend(self.elements())
+        if gui:
+            try:
+                results.extend(self.gui())
+            except ImportError as e:
+                sys.stderr.write("GUI benchmarks skipped: %s\n" % str(e))
+        return results
+
+
+def main():
+    """ the main function
+    """
+    parser = argparse.ArgumentParser(
+        description="Selector benchmarks on a simulated NXSRecSelector")
+    parser.add_argument(
+        "-c", "--channels", dest="channels",
+        default=",".join(
+            str(size) for size in sorted(FakeSelector.sizes.values())),
+        help="comma separated numbers of generated channels")
+    parser.add_argument(
+        "-l", "--latency", dest="latency", type=float, default=0.001,
+        help="latency of each device call in seconds")
+    parser.add_argument(
+        "-r", "--repeat", dest="repeat", type=int, default=3,
+        help="number of repetitions")
+    parser.add_argument(
+        "-o", "--output", dest="output", default="benchmark.json",
+        help="output JSON file")
+    parser.add_argument(
+        "--no-gui", action="store_false", dest="gui", default=True,
+        help="skip benchmarks of the Qt widgets")
+    options = parser.parse_args()
+
+    results = []
+    for channels in options.channels.split(","):
+        with Benchmark(int(channels), options.latency,
+                       options.repeat) as benchmark:
+            for result in benchmark.run(options.gui):
+                if "memory" in result:
+                    print("%(benchmark)20s %(channels)6s channels: "
+                          "%(memory)s B per reset (%(first)s B first, "
+                          "%(peak)s B peak)" % result)
+                else:
+                    print("%(benchmark)20s %(channels)6s channels: "
+                          "%(mean).4f s (%(calls)s calls)" % result)
+                results.append(result)
+    with open(options.output, "w") as fl:
+        json.dump({"created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+                   "python": platform.python_version(),
+                   "results": results}, fl, indent=1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+#!/usr/bin/env python
+#   This file is part of nexdatas - Tango Server for NeXus data writer
+#
+#    Copyright (C) 2012-2018 DESY, Jan Kotanski <jkotan@mail.desy.de>
+#
+#    nexdatas is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    nexdatas is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    You should have received a copy of the GNU General Public License
+#    along with nexdatas.  If not, see <http://www.gnu.org/licenses/>.
+# \package test nexdatas
+# \file benchmark_test.py
+# unittests for the simulated NXSRecSelector and benchmarks
+#
+import unittest
+import json
+
+from benchmark import Benchmark, tracemalloc
+
+
+# test fixture
+class BenchmarkTest(unittest.TestCase):
+
+    def test_run(self):
+        with Benchmark(channels=10, repeat=2) as benchmark:
+            results = benchmark.run(gui=False)
+        names = ["fetchSettings", "storeSettings"]
+        if tracemalloc is not None:
+            names.extend(["Elements.create", "Elements.registry"])
+        self.assertEqual([res["benchmark"] for res in results], names)
+        for res in results[:2]:
+            self.assertEqual(res["channels"], 10)
+            self.assertEqual(res["repeat"], 2)
+            self.assertTrue(res["min"] <= res["mean"] <= res["max"])
+            self.assertTrue(res["calls"] > 0)
+        for res in results[2:]:
+            self.assertEqual(res["channels"], 10)
+            self.assertTrue(res["peak"] >= res["memory"] > 0)
+        json.dumps(results)
+
+    def test_updateMntGrp(self):
+        with Benchmark(channels=100) as benchmark:
+            state = benchmark.state()
+            state.fetchSettings()
+            benchmark.select(state)
+            conf = state.updateMntGrp()
+        device = benchmark.device
+        channels = conf["MntGrpConfigs"]["nxsmntgrp"]["controllers"][
+            "test/ctctrl/01"]["channels"]
+        self.assertEqual(
+            sorted(ch["name"] for ch in channels.values()),
+            sorted(set(device.channels[::2]) | set(
+                ch for cp in device.components[::2]
+                for ch in device.descriptions[0][cp])))
+        self.assertEqual(json.loads(device.profileConfiguration)["MntGrp"],
+                         "nxsmntgrp")
+
+
+if __name__ == '__main__':
+    unittest.main()
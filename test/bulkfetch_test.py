@@ -0,0 +1,125 @@
+#!/usr/bin/env python
+#   This file is part of nexdatas - Tango Server for NeXus data writer
+#
+#    Copyright (C) 2012-2018 DESY, Jan Kotanski <jkotan@mail.desy.de>
+#
+#    nexdatas is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    nexdatas is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    You should have received a copy of the GNU General Public License
+#    along with nexdatas.  If not, see <http://www.gnu.org/licenses/>.
+# \package test nexdatas
+# \file bulkfetch_test.py
+# benchmark of concurrent ServerState.fetchSettings on a fake device
+#
+import unittest
+import json
+
+try:
+    from unittest import mock
+except ImportError:
+    import mock
+
+from nxsselector import ServerState
+from nxsselector.ProxyPool import pool
+
+from FakeSelector import FakeSelector
+
+
+# test fixture
+class BulkFetchTest(unittest.TestCase):
+
+    # attributes set by fetchSettings
+    attrs = ["avcplist", "avdslist", "dsdescription", "avmglist",
+             "mcplist", "acplist", "atlist", "description",
+             "mutedChannels", "vrcpdict", "fullnames", "admindata",
+             "motors", "acqchannels", "ioregisters", "timers", "door",
+             "configDevice", "cpvrdict", "scanID"]
+
+    def setUp(self):
+        self.device = FakeSelector(channels=100, latency=0.02)
+        self.patches = [
+            mock.patch.object(ServerState.tango, "Database"),
+            mock.patch.object(ServerState.tango, "DeviceProxy",
+                              return_value=self.device),
+        ]
+        for patch in self.patches:
+            patch.start()
+        pool.clear()
+
+    def tearDown(self):
+        for patch in self.patches:
+            patch.stop()
+
+    def fetch(self, bulk):
+        state = ServerState.ServerState(self.device.name())
+        state.bulkfetch = bulk
+        state.snapshots = None
+        calls = self.device.calls
+        roundtrips = self.device.roundtrips
+        state.fetchSettings()
+        return state, (self.device.calls - calls,
+                       self.device.roundtrips - roundtrips)
+
+    def test_fetchSettings(self):
+        serial, (calls, roundtrips) = self.fetch(False)
+        bulk, (bcalls, broundtrips) = self.fetch(True)
+        for attr in self.attrs:
+            self.assertEqual(getattr(serial, attr), getattr(bulk, attr))
+        self.assertEqual(bcalls, calls)
+        self.assertEqual(roundtrips, calls)
+        self.assertTrue(broundtrips < roundtrips)
+
+    def test_lazy(self):
+        state, _ = self.fetch(True)
+        calls = self.device.calls
+        self.assertEqual(state.acqchannels, self.device.channels)
+        self.assertTrue(self.device.calls > calls)
+        calls = self.device.calls
+        self.assertEqual(state.acqchannels, self.device.channels)
+        self.assertEqual(self.device.calls, calls)
+        state.prefetch()
+        calls = self.device.calls
+        self.assertEqual(state.motors, [])
+        self.assertEqual(state.fullnames, json.loads(
+            self.device.fullDeviceNames()))
+        self.assertEqual(self.device.calls, calls)
+        state.fetchSettings()
+        calls = self.device.calls
+        self.assertEqual(state.motors, [])
+        self.assertTrue(self.device.calls > calls)
+
+    def test_lazyFailure(self):
+        state, _ = self.fetch(True)
+        failures = []
+
+        def fail():
+            failures.append(1)
+            raise Exception("no data")
+
+        self.device.administratorDataNames = fail
+        self.assertEqual(state.admindata, [])
+        self.assertEqual(len(failures), 1)
+        self.assertEqual(state.admindata, [])
+        self.assertEqual(len(failures), 2)
+        state.prefetch()
+        self.assertEqual(len(failures), 3)
+
+        # a transient failure is retried on the next access
+        del self.device.administratorDataNames
+        calls = self.device.calls
+        self.assertEqual(state.admindata, [])
+        self.assertEqual(state.admindata, [])
+        self.assertEqual(self.device.calls, calls + 1)
+        self.assertEqual(len(failures), 3)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,104 @@
+#!/usr/bin/env python
+#   This file is part of nexdatas - Tango Server for NeXus data writer
+#
+#    Copyright (C) 2012-2018 DESY, Jan Kotanski <jkotan@mail.desy.de>
+#
+#    nexdatas is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    nexdatas is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    You should have received a copy of the GNU General Public License
+#    along with nexdatas.  If not, see <http://www.gnu.org/licenses/>.
+# \package test nexdatas
+# \file callstats_test.py
+# unittests for CallStats
+#
+import unittest
+import json
+import os
+import shutil
+import tempfile
+
+from nxsselector import CallStats
+from nxsselector.CallStats import stats
+
+from FakeSelector import FakeAttribute
+from benchmark import Benchmark
+
+
+# test fixture
+class CallStatsTest(unittest.TestCase):
+
+    def test_call(self):
+        cstats = CallStats.CallStats(samples=10)
+        for i in range(20):
+            self.assertEqual(cstats.call("read:a", lambda x: x * 2, "ab"),
+                             "abab")
+        self.assertEqual(
+            cstats.call("read:b", lambda: FakeAttribute(["a", "bcd"])).value,
+            ["a", "bcd"])
+
+        def fail():
+            raise Exception("failed")
+
+        self.assertRaises(Exception, cstats.call, "read:b", fail)
+        summary = cstats.summary()
+        self.assertEqual(sorted(summary.keys()), ["read:a", "read:b"])
+        self.assertEqual(summary["read:a"]["count"], 20)
+        self.assertEqual(summary["read:a"]["errors"], 0)
+        self.assertEqual(summary["read:a"]["payload"], 120)
+        self.assertEqual(summary["read:b"]["count"], 2)
+        self.assertEqual(summary["read:b"]["errors"], 1)
+        self.assertEqual(summary["read:b"]["payload"], 4)
+        for rec in summary.values():
+            self.assertTrue(
+                rec["min"] <= rec["p50"] <= rec["p90"] <= rec["p99"]
+                <= rec["max"])
+            self.assertTrue(
+                abs(rec["mean"] * rec["count"] - rec["total"]) < 1e-9)
+        cstats.clear()
+        self.assertEqual(cstats.summary(), {})
+
+    def test_dump(self):
+        tmpdir = tempfile.mkdtemp()
+        try:
+            cstats = CallStats.CallStats()
+            cstats.add("command:availableComponents", 0.5, 20)
+            filename = os.path.join(tmpdir, "stats.json")
+            cstats.dump(filename)
+            with open(filename) as fl:
+                summary = json.load(fl)
+            self.assertEqual(summary, cstats.summary())
+        finally:
+            shutil.rmtree(tmpdir)
+
+    def test_serverState(self):
+        stats.clear()
+        with Benchmark(channels=10) as benchmark:
+            state = benchmark.state()
+            state.fetchSettings()
+            state.storeSettings()
+            state.fetchErrors()
+        summary = stats.summary()
+        for name in ["read:profileConfiguration",
+                     "read:version", "read:descriptionErrors",
+                     "command:availableComponents",
+                     "command:componentDescription",
+                     "command:setScanEnvVariables"]:
+            self.assertTrue(summary[name]["count"] > 0)
+            self.assertTrue(summary[name]["payload"] > 0)
+        self.assertEqual(summary["write:profileConfiguration"]["count"], 1)
+        self.assertEqual(summary["write:profileConfiguration"]["payload"],
+                         len("profileConfiguration") +
+                         len(benchmark.device.profileConfiguration))
+        stats.clear()
+
+
+if __name__ == '__main__':
+    unittest.main()
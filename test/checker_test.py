@@ -0,0 +1,97 @@
+#!/usr/bin/env python
+#   This file is part of nexdatas - Tango Server for NeXus data writer
+#
+#    Copyright (C) 2012-2018 DESY, Jan Kotanski <jkotan@mail.desy.de>
+#
+#    nexdatas is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    nexdatas is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    You should have received a copy of the GNU General Public License
+#    along with nexdatas.  If not, see <http://www.gnu.org/licenses/>.
+# \package test nexdatas
+# \file checker_test.py
+# unittests for configuration Checker
+#
+import unittest
+import json
+
+from nxsselector.ServerState import Checker
+
+
+# test fixture
+class CheckerTest(unittest.TestCase):
+
+    def test_compDict(self):
+        checker = Checker()
+        prof = {
+            "PreselectingDataSources": json.dumps(["a", "b"]),
+            "DataSourceSelection": json.dumps({"a": True, "b": False}),
+            "MntGrp": "mg1",
+            "Nested": {"x": 1, "y": 2},
+        }
+        prof2 = dict(prof)
+        self.assertTrue(checker.compDict(prof, prof2, True))
+
+        prof2["PreselectingDataSources"] = json.dumps(["b", "a"])
+        prof2["DataSourceSelection"] = json.dumps({"b": False, "a": True})
+        self.assertTrue(checker.compDict(prof, prof2, True))
+        self.assertFalse(checker.compDict(prof, prof2))
+
+        prof2["DataSourceSelection"] = json.dumps(
+            {"a": True, "b": True, "c": False})
+        self.assertFalse(checker.compDict(prof, prof2, True))
+        prof2 = dict(prof)
+        prof2["Nested"] = {"x": 1, "y": 3}
+        self.assertFalse(checker.compDict(prof, prof2, True))
+        prof2 = dict(prof)
+        prof2["Other"] = "mg2"
+        self.assertFalse(checker.compDict(prof, prof2, True))
+        self.assertFalse(checker.compDict(prof, None))
+
+    def test_cache(self):
+        checker = Checker()
+        prof = {"DataSourceSelection": json.dumps({"a": True})}
+        prof2 = {"DataSourceSelection": json.dumps({"a": True}, indent=1)}
+        misses = checker.cache.misses
+        self.assertTrue(checker.compDict(prof, prof2, True))
+        self.assertTrue(checker.compDict(prof, prof2, True))
+        self.assertTrue(checker.cache.misses - misses <= 2)
+
+    def test_sections(self):
+        checker = Checker()
+        prof = {
+            "PreselectingDataSources": json.dumps(["a", "b"]),
+            "DataSourceSelection": json.dumps({"a": True, "b": False}),
+            "MntGrp": "mg1",
+        }
+        sections = checker.sections(json.dumps(prof), sort=True)
+        self.assertEqual(sections["MntGrp"], ("mg1", None))
+        self.assertTrue(sections["PreselectingDataSources"][1])
+
+        prof["PreselectingDataSources"] = json.dumps(["b", "a"])
+        sections2 = checker.sections(json.dumps(prof), sections, True)
+        self.assertTrue(
+            sections2["DataSourceSelection"] is
+            sections["DataSourceSelection"])
+        self.assertTrue(checker.compSections(sections, sections2))
+
+        prof["DataSourceSelection"] = json.dumps({"a": True})
+        sections3 = checker.sections(json.dumps(prof), sections2, True)
+        self.assertFalse(checker.compSections(sections2, sections3))
+        prof["DataSourceSelection"] = json.dumps({"b": False, "a": True})
+        prof["MntGrp"] = "mg2"
+        sections4 = checker.sections(json.dumps(prof), sections2, True)
+        self.assertFalse(checker.compSections(sections2, sections4))
+        self.assertFalse(checker.compSections(
+            sections, checker.sections("", sort=True)))
+
+
+if __name__ == '__main__':
+    unittest.main()
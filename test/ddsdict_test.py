@@ -0,0 +1,164 @@
+#!/usr/bin/env python
+#   This file is part of nexdatas - Tango Server for NeXus data writer
+#
+#    Copyright (C) 2012-2018 DESY, Jan Kotanski <jkotan@mail.desy.de>
+#
+#    nexdatas is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    nexdatas is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    You should have received a copy of the GNU General Public License
+#    along with nexdatas.  If not, see <http://www.gnu.org/licenses/>.
+# \package test nexdatas
+# \file ddsdict_test.py
+# randomized tests of incremental disable datasources
+#
+import unittest
+import random
+
+try:
+    from unittest import mock
+except ImportError:
+    import mock
+
+from nxsselector import ServerState
+from nxsselector.ProxyPool import pool
+from nxsselector.DescriptionIndex import DescriptionIndex, \
+    DisabledDataSources
+
+from FakeSelector import FakeSelector
+
+
+# test fixture
+class DisabledDataSourcesTest(unittest.TestCase):
+
+    def setUp(self):
+        self.rnd = random.Random(11)
+        self.components = ["cp%02d" % i for i in range(12)]
+        self.channels = ["ch%02d" % i for i in range(30)]
+        self.description = []
+        for _ in range(2):
+            cpg = {}
+            for cp in self.rnd.sample(self.components, 8):
+                cpg[cp] = dict(
+                    (ds, [[self.rnd.choice(["STEP", "INIT"]), "CLIENT",
+                           ds, "NX_FLOAT", []]])
+                    for ds in self.rnd.sample(
+                        self.channels + self.components, 6))
+            self.description.append(cpg)
+
+    def full(self, selected):
+        """ recomputes the map as ServerState did before indexing
+        """
+        dds = {}
+        for cpg in self.description:
+            for cp, dss in cpg.items():
+                if cp in selected:
+                    for ds, values in dss.items():
+                        for vl in values:
+                            if len(vl) > 0 and vl[0] == 'STEP':
+                                if ds != cp:
+                                    dds[ds] = cp
+                                    break
+        return dds
+
+    def test_update(self):
+        dds = DisabledDataSources(DescriptionIndex(self.description))
+        selected = set(self.rnd.sample(self.components, 3))
+        dds.reset(selected)
+        self.assertEqual(dds.datasources(), self.full(selected))
+        for _ in range(500):
+            name = self.rnd.choice(self.components + self.channels)
+            status = self.rnd.random() < 0.5
+            if status:
+                selected.add(name)
+            else:
+                selected.discard(name)
+            dds.update(name, status)
+            self.assertEqual(dds.datasources(), self.full(selected))
+
+    def test_serverstate(self):
+        device = FakeSelector(latency=0)
+        pool.clear()
+        device.descriptions = self.description
+        with mock.patch.object(ServerState.tango, "Database"), \
+                mock.patch.object(ServerState.tango, "DeviceProxy",
+                                  return_value=device):
+            state = ServerState.ServerState(device.name())
+            state.snapshots = None
+            state.fetchSettings()
+        for cp in self.components:
+            state.cpgroup[cp] = False
+        for _ in range(300):
+            group = self.rnd.choice([state.cpgroup, state.dsgroup])
+            name = self.rnd.choice(self.components + self.channels)
+            group[name] = self.rnd.choice([True, False, None])
+            if self.rnd.random() < 0.05:
+                state.acplist = self.rnd.sample(self.components, 1)
+                state.ddsdirty = True
+            selected = set(state.cplist) | set(state.dslist) \
+                | set(state.mcplist) | set(state.acplist)
+            expected = self.full(selected)
+            for timer in state.timers:
+                expected.setdefault(timer, '')
+            self.assertEqual(state.ddsdict, expected)
+
+    def test_stateversion(self):
+        device = FakeSelector(latency=0)
+        pool.clear()
+        with mock.patch.object(ServerState.tango, "Database"), \
+                mock.patch.object(ServerState.tango, "DeviceProxy",
+                                  return_value=device):
+            state = ServerState.ServerState(device.name())
+            state.snapshots = None
+            state.fetchSettings()
+        self.assertEqual(state.displayversion, 1)
+        state.ddsdict
+        version = state.stateversion
+        state.ddsdict
+        state.ddsdict
+        self.assertEqual(state.stateversion, version)
+        state.dsgroup[device.channels[0]] = True
+        self.assertTrue(state.stateversion > version)
+        version = state.stateversion
+        state.dsgroup[device.channels[0]] = True
+        self.assertEqual(state.stateversion, version)
+        state.ddsdict
+        state.ddsdirty = True
+        self.assertTrue(state.stateversion > version)
+        version = state.stateversion
+        state.setProperties()
+        self.assertTrue(state.stateversion > version)
+
+    def test_readonly(self):
+        device = FakeSelector(latency=0)
+        pool.clear()
+        device.descriptions = self.description
+        with mock.patch.object(ServerState.tango, "Database"), \
+                mock.patch.object(ServerState.tango, "DeviceProxy",
+                                  return_value=device):
+            state = ServerState.ServerState(device.name())
+            state.snapshots = None
+            state.fetchSettings()
+        for cp in self.components:
+            state.cpgroup[cp] = False
+        state.cpgroup[self.components[0]] = True
+        dds = state.ddsdict
+        self.assertTrue(dds is state.ddsdict)
+        with self.assertRaises(TypeError):
+            dds["newds"] = "newcp"
+        snapshot = dict(dds)
+        state.cpgroup[self.components[0]] = False
+        state.cpgroup[self.components[1]] = True
+        self.assertTrue(dds is not state.ddsdict)
+        self.assertEqual(dds, snapshot)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,114 @@
+#!/usr/bin/env python
+#   This file is part of nexdatas - Tango Server for NeXus data writer
+#
+#    Copyright (C) 2012-2018 DESY, Jan Kotanski <jkotan@mail.desy.de>
+#
+#    nexdatas is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    nexdatas is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    You should have received a copy of the GNU General Public License
+#    along with nexdatas.  If not, see <http://www.gnu.org/licenses/>.
+# \package test nexdatas
+# \file descriptionindex_test.py
+# unittests for DescriptionIndex
+#
+import unittest
+import random
+import json
+
+from nxsselector.DescriptionIndex import DescriptionIndex, DataSourceRecord
+
+
+# test fixture
+class DescriptionIndexTest(unittest.TestCase):
+
+    def setUp(self):
+        self.rnd = random.Random(7)
+        self.names = ["cp%02d" % i for i in range(10)]
+        self.datasources = ["ds%02d" % i for i in range(20)] + self.names[:3]
+        self.description = []
+        for _ in range(3):
+            cpg = {}
+            for cp in self.rnd.sample(self.names, 6):
+                cpg[cp] = {}
+                for ds in self.rnd.sample(self.datasources, 5):
+                    cpg[cp][ds] = [
+                        [self.rnd.choice(["STEP", "INIT", "FINAL"]),
+                         self.rnd.choice(["CLIENT", "TANGO"]),
+                         "rec_%s_%s" % (cp, ds), "NX_FLOAT", []]
+                        for _ in range(self.rnd.randint(0, 2))]
+            self.description.append(cpg)
+
+    def disableDataSources(self, selected):
+        dds = {}
+        for cpg in self.description:
+            for cp, dss in cpg.items():
+                if cp in selected:
+                    for ds, values in dss.items():
+                        for vl in values:
+                            if len(vl) > 0 and vl[0] == 'STEP':
+                                if ds != cp:
+                                    dds[ds] = cp
+                                    break
+        return dds
+
+    def clientRecords(self, selected):
+        dds = {}
+        for cpg in self.description:
+            for cp, dss in cpg.items():
+                if cp in selected:
+                    for ds, values in dss.items():
+                        for vl in values:
+                            if len(vl) > 1 and vl[1] == 'CLIENT':
+                                dds[ds] = vl[2]
+        return dds
+
+    def sources(self, name, step):
+        contains = set()
+        for cpg in self.description:
+            for ds, values in cpg.get(name, {}).items():
+                for vl in values:
+                    if (len(vl) > 0 and vl[0] == 'STEP') == step:
+                        contains.add(ds)
+                        break
+        if contains:
+            return " ".join(sorted(contains))
+
+    def test_index(self):
+        index = DescriptionIndex(self.description)
+        for name in self.names + ["unknown"]:
+            self.assertEqual(index.scanSources(name),
+                             self.sources(name, True))
+            self.assertEqual(index.descSources(name),
+                             self.sources(name, False))
+        self.assertEqual(
+            sorted(index.stepcomponents),
+            sorted(set(cp for cp in self.names if self.sources(cp, True))))
+        for _ in range(20):
+            selected = set(self.rnd.sample(self.names, 4))
+            self.assertEqual(index.disableDataSources(selected),
+                             self.disableDataSources(selected))
+            self.assertEqual(index.clientRecords(selected),
+                             self.clientRecords(selected))
+
+    def test_records(self):
+        jdss = [json.dumps({"dsname": "ds%s" % i,
+                            "dstype": "CLIENT" if i % 2 else "TANGO",
+                            "record": "rec%s" % i}) for i in range(5)]
+        records = [DataSourceRecord.fromJSON(jds) for jds in jdss]
+        self.assertEqual(records[3].record, "rec3")
+        self.assertEqual(DataSourceRecord.fromJSON(json.dumps([])), None)
+        self.assertEqual(DataSourceRecord.byType(records),
+                         {"CLIENT": ["ds1", "ds3"],
+                          "TANGO": ["ds0", "ds2", "ds4"]})
+
+
+if __name__ == '__main__':
+    unittest.main()
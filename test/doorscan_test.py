@@ -0,0 +1,125 @@
+#!/usr/bin/env python
+#   This file is part of nexdatas - Tango Server for NeXus data writer
+#
+#    Copyright (C) 2012-2018 DESY, Jan Kotanski <jkotan@mail.desy.de>
+#
+#    nexdatas is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    nexdatas is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    You should have received a copy of the GNU General Public License
+#    along with nexdatas.  If not, see <http://www.gnu.org/licenses/>.
+# \package test nexdatas
+# \file doorscan_test.py
+# unittests for concurrent door state checks
+#
+import unittest
+import time
+
+try:
+    from unittest import mock
+except ImportError:
+    import mock
+
+from nxsselector import ServerState
+from nxsselector.ProxyPool import pool
+
+from FakeSelector import FakeSelector, FakeAttribute
+
+
+class FakeDoor(object):
+    """ door replying its state after the given latency
+    """
+
+    def __init__(self, state, latency):
+        self.value = state
+        self.latency = latency
+        self.requests = {}
+        self.cancelled = 0
+
+    def state(self):
+        time.sleep(self.latency)
+        return self.value
+
+    def read_attribute_asynch(self, name):
+        aid = len(self.requests) + 1
+        self.requests[aid] = time.time() + self.latency
+        return aid
+
+    def read_attribute_reply(self, aid):
+        if time.time() < self.requests[aid]:
+            raise ServerState.tango.AsynReplyNotArrived()
+        return FakeAttribute(self.value)
+
+    def cancel_asynch_request(self, aid):
+        self.cancelled += 1
+
+
+class FakeMacroServer(object):
+
+    def __init__(self, doors):
+        self.doorList = doors
+
+    def state(self):
+        return ServerState.tango.DevState.ON
+
+
+# test fixture
+class DoorScanTest(unittest.TestCase):
+
+    def setUp(self):
+        self.device = FakeSelector(latency=0)
+        self.device.macroServer = "test/ms/01"
+        on = ServerState.tango.DevState.ON
+        running = ServerState.tango.DevState.RUNNING
+        self.devices = {
+            self.device.name(): self.device,
+            "localhost:10000/test/ms/01": FakeMacroServer(
+                ["test/door/%02d" % i for i in range(20)]),
+        }
+        for i in range(20):
+            self.devices["test/door/%02d" % i] = FakeDoor(on, 0.1)
+        pool.clear()
+        self.patches = [
+            mock.patch.object(ServerState.tango, "Database"),
+            mock.patch.object(ServerState.tango, "DeviceProxy",
+                              side_effect=lambda name: self.devices[name]),
+        ]
+        for patch in self.patches:
+            patch.start()
+        self.state = ServerState.ServerState(self.device.name())
+        self.running = running
+
+    def tearDown(self):
+        for patch in self.patches:
+            patch.stop()
+
+    def test_idle(self):
+        start = time.time()
+        self.assertFalse(self.state.isDoorRunning())
+        self.assertTrue(time.time() - start < 1.0)
+
+    def test_running(self):
+        self.devices["test/door/15"].value = self.running
+        self.devices["test/door/16"].latency = 100
+        start = time.time()
+        self.assertTrue(self.state.isDoorRunning())
+        self.assertTrue(time.time() - start < 1.0)
+        self.assertEqual(self.devices["test/door/16"].cancelled, 1)
+
+    def test_timeout(self):
+        self.devices["test/door/03"].latency = 100
+        self.state.doortimeout = 0.3
+        start = time.time()
+        self.assertFalse(self.state.isDoorRunning())
+        self.assertTrue(time.time() - start < 1.0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,89 @@
+#!/usr/bin/env python
+#   This file is part of nexdatas - Tango Server for NeXus data writer
+#
+#    Copyright (C) 2012-2018 DESY, Jan Kotanski <jkotan@mail.desy.de>
+#
+#    nexdatas is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    nexdatas is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    You should have received a copy of the GNU General Public License
+#    along with nexdatas.  If not, see <http://www.gnu.org/licenses/>.
+# \package test nexdatas
+# \file element_test.py
+# unittests for the element registry
+#
+import unittest
+
+from nxsselector.Element import (
+    ElementRegistry, Element, DSElement, CPElement, GElement, DS, CP)
+
+
+class FakeState(object):
+
+    def __init__(self):
+        self.dsgroup = {"ds1": True, "ds2": False}
+        self.cpgroup = {"cp1": True}
+        self.timers = []
+        self.ddsdirty = False
+
+
+# test fixture
+class ElementTest(unittest.TestCase):
+
+    def test_slots(self):
+        state = FakeState()
+        for el in [Element("ds1", DS, state), DSElement("ds1", state),
+                   CPElement("cp1", state), GElement("cp1", CP, state, {})]:
+            self.assertFalse(hasattr(el, "__dict__"))
+            with self.assertRaises(AttributeError):
+                el.label = "ds1"
+
+    def test_registry(self):
+        state = FakeState()
+        registry = ElementRegistry(state)
+        ds1 = registry.datasource("ds1")
+        self.assertTrue(isinstance(ds1, DSElement))
+        self.assertTrue(ds1.state is state)
+        self.assertTrue(ds1.checked)
+        cp1 = registry.component("cp1")
+        self.assertTrue(isinstance(cp1, CPElement))
+        self.assertEqual(cp1.group, None)
+        self.assertTrue(registry.datasource("ds1") is ds1)
+        self.assertTrue(registry.component("cp1") is cp1)
+        self.assertTrue(registry.component("ds1") is not ds1)
+        self.assertEqual((registry.hits, registry.misses), (2, 3))
+        self.assertEqual(len(registry), 3)
+
+        group = {"cp1": None}
+        acp1 = registry.component("cp1", group, "acpgroup")
+        self.assertTrue(acp1 is not cp1)
+        self.assertTrue(acp1.group is group)
+        self.assertFalse(acp1.enable)
+        group = {"cp1": True}
+        self.assertTrue(registry.component("cp1", group, "acpgroup") is acp1)
+        self.assertTrue(acp1.group is group)
+        self.assertTrue(acp1.enable)
+
+        group = {"cp2": False}
+        cp2 = registry.member("cp2", CP, group, "Components:")
+        self.assertTrue(isinstance(cp2, GElement))
+        cp2.checked = True
+        self.assertEqual(group, {"cp2": True})
+        self.assertTrue(
+            registry.member("cp2", CP, {}, "Components:") is cp2)
+        self.assertTrue(
+            registry.member("cp2", DS, group, "Components:") is not cp2)
+        registry.clear()
+        self.assertEqual(len(registry), 0)
+        self.assertTrue(registry.datasource("ds1") is not ds1)
+
+
+if __name__ == '__main__':
+    unittest.main()
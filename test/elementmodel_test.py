@@ -0,0 +1,73 @@
+#!/usr/bin/env python
+#   This file is part of nexdatas - Tango Server for NeXus data writer
+#
+#    Copyright (C) 2012-2018 DESY, Jan Kotanski <jkotan@mail.desy.de>
+#
+#    nexdatas is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    nexdatas is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    You should have received a copy of the GNU General Public License
+#    along with nexdatas.  If not, see <http://www.gnu.org/licenses/>.
+# \package test nexdatas
+# \file elementmodel_test.py
+# unittests for bulk updates of the element model
+#
+import unittest
+
+from nxsselector.Element import GElement, DS
+from nxsselector.ElementModel import ElementModel
+
+
+# test fixture
+class ElementModelTest(unittest.TestCase):
+
+    def setUp(self):
+        self.group = dict(("ds%02d" % i, False) for i in range(10))
+        self.model = ElementModel(
+            [GElement(name, DS, None, self.group) for name in self.group])
+        self.changes = []
+        self.signals = []
+        self.model.datachanged.connect(
+            lambda first, last: self.changes.append(
+                (first.row(), last.row(), last.column())))
+        self.model.componentChecked.connect(
+            lambda: self.signals.append("componentChecked"))
+        self.model.dirty.connect(lambda: self.signals.append("dirty"))
+
+    def test_setChecked(self):
+        self.assertEqual(self.model.setChecked(True), 10)
+        self.assertEqual(self.changes, [(0, 9, 2)])
+        self.assertEqual(self.signals, ["componentChecked", "dirty"])
+        self.assertTrue(all(self.group.values()))
+
+        self.assertEqual(self.model.setChecked(True), 0)
+        self.assertEqual(len(self.changes), 1)
+        self.assertEqual(len(self.signals), 2)
+
+    def test_names(self):
+        self.group["ds03"] = True
+        self.assertEqual(
+            self.model.setChecked(True, names=["ds02", "ds03", "ds05"]), 2)
+        self.assertEqual(self.changes, [(2, 5, 2)])
+        self.assertEqual(
+            sorted(name for name, status in self.group.items() if status),
+            ["ds02", "ds03", "ds05"])
+
+    def test_predicate(self):
+        self.assertEqual(self.model.setChecked(
+            True, predicate=lambda el: el.name > "ds06", notify=False), 3)
+        self.assertEqual(self.changes, [(7, 9, 2)])
+        self.assertEqual(self.signals, [])
+        self.assertEqual(self.model.setChecked(False), 3)
+        self.assertEqual(self.changes[-1], (7, 9, 2))
+
+
+if __name__ == '__main__':
+    unittest.main()
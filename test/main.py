@@ -24,6 +24,23 @@ import sys
 import unittest
 
 import nxselector_test
+import bulkfetch_test
+import checker_test
+import descriptionindex_test
+import selectiondict_test
+import ddsdict_test
+import snapshot_test
+import statewaiter_test
+import proxypool_test
+import doorscan_test
+import serverdiscovery_test
+import benchmark_test
+import callstats_test
+import element_test
+import elementmodel_test
+import proxyhealth_test
+import storesettings_test
+import synchthread_test
 
 try:
     try:
@@ -167,6 +184,91 @@ def main():
               nxselector_test)
     )
 
+    suite.addTests(
+          unittest.defaultTestLoader.loadTestsFromModule(
+              bulkfetch_test)
+    )
+
+    suite.addTests(
+          unittest.defaultTestLoader.loadTestsFromModule(
+              checker_test)
+    )
+
+    suite.addTests(
+          unittest.defaultTestLoader.loadTestsFromModule(
+              descriptionindex_test)
+    )
+
+    suite.addTests(
+          unittest.defaultTestLoader.loadTestsFromModule(
+              selectiondict_test)
+    )
+
+    suite.addTests(
+          unittest.defaultTestLoader.loadTestsFromModule(
+              ddsdict_test)
+    )
+
+    suite.addTests(
+          unittest.defaultTestLoader.loadTestsFromModule(
+              snapshot_test)
+    )
+
+    suite.addTests(
+          unittest.defaultTestLoader.loadTestsFromModule(
+              statewaiter_test)
+    )
+
+    suite.addTests(
+          unittest.defaultTestLoader.loadTestsFromModule(
+              proxypool_test)
+    )
+
+    suite.addTests(
+          unittest.defaultTestLoader.loadTestsFromModule(
+              doorscan_test)
+    )
+
+    suite.addTests(
+          unittest.defaultTestLoader.loadTestsFromModule(
+              serverdiscovery_test)
+    )
+
+    suite.addTests(
+          unittest.defaultTestLoader.loadTestsFromModule(
+              benchmark_test)
+    )
+
+    suite.addTests(
+          unittest.defaultTestLoader.loadTestsFromModule(
+              callstats_test)
+    )
+
+    suite.addTests(
+          unittest.defaultTestLoader.loadTestsFromModule(
+              element_test)
+    )
+
+    suite.addTests(
+          unittest.defaultTestLoader.loadTestsFromModule(
+              elementmodel_test)
+    )
+
+    suite.addTests(
+          unittest.defaultTestLoader.loadTestsFromModule(
+              proxyhealth_test)
+    )
+
+    suite.addTests(
+          unittest.defaultTestLoader.loadTestsFromModule(
+              storesettings_test)
+    )
+
+    suite.addTests(
+          unittest.defaultTestLoader.loadTestsFromModule(
+              synchthread_test)
+    )
+
     # test runner
     runner = unittest.TextTestRunner()
     # test result
@@ -72,7 +72,8 @@ class NXSSelectorTest(unittest.TestCase):
         self.helpinfo = """usage: nxselector [-h] [-s SERVER] [-d DOOR] """ \
             """[-t STYLE] [-y STYLESHEET] [-m MODE] """ \
             """[--set-as-default-mode] """ \
-            """[--dont-switch-mntgrp] [--log LOG]
+            """[--dont-switch-mntgrp] [--log LOG] """ \
+            """[--call-stats CALLSTATS]
 
 NeXus Component Selector GUI
 
@@ -92,6 +93,8 @@ optional arguments:
   --dont-switch-mntgrp  do not switch MntGrp to the ActiveMntGrp
   --log LOG             logging level, i.e. debug, info, warning, """ \
       """error, critical
+  --call-stats CALLSTATS
+                        JSON file for call statistics written on exit
 """
         try:
             # random seed
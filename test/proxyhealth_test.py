@@ -0,0 +1,69 @@
+#!/usr/bin/env python
+#   This file is part of nexdatas - Tango Server for NeXus data writer
+#
+#    Copyright (C) 2012-2018 DESY, Jan Kotanski <jkotan@mail.desy.de>
+#
+#    nexdatas is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    nexdatas is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    You should have received a copy of the GNU General Public License
+#    along with nexdatas.  If not, see <http://www.gnu.org/licenses/>.
+# \package test nexdatas
+# \file proxyhealth_test.py
+# unittests for ProxyHealth
+#
+import unittest
+
+from nxsselector.ServerState import ProxyHealth, tango
+
+
+class FailingDevice(object):
+    """ device with a failing command
+    """
+
+    def __init__(self):
+        self.pings = 0
+        self.writes = 0
+
+    def ping(self):
+        self.pings += 1
+
+    def write(self, value):
+        self.writes += 1
+        raise tango.DevFailed()
+
+    def read(self):
+        return "value"
+
+
+# test fixture
+class ProxyHealthTest(unittest.TestCase):
+
+    def test_call(self):
+        health = ProxyHealth(ttl=100)
+        device = FailingDevice()
+        self.assertEqual(health.call(device, device.read), "value")
+        self.assertEqual(health.call(device, device.read), "value")
+        self.assertEqual(device.pings, 1)
+        self.assertEqual(health.counters(), {"pings": 1, "avoided": 1})
+
+    def test_failure(self):
+        health = ProxyHealth(ttl=100)
+        device = FailingDevice()
+        health.call(device, device.read)
+        with self.assertRaises(tango.DevFailed):
+            health.call(device, device.write, "value")
+        self.assertEqual(device.writes, 1)
+        self.assertEqual(device.pings, 2)
+        self.assertFalse(health.stale())
+
+
+if __name__ == '__main__':
+    unittest.main()
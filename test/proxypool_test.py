@@ -0,0 +1,63 @@
+#!/usr/bin/env python
+#   This file is part of nexdatas - Tango Server for NeXus data writer
+#
+#    Copyright (C) 2012-2018 DESY, Jan Kotanski <jkotan@mail.desy.de>
+#
+#    nexdatas is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    nexdatas is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    You should have received a copy of the GNU General Public License
+#    along with nexdatas.  If not, see <http://www.gnu.org/licenses/>.
+# \package test nexdatas
+# \file proxypool_test.py
+# unittests for ProxyPool
+#
+import unittest
+import threading
+import time
+
+try:
+    from unittest import mock
+except ImportError:
+    import mock
+
+from nxsselector import ProxyPool
+
+
+# test fixture
+class ProxyPoolTest(unittest.TestCase):
+
+    def test_get(self):
+        with mock.patch.object(ProxyPool.tango, "DeviceProxy",
+                               side_effect=lambda name: object()):
+            pool = ProxyPool.ProxyPool(idle=0.2)
+            dp = pool.get("tango://HasyLab:10000/test/door/01")
+            self.assertTrue(
+                pool.get("haSylab:10000/test/door/01") is dp)
+            self.assertTrue(pool.get("test/door/02") is not dp)
+            self.assertTrue(pool.get("haSylab:10000/test/door/01", "synch")
+                            is not dp)
+            proxies = []
+            thread = threading.Thread(
+                target=lambda: proxies.append(
+                    pool.get("hasylab:10000/test/door/01")))
+            thread.start()
+            thread.join()
+            self.assertTrue(proxies[0] is dp)
+            self.assertEqual(pool.counters(),
+                             {"hits": 2, "misses": 3, "evictions": 0,
+                              "size": 3})
+            time.sleep(0.3)
+            self.assertTrue(pool.get("hasylab:10000/test/door/01") is not dp)
+            self.assertEqual(pool.counters()["evictions"], 3)
+
+
+if __name__ == '__main__':
+    unittest.main()
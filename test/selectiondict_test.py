@@ -0,0 +1,65 @@
+#!/usr/bin/env python
+#   This file is part of nexdatas - Tango Server for NeXus data writer
+#
+#    Copyright (C) 2012-2018 DESY, Jan Kotanski <jkotan@mail.desy.de>
+#
+#    nexdatas is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    nexdatas is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    You should have received a copy of the GNU General Public License
+#    along with nexdatas.  If not, see <http://www.gnu.org/licenses/>.
+# \package test nexdatas
+# \file selectiondict_test.py
+# unittests for SelectionDict
+#
+import unittest
+import json
+
+from nxsselector.SelectionDict import SelectionDict
+
+
+# test fixture
+class SelectionDictTest(unittest.TestCase):
+
+    def test_selection(self):
+        changes = []
+        sel = SelectionDict({"a": True, "b": False, "c": None})
+        sel.listeners.append(lambda *args: changes.append(args))
+        self.assertEqual(sel.selected(), frozenset(["a"]))
+        self.assertEqual(sel.selectedList(), ["a"])
+        self.assertEqual(sel.version, 0)
+
+        sel["a"] = True
+        self.assertEqual(sel.version, 0)
+        self.assertEqual(changes, [])
+
+        sel["b"] = True
+        self.assertEqual(sel.version, 1)
+        self.assertEqual(changes, [("b", False, True)])
+        self.assertEqual(sel.selected(), frozenset(["a", "b"]))
+
+        del sel["a"]
+        self.assertEqual(sel.selected(), frozenset(["b"]))
+        self.assertEqual(sel.pop("b"), True)
+        self.assertEqual(sel.pop("b", None), None)
+        self.assertEqual(sel.selected(), frozenset())
+
+        sel.update({"d": True, "e": True})
+        self.assertEqual(changes[-1], (None, None, None))
+        self.assertEqual(sel.selectedList(), ["d", "e"])
+        self.assertEqual(json.loads(json.dumps(sel)),
+                         {"c": None, "d": True, "e": True})
+        sel.clear()
+        self.assertEqual(sel.selected(), frozenset())
+        self.assertEqual(sel.version, 5)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,142 @@
+#!/usr/bin/env python
+#   This file is part of nexdatas - Tango Server for NeXus data writer
+#
+#    Copyright (C) 2012-2018 DESY, Jan Kotanski <jkotan@mail.desy.de>
+#
+#    nexdatas is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    nexdatas is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    You should have received a copy of the GNU General Public License
+#    along with nexdatas.  If not, see <http://www.gnu.org/licenses/>.
+# \package test nexdatas
+# \file serverdiscovery_test.py
+# unittests for ServerDiscovery
+#
+import unittest
+import os
+import shutil
+import tempfile
+import threading
+import time
+
+from nxsselector import ServerDiscovery
+
+
+class FakeValue(object):
+
+    def __init__(self, values):
+        self.value_string = list(values)
+
+
+class FakeDatabase(object):
+
+    def __init__(self, exported, devices):
+        self.exported = exported
+        self.devices = devices
+        self.calls = 0
+
+    def get_device_exported_for_class(self, classname):
+        self.calls += 1
+        return FakeValue(self.exported)
+
+    def get_device_class_list(self, server):
+        self.calls += 1
+        return FakeValue(["dserver/%s" % server, "DServer",
+                          self.devices[server], "NXSRecSelector"])
+
+
+# test fixture
+class ServerDiscoveryTest(unittest.TestCase):
+
+    def setUp(self):
+        self.procdir = tempfile.mkdtemp()
+        self.addProcess(12, ["/usr/bin/python", "/usr/bin/NXSConfigServer",
+                             "cfg"])
+        self.addProcess(27, ["python3", "/usr/bin/NXSRecSelector", "r2", ""])
+        self.addProcess(31, ["NXSRecSelector", "r3"])
+        os.mkdir(os.path.join(self.procdir, "self"))
+
+    def tearDown(self):
+        shutil.rmtree(self.procdir)
+
+    def addProcess(self, pid, command):
+        path = os.path.join(self.procdir, str(pid))
+        os.mkdir(path)
+        with open(os.path.join(path, "cmdline"), "wb") as fl:
+            fl.write("\0".join(command).encode("utf8"))
+
+    def test_instances(self):
+        discovery = ServerDiscovery.ServerDiscovery(procdir=self.procdir)
+        self.assertEqual(discovery.instances(), ["r2", "r3"])
+        self.assertEqual(discovery.instances("NXSConfigServer"), ["cfg"])
+        self.addProcess(5, ["NXSRecSelector", "r1"])
+        self.assertEqual(discovery.instances(), ["r2", "r3"])
+        discovery.clear()
+        self.assertEqual(discovery.instances(), ["r1", "r2", "r3"])
+
+    def test_find(self):
+        db = FakeDatabase(
+            ["p/sel/1", "p/sel/2"],
+            {"NXSRecSelector/r2": "p/sel/2", "NXSRecSelector/r3": "p/sel/3"})
+        discovery = ServerDiscovery.ServerDiscovery(
+            ttl=0.2, procdir=self.procdir)
+        self.assertEqual(discovery.find(db), (True, "p/sel/2"))
+        self.assertEqual(db.calls, 2)
+        self.assertEqual(discovery.find(db), (True, "p/sel/2"))
+        self.assertEqual(db.calls, 2)
+        time.sleep(0.3)
+        db.exported = ["p/sel/1", "p/sel/3"]
+        self.assertEqual(discovery.find(db), (False, None))
+        self.assertEqual(db.calls, 4)
+
+        discovery.clear()
+        exported = db.exported
+        db.exported = None
+        self.assertRaises(TypeError, discovery.find, db)
+        self.assertRaises(TypeError, discovery.find, db)
+        self.assertEqual(db.calls, 5)
+        db.exported = exported
+
+        discovery.clear()
+        db.exported = ["p/sel/1"]
+        self.assertEqual(discovery.find(db), (True, "p/sel/1"))
+        discovery.clear()
+        db.exported = []
+        self.assertEqual(discovery.find(db), (True, None))
+
+    def test_findAsync(self):
+        discovery = ServerDiscovery.ServerDiscovery(procdir=self.procdir)
+        results = []
+        event = threading.Event()
+
+        def callback(result):
+            results.append(result)
+            event.set()
+
+        db = FakeDatabase(["p/sel/1"], {})
+        discovery.find = lambda classname: discovery.__class__.find(
+            discovery, db, classname)
+        thread = discovery.findAsync(callback)
+        self.assertTrue(event.wait(5))
+        thread.join()
+        self.assertEqual(results, [(True, "p/sel/1")])
+
+        def fail(classname):
+            raise Exception("no database")
+
+        results.pop()
+        event.clear()
+        discovery.find = fail
+        discovery.findAsync(callback).join()
+        self.assertTrue(isinstance(results[0], Exception))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,127 @@
+#!/usr/bin/env python
+#   This file is part of nexdatas - Tango Server for NeXus data writer
+#
+#    Copyright (C) 2012-2018 DESY, Jan Kotanski <jkotan@mail.desy.de>
+#
+#    nexdatas is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    nexdatas is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    You should have received a copy of the GNU General Public License
+#    along with nexdatas.  If not, see <http://www.gnu.org/licenses/>.
+# \package test nexdatas
+# \file snapshot_test.py
+# unittests for on-disk settings snapshots
+#
+import unittest
+import json
+import shutil
+import tempfile
+
+try:
+    from unittest import mock
+except ImportError:
+    import mock
+
+from nxsselector import ServerState
+from nxsselector.ProxyPool import pool
+from nxsselector.SnapshotCache import SnapshotCache
+
+from FakeSelector import FakeSelector
+
+
+# test fixture
+class SnapshotTest(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.device = FakeSelector(channels=50, latency=0)
+        self.patches = [
+            mock.patch.object(ServerState.tango, "Database"),
+            mock.patch.object(ServerState.tango, "DeviceProxy",
+                              return_value=self.device),
+        ]
+        for patch in self.patches:
+            patch.start()
+        pool.clear()
+
+    def tearDown(self):
+        for patch in self.patches:
+            patch.stop()
+        shutil.rmtree(self.directory)
+
+    def state(self):
+        state = ServerState.ServerState(self.device.name())
+        state.snapshots = SnapshotCache(self.directory)
+        return state
+
+    def test_snapshot(self):
+        state = self.state()
+        self.assertFalse(state.loadSnapshot())
+        state.fetchSettings()
+
+        state2 = self.state()
+        calls = self.device.calls
+        self.assertTrue(state2.loadSnapshot())
+        self.assertTrue(self.device.calls - calls < 5)
+        for attr in ["avcplist", "avdslist", "description", "atlist",
+                     "dsdescription", "door", "scanID", "timers"]:
+            self.assertEqual(getattr(state2, attr), getattr(state, attr))
+        self.assertEqual(state2.ddsdict, state.ddsdict)
+
+        state2.revalidateSnapshot()
+        self.assertFalse(state2.applySnapshot())
+
+        self.device.scanID += 1
+        state2.revalidateSnapshot()
+        self.assertFalse(state2.applySnapshot())
+        self.assertEqual(state2.scanID, self.device.scanID)
+
+        self.device.scanID += 1
+        state3 = self.state()
+        self.assertTrue(state3.loadSnapshot())
+        self.assertEqual(state3.scanID, self.device.scanID)
+
+        self.device.components.append("cpnew")
+        state2.revalidateSnapshot()
+        self.assertTrue(state2.applySnapshot())
+        self.assertTrue("cpnew" in state2.avcplist)
+
+        self.device.generate(20)
+        self.assertFalse(self.state().loadSnapshot())
+
+    def test_profile(self):
+        state = self.state()
+        state.fetchSettings()
+        self.assertEqual(state.acpgroup, {})
+
+        state2 = self.state()
+        self.assertTrue(state2.loadSnapshot())
+        self.assertTrue(state2.snapshotloaded)
+        conf = json.loads(self.device.profileConfiguration)
+        conf["ComponentPreselection"] = json.dumps({"cp0001": True})
+        self.device.profileConfiguration = json.dumps(conf)
+        state2.revalidateSnapshot()
+        self.assertTrue(state2.applySnapshot())
+        self.assertEqual(state2.acpgroup, {"cp0001": True})
+
+        state2.revalidateSnapshot()
+        self.assertFalse(state2.applySnapshot())
+
+    def test_loadSettings(self):
+        state = self.state()
+        self.assertFalse(state.loadSettings())
+        self.assertFalse(state.snapshotloaded)
+        state2 = self.state()
+        self.assertTrue(state2.loadSettings())
+        self.assertTrue(state2.snapshotloaded)
+
+
+if __name__ == '__main__':
+    unittest.main()
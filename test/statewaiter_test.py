@@ -0,0 +1,92 @@
+#!/usr/bin/env python
+#   This file is part of nexdatas - Tango Server for NeXus data writer
+#
+#    Copyright (C) 2012-2018 DESY, Jan Kotanski <jkotan@mail.desy.de>
+#
+#    nexdatas is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    nexdatas is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    You should have received a copy of the GNU General Public License
+#    along with nexdatas.  If not, see <http://www.gnu.org/licenses/>.
+# \package test nexdatas
+# \file statewaiter_test.py
+# unittests for StateWaiter
+#
+import unittest
+import time
+
+from nxsselector.ServerState import StateWaiter, tango
+
+
+class RunningDevice(object):
+    """ device in RUNNING state for the given time
+    """
+
+    def __init__(self, running):
+        self.end = time.time() + running
+        self.queries = 0
+
+    def state(self):
+        self.queries += 1
+        if time.time() < self.end:
+            return tango.DevState.RUNNING
+        return tango.DevState.ON
+
+
+class EventDevice(RunningDevice):
+    """ device in RUNNING state counting event subscriptions
+    """
+
+    def __init__(self, running):
+        RunningDevice.__init__(self, running)
+        self.subscriptions = 0
+        self.unsubscriptions = 0
+
+    def subscribe_event(self, attr, event, callback):
+        self.subscriptions += 1
+        return self.subscriptions
+
+    def unsubscribe_event(self, eid):
+        self.unsubscriptions += 1
+
+
+# test fixture
+class StateWaiterTest(unittest.TestCase):
+
+    def test_wait(self):
+        waiter = StateWaiter(timeout=2.0)
+        device = RunningDevice(0.5)
+        duration = waiter.wait(device)
+        self.assertTrue(0.5 <= duration < 1.5)
+        self.assertTrue(device.queries < 10)
+        self.assertEqual(waiter.waits[-1][1], device.queries)
+
+        device = RunningDevice(10)
+        duration = waiter.wait(device, timeout=0.3)
+        self.assertTrue(0.3 <= duration < 0.6)
+
+        duration = waiter.wait(RunningDevice(0))
+        self.assertTrue(duration < 0.1)
+
+    def test_subscribe(self):
+        waiter = StateWaiter(timeout=2.0)
+        device = EventDevice(0)
+        waiter.wait(device)
+        self.assertEqual(device.queries, 1)
+        self.assertEqual(device.subscriptions, 0)
+
+        device = EventDevice(0.3)
+        waiter.wait(device)
+        self.assertEqual(device.subscriptions, 1)
+        self.assertEqual(device.unsubscriptions, 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
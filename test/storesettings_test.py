@@ -0,0 +1,88 @@
+#!/usr/bin/env python
+#   This file is part of nexdatas - Tango Server for NeXus data writer
+#
+#    Copyright (C) 2012-2018 DESY, Jan Kotanski <jkotan@mail.desy.de>
+#
+#    nexdatas is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    nexdatas is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    You should have received a copy of the GNU General Public License
+#    along with nexdatas.  If not, see <http://www.gnu.org/licenses/>.
+# \package test nexdatas
+# \file storesettings_test.py
+# unittests for skipped uploads of unchanged profile configurations
+#
+import unittest
+import json
+
+try:
+    from unittest import mock
+except ImportError:
+    import mock
+
+from nxsselector import ServerState
+from nxsselector.CallStats import stats
+from nxsselector.ProxyPool import pool
+
+from FakeSelector import FakeSelector
+
+
+# test fixture
+class StoreSettingsTest(unittest.TestCase):
+
+    def setUp(self):
+        self.device = FakeSelector(channels=20, latency=0)
+        self.patches = [
+            mock.patch.object(ServerState.tango, "Database"),
+            mock.patch.object(ServerState.tango, "DeviceProxy",
+                              return_value=self.device),
+        ]
+        for patch in self.patches:
+            patch.start()
+        pool.clear()
+        stats.clear()
+
+    def tearDown(self):
+        for patch in self.patches:
+            patch.stop()
+        stats.clear()
+
+    def writes(self):
+        return stats.summary().get(
+            "write:profileConfiguration", {}).get("count", 0)
+
+    def test_storeSettings(self):
+        state = ServerState.ServerState(self.device.name())
+        state.snapshots = None
+        state.fetchSettings()
+        state.storeSettings()
+        writes = self.writes()
+        state.storeSettings()
+        self.assertEqual(self.writes(), writes)
+
+        state.dsgroup[self.device.channels[0]] = True
+        state.storeSettings()
+        self.assertEqual(self.writes(), writes + 1)
+        conf = json.loads(self.device.profileConfiguration)
+        self.assertTrue(
+            json.loads(conf["DataSourceSelection"])[self.device.channels[0]])
+
+        # profile changed by another client
+        conf["DataSourceSelection"] = json.dumps({})
+        self.device.profileConfiguration = json.dumps(conf)
+        state.storeSettings()
+        self.assertEqual(self.writes(), writes + 2)
+        conf = json.loads(self.device.profileConfiguration)
+        self.assertTrue(
+            json.loads(conf["DataSourceSelection"])[self.device.channels[0]])
+
+
+if __name__ == '__main__':
+    unittest.main()
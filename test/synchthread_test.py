@@ -0,0 +1,227 @@
+#!/usr/bin/env python
+#   This file is part of nexdatas - Tango Server for NeXus data writer
+#
+#    Copyright (C) 2012-2018 DESY, Jan Kotanski <jkotan@mail.desy.de>
+#
+#    nexdatas is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    nexdatas is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    You should have received a copy of the GNU General Public License
+#    along with nexdatas.  If not, see <http://www.gnu.org/licenses/>.
+# \package test nexdatas
+# \file synchthread_test.py
+# unittests for change detection of the server synchronization thread
+#
+import unittest
+import threading
+import time
+import json
+
+try:
+    from unittest import mock
+except ImportError:
+    import mock
+
+from nxsselector import ServerState
+from nxsselector.ProxyPool import pool
+
+from FakeSelector import FakeSelector
+
+
+class EventSelector(FakeSelector):
+    """ fake selector with change events and counted mntgrp reads
+    """
+
+    def __init__(self, events=True):
+        FakeSelector.__init__(self, channels=10, latency=0)
+        self.events = events
+        self.callbacks = {}
+        self.unsubscribed = []
+        self.mgreads = 0
+
+    def subscribe_event(self, attr, event, callback):
+        if not self.events:
+            raise Exception("events not supported")
+        eid = len(self.callbacks) + 1
+        self.callbacks[attr] = (eid, callback)
+        return eid
+
+    def unsubscribe_event(self, eid):
+        self.unsubscribed.append(eid)
+
+    def mntGrpConfiguration(self):
+        self.mgreads += 1
+        return FakeSelector.mntGrpConfiguration(self)
+
+    def push(self, attr, value):
+        setattr(self, attr, value)
+        event = mock.Mock(err=False, attr_name="%s/%s" % (self.name(), attr))
+        event.attr_value.value = value
+        self.callbacks[attr][1](event)
+
+
+# test fixture
+class SynchThreadTest(unittest.TestCase):
+
+    def setUp(self):
+        self.device = self.createDevice()
+        conf = json.loads(self.device.profileConfiguration)
+        conf["PreselectingDataSources"] = json.dumps(["ds1", "ds2"])
+        self.device.profileConfiguration = json.dumps(conf)
+        self.patches = [
+            mock.patch.object(ServerState.tango, "Database"),
+            mock.patch.object(ServerState.tango, "DeviceProxy",
+                              return_value=self.device),
+        ]
+        for patch in self.patches:
+            patch.start()
+        pool.clear()
+        self.emitted = []
+        self.runner = None
+
+    def tearDown(self):
+        if self.runner:
+            self.stop()
+        for patch in self.patches:
+            patch.stop()
+
+    def createDevice(self):
+        return FakeSelector(channels=10, latency=0)
+
+    def start(self, interval=0.01, maxinterval=0.02):
+        state = ServerState.ServerState(self.device.name())
+        self.thread = state.synchthread
+        self.thread.mininterval = 0.01
+        self.thread.interval = interval
+        self.thread.maxinterval = maxinterval
+        self.thread.scanidchanged.connect(
+            lambda: self.emitted.append("scanid"))
+        self.thread.mgconfchanged.connect(
+            lambda: self.emitted.append("mgconf"))
+        self.runner = threading.Thread(target=self.thread.run)
+        self.runner.start()
+
+    def stop(self):
+        self.thread.running = False
+        self.runner.join(5)
+        self.assertFalse(self.runner.is_alive())
+        self.runner = None
+
+    def waitFor(self, name, count=1, timeout=5):
+        deadline = time.time() + timeout
+        while self.emitted.count(name) < count and time.time() < deadline:
+            time.sleep(0.005)
+        self.assertEqual(self.emitted.count(name), count)
+
+    def setProfile(self, **sections):
+        conf = json.loads(self.device.profileConfiguration)
+        conf.update(sections)
+        self.device.profileConfiguration = json.dumps(conf)
+
+    def synchronize(self):
+        """ waits for a full synchronization cycle
+        """
+        for _ in range(2):
+            self.device.scanID += 1
+            self.waitFor("scanid", self.emitted.count("scanid") + 1)
+
+    def test_profile(self):
+        self.start()
+        self.synchronize()
+        self.assertEqual(self.emitted.count("mgconf"), 0)
+
+        self.setProfile(
+            PreselectingDataSources=json.dumps(["ds2", "ds1"]),
+            DataSourceSelection=json.dumps(dict(reversed(list(
+                json.loads(json.loads(self.device.profileConfiguration)[
+                    "DataSourceSelection"]).items())))))
+        self.synchronize()
+        self.assertEqual(self.emitted.count("mgconf"), 0)
+
+        self.setProfile(PreselectingDataSources=json.dumps(["ds1"]))
+        self.waitFor("mgconf")
+
+    def test_mntGrp(self):
+        self.start()
+        self.device.mgconf = json.dumps({"timer": "t1", "controllers": {}})
+        self.waitFor("mgconf")
+        self.device.mgconf = json.dumps({"controllers": {}, "timer": "t1"})
+        self.synchronize()
+        self.assertEqual(self.emitted.count("mgconf"), 1)
+
+    def test_nextInterval(self):
+        self.start()
+        self.thread.mininterval = 1.
+        self.thread.maxinterval = 20.
+        self.assertEqual(self.thread.nextInterval(5., True), 1.)
+        self.assertEqual(self.thread.nextInterval(1., False), 2.)
+        self.assertEqual(self.thread.nextInterval(16., False), 20.)
+        self.assertEqual(self.thread.nextInterval(20., False), 20.)
+        self.assertEqual(self.thread.nextInterval(0., False), 2.)
+
+
+class EventSynchThreadTest(SynchThreadTest):
+
+    def createDevice(self):
+        return EventSelector()
+
+    def setProfile(self, **sections):
+        conf = json.loads(self.device.profileConfiguration)
+        conf.update(sections)
+        self.device.push("profileConfiguration", json.dumps(conf))
+
+    def synchronize(self):
+        """ waits for a full synchronization cycle
+        """
+        for _ in range(2):
+            self.device.push("scanID", self.device.scanID + 1)
+            self.waitFor("scanid", self.emitted.count("scanid") + 1)
+
+    def test_events(self):
+        # only timeouts or profile events poll the mntgrp configuration
+        self.start(10., 10.)
+        deadline = time.time() + 5
+        while len(self.device.callbacks) < 2 and time.time() < deadline:
+            time.sleep(0.005)
+        self.assertEqual(sorted(self.device.callbacks.keys()),
+                         ["profileConfiguration", "scanID"])
+        mgreads = self.device.mgreads
+
+        self.device.push("scanID", self.device.scanID + 1)
+        self.waitFor("scanid")
+        self.assertEqual(self.device.mgreads, mgreads)
+
+        conf = json.loads(self.device.profileConfiguration)
+        conf["PreselectingDataSources"] = json.dumps(["ds1"])
+        self.device.push("profileConfiguration", json.dumps(conf))
+        self.waitFor("mgconf")
+        self.assertEqual(self.device.mgreads, mgreads + 1)
+
+        self.stop()
+        self.assertEqual(sorted(self.device.unsubscribed), [1, 2])
+
+
+class PollingSynchThreadTest(SynchThreadTest):
+
+    def createDevice(self):
+        return EventSelector(False)
+
+    def test_polling(self):
+        self.start()
+        self.device.scanID += 1
+        self.waitFor("scanid")
+        self.assertEqual(self.device.callbacks, {})
+        mgreads = self.device.mgreads
+        self.synchronize()
+        self.assertTrue(self.device.mgreads > mgreads)
+
+
+if __name__ == '__main__':
+    unittest.main()